@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+
+"""Parser engines: parse time of synthetic Netlists by engine
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_engines.py [PINS ...]
+
+Prints a table with the best of 3 runs of AllegroNetList() per engine
+(parsing, sorting and index building) and the engine 'auto' selects.
+"""
+
+from __future__ import annotations
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from cadence_netlist_format.allegronetlist import AllegroNetList
+from cadence_netlist_format.netlistengines import ENGINES, available_cpus, select_engine
+
+sys.path.insert(0, str(Path(__file__).parent))
+from synthetic_netlist import generate_netlist  # noqa: E402
+
+
+def best_time(func, repeat=3):
+    """Returns best wall time of func() in seconds"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10_000, 100_000, 1_000_000]
+    print(f'CPUs: {available_cpus()}')
+    print(f"{'pins':>10} {'MB':>7} " + ' '.join(f'{engine:>9}' for engine in ENGINES) + '  auto')
+    with tempfile.TemporaryDirectory() as tmp:
+        for pins in sizes:
+            fname = generate_netlist(Path(tmp) / f'synthetic_{pins}.dat', pins)
+            size = os.path.getsize(fname)
+            times = [best_time(lambda: AllegroNetList(fname, engine=engine)) for engine in ENGINES]
+            print(f'{pins:>10} {size / 2**20:>7.1f} ' + ' '.join(f'{t:>8.2f}s' for t in times)
+                  + f'  {select_engine(size)}')
+
+
+if __name__ == '__main__':
+    main()
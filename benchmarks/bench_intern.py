@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+
+"""Memory saved by interning Netlist tokens during parsing
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_intern.py [PINS]
+
+Measures memory allocated by parsing (net_list and indexes) with interned
+tokens and with one str object per token, as stored without interning.
+"""
+
+from __future__ import annotations
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from cadence_netlist_format.allegronetlist import AllegroNetList
+
+sys.path.insert(0, str(Path(__file__).parent))
+from synthetic_netlist import generate_netlist  # noqa: E402
+
+
+def fresh(s):
+    """Returns new str object equal to s (as str.split()/translate() return)"""
+    return (s + '.')[:-1]
+
+
+def parse_memory(fname, interning):
+    """Returns (Netlist, bytes allocated by parsing: net_list and indexes)"""
+    intern = sys.intern
+    tracemalloc.start()
+    try:
+        if not interning:
+            sys.intern = lambda s: s  # parser looks up sys.intern on each parse
+        netlist = AllegroNetList(fname)
+        if not interning:
+            # Separate pin name str, as parsed without sharing it with the pin number
+            for net in netlist.net_list:
+                for node in net.nodes:
+                    if node.pin_name is node.pin:
+                        node.pin_name = fresh(node.pin)
+        return netlist, tracemalloc.get_traced_memory()[0]
+    finally:
+        sys.intern = intern
+        tracemalloc.stop()
+
+
+def main():
+    pins = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    with tempfile.TemporaryDirectory() as tmp:
+        fname = generate_netlist(Path(tmp) / 'synthetic.dat', pins)
+        start = time.perf_counter()
+        netlist = AllegroNetList(fname)
+        parse_time = time.perf_counter() - start
+        del netlist
+        _, plain = parse_memory(fname, interning=False)
+        netlist, interned = parse_memory(fname, interning=True)
+
+    nodes = sum(len(net.nodes) for net in netlist.net_list)
+    print(f'{len(netlist.net_list)} nets, {nodes} nodes, parse: {parse_time:.2f} s')
+    print(f'one str per token: {plain / 1e6:8.1f} MB')
+    print(f'interned tokens:   {interned / 1e6:8.1f} MB')
+    print(f'saved:             {(plain - interned) / 1e6:8.1f} MB ({(plain - interned) / nodes:.0f} bytes/pin)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+
+"""Compare Net/Node records with the nested lists they replace
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_records.py [PINS]
+
+Reports container memory (strings are shared, so only net/node objects
+are measured) and the time of a full pass over all nodes.
+"""
+
+from __future__ import annotations
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from cadence_netlist_format.allegronetlist import AllegroNetList
+from cadence_netlist_format.netrecords import Net, Node
+
+sys.path.insert(0, str(Path(__file__).parent))
+from synthetic_netlist import generate_netlist  # noqa: E402
+
+
+def allocated(build):
+    """Returns (result, bytes allocated by build())"""
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def best_time(func, repeat=5):
+    """Returns best wall time of func() in seconds"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    pins = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    with tempfile.TemporaryDirectory() as tmp:
+        fname = generate_netlist(Path(tmp) / 'synthetic.dat', pins)
+        start = time.perf_counter()
+        netlist = AllegroNetList(fname)
+        parse_time = time.perf_counter() - start
+    nets = netlist.net_list
+    nodes = sum(len(net.nodes) for net in nets)
+
+    records, records_size = allocated(
+        lambda: [Net(net.name, [Node(n.refdes, n.pin, n.pin_name) for n in net.nodes]) for net in nets])
+    lists, lists_size = allocated(lambda: [net.to_list() for net in nets])
+
+    def index_records():
+        return {(node.refdes, node.pin): net.name for net in records for node in net.nodes}
+
+    def index_lists():
+        return {(node[0], node[1]): net[0] for net in lists for node in net[1]}
+
+    print(f'{len(nets)} nets, {nodes} nodes, parse: {parse_time:.2f} s')
+    print(f"{'':16}{'memory, MB':>12}{'bytes/node':>12}{'index pass, s':>15}")
+    for name, size, func in (('nested lists', lists_size, index_lists),
+                             ('Net/Node', records_size, index_records)):
+        print(f'{name:16}{size / 1e6:12.1f}{size / nodes:12.1f}{best_time(func):15.3f}')
+
+
+if __name__ == '__main__':
+    main()
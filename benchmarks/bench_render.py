@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+
+"""Report rendering: fused single pass vs per-net method calls
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_render.py [PINS]
+
+The two-pass rendering (net2string() per net for the main section and
+again for the warnings) is rebuilt here from public methods for reference.
+"""
+
+from __future__ import annotations
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from cadence_netlist_format.allegronetlist import AllegroNetList
+
+sys.path.insert(0, str(Path(__file__).parent))
+from synthetic_netlist import generate_netlist  # noqa: E402
+
+
+def two_pass(netlist):
+    """Main section and warnings rendered by net2string() (two passes)"""
+    lines = [netlist.net2string(i) for i in range(netlist.net_list_length())]
+    warnings = [s for s in (netlist.net2string(i) for i in range(netlist.net_list_length()))
+                if len(s.split()) < 5]
+    return lines, warnings
+
+
+def best_time(func, repeat=3):
+    """Returns best wall time of func() in seconds"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    pins = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    with tempfile.TemporaryDirectory() as tmp:
+        netlist = AllegroNetList(generate_netlist(Path(tmp) / 'synthetic.dat', pins))
+    assert two_pass(netlist) == netlist._render_nets(netlist.net_list)
+    old = best_time(lambda: two_pass(netlist))
+    new = best_time(lambda: netlist._render_nets(netlist.net_list))
+    report = best_time(netlist.all_data2string)
+    print(f'{netlist.net_list_length()} nets')
+    print(f'two passes (net2string): {old:.2f} s')
+    print(f'fused single pass:       {new:.2f} s ({old / new:.1f}x)')
+    print(f'all_data2string():       {report:.2f} s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+
+"""Synthetic Cadence Allegro Netlist generator for benchmarks
+
+Usage:
+    python benchmarks/synthetic_netlist.py OUTPUT.dat [PINS]
+
+The board has BGA/QFP ICs (many pins, named pins) and two-pin passives
+(pin name equal to pin number), nets have 2..8 nodes.
+"""
+
+from __future__ import annotations
+import random
+import sys
+from pathlib import Path
+
+ROWS = 'ABCDEFGHJKLMNPRTUVWY'
+
+
+def generate_netlist(fname: str | Path, pins: int = 100_000, seed: int = 1) -> Path:
+    """Write synthetic Netlist file
+
+    Args:
+        fname: output file name
+        pins: approximate number of pins (nodes)
+        seed: random seed (same seed - same file)
+
+    Returns:
+        Path of written file
+    """
+    rnd = random.Random(seed)
+    ics = max(1, pins // 2000)
+    ic_pins = [0] * ics
+    passive_pins = 0
+    lines = ['FILE_TYPE = EXPANDEDNETLIST;',
+             '{ Using PSTWRITER 16.3.0 p002Mar-22-2016 at 10:54:51 }']
+    node_count = 0
+    net_count = 0
+    while node_count < pins:
+        net_count += 1
+        lines += ['NET_NAME', f"'NET_{rnd.choice(('DATA', 'ADDR', 'CTRL', 'CLK'))}{net_count}'",
+                  " '@B.S1(s1):N%d':" % net_count, " C_SIGNAL='@b.s1(s1):n%d';" % net_count]
+        for _ in range(rnd.randint(2, 8)):
+            if rnd.random() < 0.3:
+                ic = rnd.randrange(ics)
+                n = ic_pins[ic]
+                ic_pins[ic] += 1
+                refdes = f'DD{ic + 1}'
+                pin = f'{ROWS[n % len(ROWS)]}{n // len(ROWS) + 1}'
+                pin_name = f'IO_{n}'
+            else:
+                refdes = f'{"RC"[passive_pins // 2 % 2]}{passive_pins // 2 + 1}'
+                pin = pin_name = str(passive_pins % 2 + 1)
+                passive_pins += 1
+            lines += [f'NODE_NAME\t{refdes} {pin}',
+                      " '@B.S1(s1):INS%d@L.P.N(C)':" % node_count,
+                      f" '{pin_name}':;"]
+            node_count += 1
+    lines.append('END.')
+    path = Path(fname)
+    path.write_text('\n'.join(lines) + '\n')
+    return path
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    out = generate_netlist(sys.argv[1], int(sys.argv[2]) if len(sys.argv) > 2 else 100_000)
+    print(f'Wrote {out} ({out.stat().st_size / 1e6:.1f} MB)')
@@ -4,17 +4,138 @@
 """
 
 from __future__ import annotations
+import asyncio
+import bisect
 import datetime
+import fnmatch
+import gc
 import logging
+import re
+import threading
+import time
+from contextlib import contextmanager
+from functools import partial
+from operator import attrgetter
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Iterable, Iterator, Mapping, MutableMapping, Optional, TYPE_CHECKING, Union
+
+from .netrecords import Net
+from .parsediagnostics import MAX_PARSE_ERRORS, Diagnostics
+from .parseprogress import CancelToken, ParseCancelled, ParseProgress, ProgressCallback
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+    from .netlistarray import NetListArrays
+    from .netlistfingerprint import Fingerprint
+    from .netlistgraph import ConnectivityGraph
+    from .netlistplugins import PluginHooks
+    from .netlistrules import Rule, RuleReport
+    from .netsearch import NetNameIndex
+    from .sharednetlist import SharedNetList
 
 
 # Configure module logger
 logger = logging.getLogger(__name__)
 
-# Translation table for cleaning pin names (performance optimization)
-_PIN_NAME_TRANSLATE_TABLE = str.maketrans('', '', r"\ ';:")
+# Sort key of nets
+_NET_NAME_KEY = attrgetter('name')
+
+# Parallel report rendering: nets per chunk (min), chunks per worker (load balance)
+RENDER_CHUNK_MIN = 5000
+RENDER_CHUNKS_PER_JOB = 4
+
+# Net name / refdes filter: glob, list of globs, set of names, compiled regex or predicate
+NameFilter = Union[str, list, tuple, set, frozenset, re.Pattern, Callable[[str], bool]]
+
+
+def make_name_filter(spec: Optional[NameFilter]) -> Optional[Callable[[str], bool]]:
+    """Returns predicate for net name / refdes filter
+
+    Args:
+        spec: filter specification:
+              str - glob pattern (e.g. 'DDR_*'), case-sensitive;
+              list or tuple of str - any of glob patterns;
+              set or frozenset of str - exact names;
+              compiled regex - re.search() match;
+              callable - used as is;
+              None - no filter
+
+    Returns:
+        Predicate (name -> bool) or None
+
+    Raises:
+        TypeError: If spec type is not supported
+    """
+    if spec is None or callable(spec):
+        return spec
+    if isinstance(spec, re.Pattern):
+        return lambda name: spec.search(name) is not None
+    if isinstance(spec, (set, frozenset)):
+        return frozenset(spec).__contains__
+    if isinstance(spec, str):
+        spec = [spec]
+    if isinstance(spec, (list, tuple)):
+        regex = re.compile('|'.join(f'(?:{fnmatch.translate(pattern)})' for pattern in spec))
+        return lambda name: regex.match(name) is not None
+    raise TypeError(f'Unsupported name filter type: {type(spec).__name__}')
+
+
+# Nets of the report being rendered in a worker process (set by _init_render_worker)
+_render_worker_nets: list[Net] = []
+
+
+def _init_render_worker(nets: list[Net]) -> None:
+    """Worker process initializer: keep nets (inherited, not pickled, with fork start method)"""
+    global _render_worker_nets
+    _render_worker_nets = nets
+
+
+def _render_chunk(bounds: tuple[int, int]) -> tuple[str, list[str]]:
+    """Render nets[start:end] in worker process: (net lines text, warning lines)"""
+    start, end = bounds
+    lines, warnings = AllegroNetList._render_nets(_render_worker_nets[start:end])
+    return '\n'.join(lines) + '\n', warnings
+
+
+def _prefix_matches(keys: list[str], prefix: str) -> list[str]:
+    """Returns items of sorted list starting with prefix (binary search, O(log N + results))"""
+    start = bisect.bisect_left(keys, prefix)
+    end = start
+    while end < len(keys) and keys[end].startswith(prefix):
+        end += 1
+    return keys[start:end]
+
+
+# Threads in gc_paused() blocks, GC state before the first of them
+_gc_lock = threading.Lock()
+_gc_pauses = 0
+_gc_was_enabled = False
+
+
+@contextmanager
+def gc_paused() -> Iterator[None]:
+    """Disable cyclic garbage collection while in block
+
+    Parsing, indexing and writing create millions of objects without reference
+    cycles: cyclic garbage collections triggered by the allocations only cost
+    time (about 20% of parse time). GC is disabled for the whole process while
+    any thread is in a block (blocks may nest and overlap in threads); cycles
+    created meanwhile are collected after the last block ends. GC state at the
+    start of the first block is restored.
+    """
+    global _gc_pauses, _gc_was_enabled
+    with _gc_lock:
+        if _gc_pauses == 0:
+            _gc_was_enabled = gc.isenabled()
+            gc.disable()
+        _gc_pauses += 1
+    try:
+        yield
+    finally:
+        with _gc_lock:
+            _gc_pauses -= 1
+            if _gc_pauses == 0 and _gc_was_enabled:
+                gc.enable()
 
 
 class AllegroNetList:
@@ -24,8 +145,9 @@ class AllegroNetList:
         date: Date of create Netlist
         time: Time of create Netlist
         version: Version of Cadence Allegro Netlist
-        net_list: Netlist data [['net_name1', [['D1', '1'], ['C1', '1']]],
-                                  ['net_name2', [['D2', '2'], ['R2', '2']]]]
+        net_list: Netlist data [Net('net_name1', [Node('D1', '1', 'A'), Node('C1', '1', '1')]),
+                                Net('net_name2', [Node('D2', '2', 'B'), Node('R2', '2', '2')])]
+                  (Net/Node also index as lists: net[0], net[1], node[0], node[1], node[2])
         fname: Netlist file name
         refdes_list: List of pins and nets belong refdes
                      [['REFDES0',['net1', 'pin1'], ['net1', 'pin2'], ..., ['netN', 'pinN']],
@@ -33,44 +155,132 @@ class AllegroNetList:
                       ['REFDESN',['net1', 'pin1'], ['net1', 'pin2'], ..., ['netN', 'pinN']]]
         refdes_dict: Performance index for O(1) refdes lookup
         pin_name_index: Performance index for O(1) (refdes, pin) -> pin_name lookup
+
+    Cyclic garbage collection is disabled for the whole process while a file
+    is parsed (see gc_paused), also when parsing in a thread.
     """
 
-    def __init__(self, fname: str | Path) -> None:
+    def __init__(self, fname: str | Path,
+                 net_filter: Optional[NameFilter] = None,
+                 refdes_filter: Optional[NameFilter] = None,
+                 memory_budget: Optional[int] = None,
+                 progress: Optional[ProgressCallback] = None,
+                 cancel_token: Optional[CancelToken] = None,
+                 engine: str = 'auto',
+                 max_errors: Optional[int] = MAX_PARSE_ERRORS,
+                 plugins: Iterable[Any] = ()) -> None:
         """Get data from Netlist (read from file)
 
+        Args:
+            fname: Path to the Netlist file
+            net_filter: read only nets with matching names (see make_name_filter)
+            refdes_filter: read only nodes with matching refdes (see make_name_filter);
+                           nets without matching nodes are skipped
+            memory_budget: max memory (bytes) of (refdes, pin) indexes; larger indexes
+                           are kept on disk (see diskindex module), None - no limit
+            progress: callback called with ParseProgress every PROGRESS_INTERVAL nets
+                      and when parsing is complete (see parseprogress module)
+            cancel_token: parsing raises ParseCancelled when token is cancelled
+            engine: parser engine name (see netlistengines module), 'auto' - selected
+                    by file size and number of CPUs
+            max_errors: malformed lines tolerated (skipped, see diagnostics) before
+                        parsing fails, None - no limit
+            plugins: plugins with hooks called while parsing (see netlistplugins module)
+
+        Raises:
+            ParseErrorLimit: If more than max_errors lines cannot be parsed
+            ParseCancelled: If parsing was cancelled by cancel_token
+        """
+        self._init_data(fname)
+        self.net_filter = make_name_filter(net_filter)
+        self.refdes_filter = make_name_filter(refdes_filter)
+        self.memory_budget = memory_budget
+        self.progress = progress
+        self.cancel_token = cancel_token
+        self.engine = engine
+        self.max_errors = max_errors
+        self.plugins = list(plugins)
+        self.read_file(fname)
+
+    def _init_data(self, fname: str | Path) -> None:
+        """Initialize empty Netlist data (instance attributes, not class attributes)
+
         Args:
             fname: Path to the Netlist file
         """
-        # Initialize instance attributes (not class attributes)
-        self.net_list: list = []
+        self.net_list: list[Net] = []
         self.date: int | str = 0
         self.time: int | str = 0
         self.version: int | str = 0
         self.refdes_list: list = []
         self.refdes_dict: dict[str, int] = {}  # Performance: O(1) lookup for refdes
-        self.pin_name_index: dict[tuple[str, str], str] = {}  # Performance: O(1) lookup for (refdes, pin) -> pin_name
-        self.net_name_index: dict[tuple[str, str], str] = {}  # Performance: O(1) lookup for (refdes, pin) -> net_name
+        self.pin_name_index: MutableMapping[tuple[str, str], str] = {}  # Performance: O(1) lookup for (refdes, pin) -> pin_name
+        self.net_name_index: MutableMapping[tuple[str, str], str] = {}  # Performance: O(1) lookup for (refdes, pin) -> net_name
+        self.memory_budget: Optional[int] = None
+        self.progress: Optional[ProgressCallback] = None
+        self.cancel_token: Optional[CancelToken] = None
+        self.engine: str = 'auto'  # Parser engine (resolved name after parsing)
+        self.max_errors: Optional[int] = MAX_PARSE_ERRORS
+        self.diagnostics = Diagnostics()  # Malformed lines found by parser
+        self.plugins: list[Any] = []  # Plugins called by parser (see netlistplugins module)
+        self._plugin_hooks: Optional[PluginHooks] = None  # Hooks of plugins while parsing
+        self._fingerprint: Optional[Fingerprint] = None  # Set by FingerprintPlugin or fingerprint()
         self.fname: str = str(fname)
-        self.read_file(fname)
+        self._component_index: Optional[dict[str, list[tuple[str, int]]]] = None
+        self.net_filter: Optional[Callable[[str], bool]] = None
+        # Inverted pin name index (built on first find_pins() call)
+        self._pin_name_lookup: Optional[dict[str, list[tuple[str, str, str]]]] = None
+        self._pin_name_keys: list[str] = []             # sorted pin names (prefix search)
+        self._pin_name_folded: dict[str, list[str]] = {}  # casefolded -> pin names
+        self._pin_name_folded_keys: list[str] = []      # sorted casefolded pin names
+        self._net_search_index: Optional[NetNameIndex] = None  # Trigram index (built on first search)
+        self._file_node_lists: dict[int, list] = {}  # id(net) -> node list in file order (after sort_nodes())
+        self.net_order: str = 'name'
+        self.node_order: str = 'file'
+        self.refdes_filter: Optional[Callable[[str], bool]] = None
+
+    @classmethod
+    def _new_empty(cls, fname: str | Path) -> AllegroNetList:
+        """Create Netlist object without reading a file (for alternative loaders)
+
+        Args:
+            fname: Netlist file name to record in the report
+
+        Returns:
+            Empty AllegroNetList; caller fills net_list and calls build_indexes()
+        """
+        netlist = cls.__new__(cls)
+        netlist._init_data(fname)
+        return netlist
 
     def read_file(self, fname: str | Path) -> None:
         """Read and parse Netlist data from file.
 
-        The parser is a state machine that processes:
-        1. Header lines (first 3 lines contain version/date/time)
-        2. NET_NAME declarations (net name on next line)
-        3. NODE_NAME entries (component + pin, with pin name 2 lines later)
-        4. END marker (final Netlist termination)
+        The file is parsed by the parser engine in self.engine (see netlistengines
+        module; 'auto' - selected by file size and number of CPUs). All engines
+        give the same result: header, and nets in file order, sorted here by name.
+
+        Nets rejected by net_filter are skipped; nodes rejected by refdes_filter
+        are not stored.
 
         Args:
             fname: Path to Netlist file
 
+        Malformed lines are collected in self.diagnostics (the rest of their net
+        block is skipped) and reported in one log message.
+
+        Hooks of self.plugins are called by the engine for each net, and when
+        nets are sorted and indexes are built (on_end).
+
         Raises:
             ValueError: If file size exceeds maximum allowed size (default: 100MB)
+                        or engine is unknown
+            ParseErrorLimit: If more than max_errors lines cannot be parsed
+            ParseCancelled: If parsing was cancelled by cancel_token
         """
+        from .netlistengines import HEADER_LINE_COUNT, get_engine, select_engine
+
         # Constants for clarity
-        HEADER_LINE_COUNT = 3
-        PIN_NAME_LINE_OFFSET = 2
         MAX_FILE_SIZE = 100 * 1024 * 1024  # 100MB limit to prevent DoS
 
         # Security: Check file size before reading to prevent memory exhaustion
@@ -88,135 +298,91 @@ class AllegroNetList:
             logger.error(f"Cannot check file size for '{fname}': {e}")
             raise
 
+        if self.engine == 'auto':
+            self.engine = select_engine(file_size, memory_budget=self.memory_budget)
+        engine = get_engine(self.engine)
+        logger.info(f'Parser engine: {self.engine}')
+
+        self.diagnostics = Diagnostics(self.max_errors)
+        if self.plugins:
+            from .netlistplugins import PluginHooks
+            self._plugin_hooks = PluginHooks(self, self.plugins)
+        start_time = time.perf_counter()
         try:
-            with open(fname, 'r') as f:
-                # State machine variables
-                expecting_net_name = False  # Next line contains the net name
-                processing_net = False      # Currently processing a net's nodes
-                current_net = []
-                current_nodes = []
-
-                # Pin name extraction state
-                waiting_for_pin_name = False
-                pin_name_line_counter = 0
-                current_node_ref = None  # Reference to node being processed
-
-                # Header parsing
-                header_line_number = 0
-
-                # Error tracking
-                parse_error_count = 0
-                MAX_PARSE_ERRORS = 50  # Fail if more than 50 parsing errors occur
-
-                self.net_list = []
-
-                for line in f:
-                    s = line.rstrip()
-
-                    try:
-                        # State 1: Extract net name (line after NET_NAME)
-                        if expecting_net_name:
-                            expecting_net_name = False
-                            processing_net = True
-                            # Remove surrounding single quotes from net name
-                            current_net = s.strip("'")
-
-                        # State 2: Process NET_NAME or END markers
-                        if s.startswith('NET_NAME') or s.startswith('END.'):
-                            # Save previous net if we were processing one
-                            if processing_net:
-                                processing_net = False
-                                net_and_node = [current_net, current_nodes]
-                                current_net = []
-                                current_nodes = []
-                                self.net_list.append(net_and_node)
-
-                            # Reset pin name extraction state (fixes state machine bug)
-                            waiting_for_pin_name = False
-                            pin_name_line_counter = 0
-                            current_node_ref = None
-
-                            # Prepare for next net name
-                            expecting_net_name = True
-                            current_net = s
-
-                        # State 3: Process NODE_NAME (component + pin)
-                        elif s.startswith('NODE_NAME'):
-                            parts = s.split()
-                            ref_des = parts[1]
-                            pin_number = parts[2]
-                            ref_and_pin = [ref_des, pin_number]
-                            current_nodes.append(ref_and_pin)
-
-                            # Prepare to extract pin name (appears 2 lines later)
-                            waiting_for_pin_name = True
-                            pin_name_line_counter = 0
-                            current_node_ref = ref_and_pin
-
-                        # State 4: Extract pin name (2 lines after NODE_NAME)
-                        if waiting_for_pin_name:
-                            if pin_name_line_counter < PIN_NAME_LINE_OFFSET:
-                                pin_name_line_counter += 1
-                            else:
-                                waiting_for_pin_name = False
-                                # Clean up pin name (remove special characters) - optimized with str.translate()
-                                pin_name = s.translate(_PIN_NAME_TRANSLATE_TABLE)
-                                current_node_ref.append(pin_name)
-
-                        # State 5: Parse header (first 3 lines contain metadata)
-                        if header_line_number < HEADER_LINE_COUNT:
-                            header_line_number += 1
-
-                        if header_line_number == 2:
-                            # Example header line 2:
-                            #   { Using PSTWRITER 16.3.0 p002Mar-22-2016 at 10:54:51 }
-                            cfg = s.split()
-                            self.version = cfg[3]
-                            self.date = cfg[4][4:]  # Remove "p002" prefix
-                            self.time = cfg[6]
-
-                    except (IndexError, KeyError) as e:
-                        parse_error_count += 1
-                        logger.warning(f'Error parsing Netlist data (error #{parse_error_count}): {e}')
-                        # Check if too many errors have occurred
-                        if parse_error_count >= MAX_PARSE_ERRORS:
-                            error_msg = f'Too many parsing errors ({parse_error_count} errors). File may be corrupted or not a valid netlist.'
-                            logger.error(error_msg)
-                            raise ValueError(error_msg)
-
-                # Parsing complete - report statistics
-                if parse_error_count > 0:
-                    logger.warning(f'Parsing completed with {parse_error_count} errors. Results may be incomplete.')
-
-                # Sort nets alphabetically
-                self.net_list.sort()
+            with gc_paused():
+                try:
+                    stats = engine(self, str(fname), file_size)
+                except (IOError, OSError) as e:
+                    logger.error(f"Cannot read file '{fname}': {e}")
+                    raise
+
+                # Parsing complete - report malformed lines
+                if self.diagnostics:
+                    self.diagnostics.resolve_offsets(fname)
+                    logger.warning(f"'{self.fname}': {self.diagnostics.summary()}")
+
+                if self.progress is not None:
+                    self.progress(ParseProgress(file_size, file_size, stats.nets, stats.nodes,
+                                                time.perf_counter() - start_time))
+
+                # Sort nets alphabetically (stable: nets with equal names keep file order)
+                self.net_list.sort(key=_NET_NAME_KEY)
 
                 # Validate header was properly parsed
-                if header_line_number < HEADER_LINE_COUNT:
+                if stats.header_lines < HEADER_LINE_COUNT:
                     logger.warning('File appears to be incomplete or not a valid Cadence netlist (header incomplete)')
                 if self.version == 0 or self.date == 0 or self.time == 0:
                     logger.warning('Could not parse version/date/time from header. File may not be a valid Cadence netlist.')
 
-                # Build performance index: (refdes, pin) -> pin_name mapping
-                for net in self.net_list:
-                    node_list = net[1]
-                    for node in node_list:
-                        if len(node) >= 3:  # Ensure we have refdes, pin, and name
-                            refdes, pin, name = node[0], node[1], node[2]
-                            self.pin_name_index[(refdes, pin)] = name
-
-                # Build performance index: (refdes, pin) -> net_name mapping (for O(1) lookup)
-                for net in self.net_list:
-                    net_name = net[0]
-                    node_list = net[1]
-                    for node in node_list:
-                        if len(node) >= 2:  # Ensure we have refdes and pin
-                            refdes, pin = node[0], node[1]
-                            self.net_name_index[(refdes, pin)] = net_name
+                self.build_indexes()
+        finally:
+            hooks, self._plugin_hooks = self._plugin_hooks, None
 
-        except (IOError, OSError) as e:
-            logger.error(f"Cannot read file '{fname}': {e}")
-            raise
+        if hooks is not None:
+            hooks.end()
+
+    def _check_progress(self, bytes_read: int, total_bytes: int, nets: int, nodes: int,
+                        start_time: float) -> None:
+        """Call progress callback and check cancellation
+
+        Raises:
+            ParseCancelled: If cancel_token is cancelled
+        """
+        if self.progress is not None:
+            self.progress(ParseProgress(bytes_read, total_bytes, nets, nodes,
+                                        time.perf_counter() - start_time))
+        if self.cancel_token is not None and self.cancel_token.cancelled:
+            logger.info(f"Parsing of '{self.fname}' cancelled")
+            raise ParseCancelled(f"Parsing of '{self.fname}' cancelled")
+
+    def build_indexes(self) -> None:
+        """Build performance indexes from net_list
+
+        Builds pin_name_index ((refdes, pin) -> pin_name) and
+        net_name_index ((refdes, pin) -> net_name) for O(1) lookups.
+        If their estimated size exceeds memory_budget, they are built on disk.
+        """
+        if self.memory_budget is not None:
+            from .diskindex import DiskIndex, DiskIndexStore, estimate_index_size
+            pin_count = sum(len(net.nodes) for net in self.net_list)
+            if estimate_index_size(pin_count) > self.memory_budget:
+                logger.info(f'Indexes of {pin_count} pins exceed memory budget, using disk index')
+                store = DiskIndexStore()
+                store.load(self.net_list)
+                self.pin_name_index = DiskIndex(store, 'pin_name')
+                self.net_name_index = DiskIndex(store, 'net_name')
+                return
+
+        # One pass; both indexes share the (refdes, pin) key tuple
+        pin_name_index = self.pin_name_index
+        net_name_index = self.net_name_index
+        for net in self.net_list:
+            net_name = net.name
+            for node in net.nodes:
+                key = (node.refdes, node.pin)
+                net_name_index[key] = net_name
+                if node.pin_name is not None:
+                    pin_name_index[key] = node.pin_name
 
     def net_list_length(self) -> int:
         """Returns length of Netlist"""
@@ -255,7 +421,7 @@ class AllegroNetList:
             Net name or None if index is invalid
         """
         if self.check_net_index(i):
-            net = self.net_list[i][0]
+            net = self.net_list[i].name
             return net
         else:
             return None
@@ -271,10 +437,8 @@ class AllegroNetList:
         """
         if self.check_net_index(i):
             node = []
-            net = self.net_list[i][1]
-            for node_entry in net:
-                v = node_entry[:2]
-                node.append(v)
+            for node_entry in self.net_list[i].nodes:
+                node.append([node_entry.refdes, node_entry.pin])
             return node
         else:
             return None
@@ -303,6 +467,140 @@ class AllegroNetList:
         # Use O(1) dictionary lookup instead of nested loops
         return self.pin_name_index.get((p_refdes, p_pin), None)
 
+    def _build_pin_name_lookup(self) -> dict[str, list[tuple[str, str, str]]]:
+        """Build inverted pin name index: pin_name -> [(refdes, pin, net), ...]"""
+        lookup: dict[str, list[tuple[str, str, str]]] = {}
+        for net in self.net_list:
+            net_name = net.name
+            for node in net.nodes:
+                if node.pin_name is not None:
+                    entry = (node.refdes, node.pin, net_name)
+                    pins = lookup.get(node.pin_name)
+                    if pins is None:
+                        lookup[node.pin_name] = [entry]
+                    else:
+                        pins.append(entry)
+        self._pin_name_keys = sorted(lookup)
+        folded: dict[str, list[str]] = {}
+        for name in self._pin_name_keys:
+            folded.setdefault(name.casefold(), []).append(name)
+        self._pin_name_folded = folded
+        self._pin_name_folded_keys = sorted(folded)
+        self._pin_name_lookup = lookup
+        return lookup
+
+    def find_pins(self, name: str, prefix: bool = False,
+                  ignore_case: bool = False) -> list[tuple[str, str, str]]:
+        """Returns pins with pin name (inverted pin_name_index)
+
+        Args:
+            name: pin name (e.g. 'RESET_N') or pin name prefix (e.g. 'JTAG_')
+            prefix: if True, find pin names starting with name
+            ignore_case: if True, compare pin names case-insensitively
+
+        Returns:
+            List of (refdes, pin, net name), grouped by pin name (pin names sorted)
+
+        Performance: index is built once; lookups are O(log N + results)
+        """
+        lookup = self._pin_name_lookup
+        if lookup is None:
+            lookup = self._build_pin_name_lookup()
+        if ignore_case:
+            key = name.casefold()
+            folded_keys = self._pin_name_folded_keys
+            if prefix:
+                matched = []
+                for folded in _prefix_matches(folded_keys, key):
+                    matched.extend(self._pin_name_folded[folded])
+            else:
+                matched = self._pin_name_folded.get(key, [])
+        elif prefix:
+            matched = _prefix_matches(self._pin_name_keys, name)
+        else:
+            return list(lookup.get(name, []))
+        result = []
+        for pin_name in matched:
+            result.extend(lookup[pin_name])
+        return result
+
+    def search_nets(self, query: str, mode: str = 'substring', ignore_case: bool = False) -> list[int]:
+        """Returns net indexes of nets with matching names (see netsearch module)
+
+        Args:
+            query: search text (e.g. 'DDR_DQ')
+            mode: 'substring', 'glob' or 'regex'
+            ignore_case: if True, compare case-insensitively
+
+        Returns:
+            Ascending net indexes, usable with net2string()
+
+        Raises:
+            ValueError: If mode is unknown
+            re.error: If regex query is not a valid regular expression
+
+        Performance: trigram index is built on first call
+        """
+        if self._net_search_index is None:
+            from .netsearch import NetNameIndex
+            self._net_search_index = NetNameIndex(net.name for net in self.net_list)
+        return self._net_search_index.search(query, mode, ignore_case)
+
+    def _reset_order_caches(self) -> None:
+        """Drop caches that depend on net/node order (rebuilt on demand)"""
+        self._component_index = None
+        self._pin_name_lookup = None
+        self._net_search_index = None
+
+    def sort_nets(self, mode: str = 'name') -> None:
+        """Reorder nets without reparsing (see netsort module)
+
+        Args:
+            mode: 'name' (default), 'natural', 'fanout', 'power' or registered mode
+
+        Raises:
+            ValueError: If mode is unknown
+
+        Note: net indexes change; graphs/arrays created before are not updated.
+        """
+        from .netsort import NET_SORT_MODES
+        key_factory = NET_SORT_MODES.get(mode)
+        if key_factory is None:
+            raise ValueError(f"Unknown net sort mode '{mode}' (valid: {', '.join(NET_SORT_MODES)})")
+        self.net_list.sort(key=key_factory())
+        self.net_order = mode
+        self._reset_order_caches()
+
+    def sort_nodes(self, mode: str = 'file') -> None:
+        """Reorder nodes within each net without reparsing (see netsort module)
+
+        Args:
+            mode: 'file' (order in Netlist file, default), 'natural', 'refdes' or registered mode
+
+        Raises:
+            ValueError: If mode is unknown
+        """
+        from .netsort import NODE_SORT_MODES
+        if mode == 'file':
+            for net in self.net_list:
+                nodes = self._file_node_lists.get(id(net))
+                if nodes is not None:
+                    net.nodes = nodes
+            self._file_node_lists = {}
+        else:
+            key_factory = NODE_SORT_MODES.get(mode)
+            if key_factory is None:
+                valid = ', '.join(['file', *NODE_SORT_MODES])
+                raise ValueError(f"Unknown node sort mode '{mode}' (valid: {valid})")
+            key = key_factory()  # One key function: cached keys shared by all nets
+            file_node_lists = self._file_node_lists
+            for net in self.net_list:
+                # Keep the first (file order) list to restore 'file' mode
+                file_node_lists.setdefault(id(net), net.nodes)
+                net.nodes = sorted(net.nodes, key=key)
+        self.node_order = mode
+        self._reset_order_caches()
+
     def node2string(self, i: int) -> Optional[str]:
         """Returns node (refdes, pin) as string
 
@@ -346,12 +644,10 @@ class AllegroNetList:
         find_net = 0
         if self.find_in_refdes_list(refdes):
             return True
-        for i in self.net_list:
-            net = i[0]
-            ref_pin = i[1]
-            for j in ref_pin:
-                if j[0] == refdes:
-                    refdes_list.append([net, j[1]])
+        for net in self.net_list:
+            for node in net.nodes:
+                if node.refdes == refdes:
+                    refdes_list.append([net.name, node.pin])
                     find_net = 1
         # Add to both list and dictionary for O(1) lookup
         index = len(self.refdes_list)
@@ -363,6 +659,23 @@ class AllegroNetList:
             logger.error(f"Cannot find refdes '{refdes}' in Netlist: {self.fname}")
             return False
 
+    def component_index(self) -> dict[str, list[tuple[str, int]]]:
+        """Returns index of all components: refdes -> [(pin, net index), ...]
+
+        Built on first call in one pass over net_list (pins in net_list order).
+        """
+        if self._component_index is None:
+            index: dict[str, list[tuple[str, int]]] = {}
+            for net_index, net in enumerate(self.net_list):
+                for node in net.nodes:
+                    pins = index.get(node.refdes)
+                    if pins is None:
+                        index[node.refdes] = [(node.pin, net_index)]
+                    else:
+                        pins.append((node.pin, net_index))
+            self._component_index = index
+        return self._component_index
+
     def get_net_name4refdes_pin(self, refdes: str, pin: str) -> Optional[str]:
         """Returns net name for refdes and pin
 
@@ -399,6 +712,68 @@ class AllegroNetList:
             logger.error(f"Cannot find refdes '{refdes}' in refdes list")
             return None
 
+    def iter_refdes_report(self) -> Iterator[str]:
+        """Yield refdes report text of each component: 'refdes pin pin_name net' lines
+
+        Components and their pins are in natural order ('R2' before 'R10'),
+        missing pin name is '-'. Built from component_index() (one pass over
+        net_list on first call); text is produced one component at a time.
+        """
+        from .netsort import natural_key
+        index = self.component_index()
+        net_list = self.net_list
+        pin_name_get = self.pin_name_index.get
+        # Pin numbers repeat on all components: natural order rank of each distinct pin
+        pins = {pin for refdes_pins in index.values() for pin, _ in refdes_pins}
+        rank = {pin: i for i, pin in enumerate(sorted(pins, key=natural_key))}
+
+        def pin_key(item: tuple[str, int]) -> int:
+            return rank[item[0]]
+
+        for refdes in sorted(index, key=natural_key):
+            refdes_pins = index[refdes]
+            if len(refdes_pins) > 1:
+                refdes_pins = sorted(refdes_pins, key=pin_key)
+            yield ''.join([f"{refdes} {pin} {pin_name_get((refdes, pin)) or '-'} {net_list[i].name}\n"
+                           for pin, i in refdes_pins])
+
+    def refdes_report2string(self) -> str:
+        """Return refdes report (all components, see iter_refdes_report) as string"""
+        return ''.join(self.iter_refdes_report())
+
+    def refdes_report_section(self) -> str:
+        """Return refdes report section as string"""
+        lines = [
+            '',
+            '',
+            '',
+            '+-------------------------------------------------------------------------+',
+            '| Components: refdes pin pin_name net                                     |',
+            '+-------------------------------------------------------------------------+'
+        ]
+        r_string = self.refdes_report2string()
+        if r_string == '':
+            lines.append('- (Empty)')
+        else:
+            lines.append(r_string)
+        return '\n'.join(lines)
+
+    def refdes_report2file(self, fname: str | Path = 'NetList_refdes.rpt', message_en: bool = False) -> None:
+        """Write refdes report to file (streamed one component at a time)
+
+        Raises:
+            IOError: If file write fails
+        """
+        try:
+            with open(fname, 'w') as f:
+                f.writelines(self.iter_refdes_report())
+            if message_en:
+                logger.info(f'Wrote refdes report file: {fname}')
+        except (IOError, OSError) as e:
+            error_msg = f"Failed to write output file '{fname}': {e}"
+            logger.error(error_msg)
+            raise IOError(error_msg)
+
     def net2string(self, i: int) -> Optional[str]:
         """Returns full net as string (net name and her refdes and pins)
 
@@ -417,28 +792,34 @@ class AllegroNetList:
         net_and_node = f'{net} {node}'
         return net_and_node
 
+    @staticmethod
+    def _render_nets(nets: Iterable[Net]) -> tuple[list[str], list[str]]:
+        """Render nets in one pass: (net lines as net2string(), single node warning lines)
+
+        Warning lines are nets whose line has less than 5 words (net name and
+        at most one node); only nets with up to 2 nodes need the word count.
+        """
+        lines = []
+        warnings = []
+        for net in nets:
+            nodes = net.nodes
+            line = f"{net.name} {' '.join([f'{node.refdes} {node.pin}' for node in nodes])}"
+            lines.append(line)
+            if len(nodes) <= 2 and len(net.name.split()) + 2 * len(nodes) < 5:
+                warnings.append(line)
+        return lines, warnings
+
     def __str__(self) -> str:
         """Returns Netlist as string"""
-        # Optimize: use join instead of string concatenation in loop, filter out None values
-        lines = [self.net2string(i) for i in range(self.net_list_length())]
-        lines = [line for line in lines if line is not None]
-        return '\n'.join(lines)
+        return '\n'.join(self._render_nets(self.net_list)[0])
 
     def net_list2string(self) -> str:
         """Return Netlist data as string"""
-        # Optimize: use join instead of string concatenation in loop, filter out None values
-        lines = [self.net2string(i) for i in range(self.net_list_length())]
-        lines = [line for line in lines if line is not None]
-        return '\n'.join(lines) + '\n'
+        return '\n'.join(self._render_nets(self.net_list)[0]) + '\n'
 
     def single_net_list2string(self) -> str:
         """Return single Netlist data as string"""
-        # Optimize: use join with list comprehension, filter out None values
-        lines = []
-        for i in range(self.net_list_length()):
-            net_str = self.net2string(i)
-            if net_str is not None and len(net_str.split()) < 5:
-                lines.append(net_str)
+        lines = self._render_nets(self.net_list)[1]
         return '\n'.join(lines) + '\n' if lines else ''
 
     def net_list_title(self) -> str:
@@ -456,11 +837,17 @@ class AllegroNetList:
             f'|  {self.fname}',
             '+-------------------------------------------------------------------------+'
         ]
+        if self.net_filter is not None or self.refdes_filter is not None:
+            lines.insert(-1, '|  Partial Netlist: net/refdes filter applied')
         return '\n'.join(lines)
 
     def single_net_warnings(self) -> str:
         """Return single net warning as string"""
-        # Optimize: use list and join instead of string concatenation
+        return self._single_net_warnings_section(self.single_net_list2string())
+
+    @staticmethod
+    def _single_net_warnings_section(w_string: str) -> str:
+        """Return single net warning section for warning lines string"""
         lines = [
             '',
             '',
@@ -469,35 +856,134 @@ class AllegroNetList:
             '| Warnings: Single node name                                              |',
             '+-------------------------------------------------------------------------+'
         ]
-        w_string = self.single_net_list2string()
         if w_string == '':
             lines.append('- (Empty)')
         else:
             lines.append(w_string)
         return '\n'.join(lines)
 
-    def all_data2string(self) -> str:
-        """Return all Netlist data (title, data, warnings) as string"""
-        s = self.net_list_title() + '\n'
-        s = s + self.net_list2string()
-        s = s + self.single_net_warnings()
+    def extended_nets(self, prefixes: Iterable[str] = ('R', 'L', 'FB'),
+                      refdes: Iterable[str] = ()) -> list[list[int]]:
+        """Returns extended nets - nets joined through 2-pin series parts (see extendednets module)
+
+        Args:
+            prefixes: refdes prefixes of series parts
+            refdes: explicit refdes of series parts
+
+        Returns:
+            Groups of net indexes (only groups with two or more nets)
+        """
+        from .extendednets import find_extended_nets
+        return find_extended_nets(self, prefixes, refdes)
+
+    def extended_nets2string(self, prefixes: Iterable[str] = ('R', 'L', 'FB'),
+                             refdes: Iterable[str] = ()) -> str:
+        """Return extended nets as string (one group of net names per line)"""
+        lines = [' '.join(self.net_list[i].name for i in group)
+                 for group in self.extended_nets(prefixes, refdes)]
+        return '\n'.join(lines) + '\n' if lines else ''
+
+    def extended_nets_section(self, prefixes: Iterable[str] = ('R', 'L', 'FB'),
+                              refdes: Iterable[str] = ()) -> str:
+        """Return extended nets report section as string"""
+        prefixes = list(prefixes)
+        refdes = list(refdes)
+        title = f"Extended nets (joined through: {', '.join(prefixes + refdes)})"
+        lines = [
+            '',
+            '',
+            '',
+            '+-------------------------------------------------------------------------+',
+            f'| {title:<72}|',
+            '+-------------------------------------------------------------------------+'
+        ]
+        e_string = self.extended_nets2string(prefixes, refdes)
+        if e_string == '':
+            lines.append('- (Empty)')
+        else:
+            lines.append(e_string)
+        return '\n'.join(lines)
+
+    def check_rules(self, rules: Optional[Iterable[Rule]] = None) -> RuleReport:
+        """Run connectivity rules in one pass over nets (see netlistrules module)
+
+        Args:
+            rules: rules to run (default: None, all rules with default options)
+
+        Returns:
+            Rule check report
+        """
+        from .netlistrules import check_netlist
+        return check_netlist(self, rules)
+
+    @staticmethod
+    def rule_check_section(report: RuleReport) -> str:
+        """Return rule check report section as string"""
+        title = f"Rule check: {len(report.violations)} violations"
+        lines = [
+            '',
+            '',
+            '',
+            '+-------------------------------------------------------------------------+',
+            f'| {title:<72}|',
+            '+-------------------------------------------------------------------------+'
+        ]
+        r_string = report.to_text()
+        if r_string == '':
+            lines.append('- (Empty)')
+        else:
+            lines.append(r_string)
+        return '\n'.join(lines)
+
+    def all_data2string(self, extended_nets: Optional[Iterable[str]] = None,
+                        rule_report: Optional[RuleReport] = None, refdes_report: bool = False) -> str:
+        """Return all Netlist data (title, data, warnings) as string
+
+        Args:
+            extended_nets: refdes prefixes of series parts to add extended nets
+                           section (default: None, section is not added)
+            rule_report: rule check report to add as section (default: None)
+            refdes_report: if True, add refdes report section (all components)
+        """
+        # Single pass over nets: main section and warnings together
+        lines, warnings = self._render_nets(self.net_list)
+        parts = [self.net_list_title(), '\n',
+                 '\n'.join(lines), '\n',
+                 self._single_net_warnings_section('\n'.join(warnings) + '\n' if warnings else '')]
+        if extended_nets is not None:
+            parts.append(self.extended_nets_section(extended_nets))
+        if rule_report is not None:
+            parts.append(self.rule_check_section(rule_report))
+        if refdes_report:
+            parts.append(self.refdes_report_section())
         # Add trailing newline (Unix convention)
-        return s + '\n'
+        parts.append('\n')
+        return ''.join(parts)
 
-    def net_list2file(self, fname: str | Path = 'NetList.rpt', message_en: bool = False) -> None:
+    def net_list2file(self, fname: str | Path = 'NetList.rpt', message_en: bool = False,
+                      extended_nets: Optional[Iterable[str]] = None, jobs: Optional[int] = None,
+                      rule_report: Optional[RuleReport] = None, refdes_report: bool = False) -> None:
         """Write Netlist data (with title to string) to file
 
         Args:
             fname: output file name
             message_en: if True, log a message about the write operation
+            extended_nets: refdes prefixes of series parts to add extended nets section
+            jobs: number of worker processes rendering nets (default: None, render in
+                  current process); output is the same as with serial rendering
+            rule_report: rule check report to add as section (default: None)
+            refdes_report: if True, add refdes report section (all components)
 
         Raises:
             IOError: If file write fails (permission denied, disk full, etc.)
         """
         try:
-            s = self.all_data2string()
-            with open(fname, 'w') as f:
-                f.write(s)
+            if jobs is not None and jobs > 1 and len(self.net_list) >= 2 * RENDER_CHUNK_MIN:
+                self._net_list2file_parallel(fname, extended_nets, jobs, rule_report, refdes_report)
+            else:
+                s = self.all_data2string(extended_nets, rule_report, refdes_report)
+                with open(fname, 'w') as f:
+                    f.write(s)
             if message_en:
                 logger.info(f'Wrote Netlist report file: {fname}')
         except (IOError, OSError) as e:
@@ -505,10 +991,231 @@ class AllegroNetList:
             logger.error(error_msg)
             raise IOError(error_msg)
 
+    def _net_list2file_parallel(self, fname: str | Path, extended_nets: Optional[Iterable[str]],
+                                jobs: int, rule_report: Optional[RuleReport] = None,
+                                refdes_report: bool = False) -> None:
+        """Write report with nets rendered in contiguous chunks by worker processes
+
+        Chunks are written in order as they complete; warning lines are
+        collected per chunk and written after the nets, as all_data2string().
+        """
+        from concurrent.futures import ProcessPoolExecutor
+        count = len(self.net_list)
+        chunk = max(RENDER_CHUNK_MIN, -(-count // (jobs * RENDER_CHUNKS_PER_JOB)))
+        bounds = [(start, min(start + chunk, count)) for start in range(0, count, chunk)]
+        warnings: list[str] = []
+        with open(fname, 'w') as f, \
+                ProcessPoolExecutor(max_workers=jobs, initializer=_init_render_worker,
+                                    initargs=(self.net_list,)) as executor:
+            f.write(self.net_list_title() + '\n')
+            for text, chunk_warnings in executor.map(_render_chunk, bounds):
+                f.write(text)
+                warnings.extend(chunk_warnings)
+            f.write(self._single_net_warnings_section('\n'.join(warnings) + '\n' if warnings else ''))
+            if extended_nets is not None:
+                f.write(self.extended_nets_section(extended_nets))
+            if rule_report is not None:
+                f.write(self.rule_check_section(rule_report))
+            if refdes_report:
+                f.write(self.refdes_report_section())
+            f.write('\n')
+
+    def write_outputs(self, outputs: Mapping[str, str | Path], message_en: bool = False,
+                      extended_nets: Optional[Iterable[str]] = None,
+                      rule_report: Optional[RuleReport] = None, refdes_report: bool = False) -> None:
+        """Write Netlist in several formats with one pass over nets (see netlistwriters module)
+
+        Args:
+            outputs: format name ('rpt', 'csv', 'json', 'refdes') -> output file name
+            message_en: if True, log a message about each written file
+            extended_nets: refdes prefixes of series parts to add extended nets section (rpt)
+            rule_report: rule check report to add as section (rpt)
+            refdes_report: if True, add refdes report section (rpt)
+
+        Raises:
+            ValueError: If format is unknown
+            IOError: If file write fails
+        """
+        from .netlistwriters import write_outputs
+        write_outputs(self, outputs, extended_nets=extended_nets, rule_report=rule_report,
+                      refdes_report=refdes_report)
+        if message_en:
+            for name, fname in outputs.items():
+                logger.info(f'Wrote Netlist {name} file: {fname}')
+
     def net_list_info(self) -> str:
         """Returns Netlist info as string"""
         return f'Netlist {self.date} {self.time} (version: {self.version})'
 
+    def net_list2sqlite(self, fname: str | Path = 'NetList.db', message_en: bool = False) -> None:
+        """Export Netlist data to SQLite database (see netlistdb module)
+
+        Args:
+            fname: output database file name (existing file is replaced)
+            message_en: if True, log a message about the write operation
+
+        Raises:
+            IOError: If database write fails
+        """
+        from .netlistdb import net_list2sqlite
+        net_list2sqlite(self, fname)
+        if message_en:
+            logger.info(f'Wrote Netlist database file: {fname}')
+
+    @classmethod
+    def from_sqlite(cls, fname: str | Path) -> AllegroNetList:
+        """Load Netlist data from SQLite database without parsing the Netlist file
+
+        Args:
+            fname: database file written by net_list2sqlite()
+
+        Returns:
+            AllegroNetList with net_list and indexes restored
+
+        Raises:
+            IOError: If database cannot be read
+            ValueError: If file is not a Netlist database
+        """
+        from .netlistdb import sqlite2net_list
+        return sqlite2net_list(fname, cls)
+
+    def fingerprint(self) -> Fingerprint:
+        """Returns connectivity fingerprint (see netlistfingerprint module)
+
+        Computed while parsing if FingerprintPlugin is used, otherwise in one
+        pass over net_list on first call.
+        """
+        if self._fingerprint is None:
+            from .netlistfingerprint import fingerprint_nets
+            self._fingerprint = fingerprint_nets(self.net_list)
+        return self._fingerprint
+
+    def connectivity_graph(self, pass_through: Iterable[str] = ('R', 'L', 'FB'),
+                           pass_through_refdes: Iterable[str] = ()) -> ConnectivityGraph:
+        """Returns net/component connectivity graph for signal tracing (see netlistgraph module)
+
+        Args:
+            pass_through: refdes prefixes of components that signals pass through
+            pass_through_refdes: explicit refdes of pass-through components
+        """
+        from .netlistgraph import ConnectivityGraph
+        return ConnectivityGraph(self, pass_through, pass_through_refdes)
+
+    def net_list2arrays(self) -> NetListArrays:
+        """Returns Netlist pin table as columnar NumPy arrays (see netlistarray module)
+
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        from .netlistarray import NetListArrays
+        return NetListArrays.from_netlist(self)
+
+    def net_list2npz(self, fname: str | Path = 'NetList.npz', message_en: bool = False) -> None:
+        """Save Netlist pin table to compressed NumPy .npz file
+
+        Args:
+            fname: output file name
+            message_en: if True, log a message about the write operation
+
+        Raises:
+            ImportError: If NumPy is not installed
+            IOError: If file write fails
+        """
+        self.net_list2arrays().save(fname)
+        if message_en:
+            logger.info(f'Wrote Netlist pin table file: {fname}')
+
+    @classmethod
+    def from_npz(cls, fname: str | Path) -> AllegroNetList:
+        """Load Netlist data from .npz file without parsing the Netlist file
+
+        Args:
+            fname: file written by net_list2npz()
+
+        Returns:
+            AllegroNetList with net_list and indexes restored
+
+        Raises:
+            ImportError: If NumPy is not installed
+            ValueError: If file is not a Netlist pin table
+        """
+        from .netlistarray import NetListArrays
+        arrays = NetListArrays.load(fname)
+        netlist = cls._new_empty(arrays.fname)
+        netlist.version = arrays.version
+        netlist.date = arrays.date
+        netlist.time = arrays.time
+        netlist.net_list = arrays.to_net_list()
+        netlist.build_indexes()
+        return netlist
+
+    @classmethod
+    async def aload(cls, fname: str | Path, executor: Optional[Executor] = None,
+                    use_cache: bool = True, **kwargs: Any) -> AllegroNetList:
+        """Parse Netlist file in executor without blocking the event loop
+
+        Unfiltered loads go through the in-process cache (see netlistcache
+        module): an unchanged file is parsed once, and simultaneous requests
+        for the same file share one parse. Cached Netlists are shared - do not
+        modify them. Cyclic garbage collection of the process is paused while
+        a file is parsed (see gc_paused).
+
+        Args:
+            fname: Netlist file name
+            executor: executor of parse (default: cache/event loop thread pool)
+            use_cache: if False, always parse (result is not cached)
+            **kwargs: AllegroNetList arguments (filters, memory_budget, ...);
+                      loads with arguments bypass the cache
+
+        Returns:
+            Parsed Netlist (AllegroNetList when served from cache)
+
+        Raises:
+            IOError: If file cannot be read
+            ValueError: If file is not a valid Netlist
+        """
+        if use_cache and not kwargs:
+            from .netlistcache import netlist_cache
+            return await netlist_cache.aget(fname, executor)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, partial(cls, fname, **kwargs))
+
+    @classmethod
+    async def aload_many(cls, fnames: Iterable[str | Path], limit: int = 4,
+                         executor: Optional[Executor] = None, use_cache: bool = True,
+                         **kwargs: Any) -> list[AllegroNetList]:
+        """Parse Netlist files concurrently, at most `limit` at a time (see aload())
+
+        Returns:
+            Parsed Netlists in order of fnames
+
+        Raises:
+            ValueError: If limit is less than 1
+            IOError, ValueError: First error of aload()
+        """
+        if limit < 1:
+            raise ValueError(f'Concurrency limit must be at least 1, got {limit}')
+        semaphore = asyncio.Semaphore(limit)
+
+        async def load(fname: str | Path) -> AllegroNetList:
+            async with semaphore:
+                return await cls.aload(fname, executor, use_cache, **kwargs)
+
+        return list(await asyncio.gather(*(load(fname) for fname in fnames)))
+
+    def to_shared_memory(self, name: Optional[str] = None) -> SharedNetList:
+        """Publish Netlist to shared memory for worker processes (see sharednetlist module)
+
+        Args:
+            name: shared memory block name (default: generated unique name)
+
+        Returns:
+            Owning SharedNetList; workers use SharedNetList.attach(shared.name)
+            (or receive it pickled), the owner calls unlink() when done
+        """
+        from .sharednetlist import SharedNetList
+        return SharedNetList.publish(self, name)
+
 
 if __name__ == '__main__':
     # Module can be tested directly, but tests should use the test suite in tests/
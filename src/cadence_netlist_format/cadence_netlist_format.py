@@ -9,13 +9,19 @@ import datetime
 import subprocess
 import sys
 from pathlib import Path
-from tkinter import Frame, Label, Button, StringVar, Entry, Text, Scrollbar
+from tkinter import Frame, Label, Button, StringVar, Entry, Text, Scrollbar, OptionMenu
 from tkinter import messagebox, END, DISABLED, NORMAL, WORD
 from tkinter.filedialog import askopenfilename
-from typing import Optional
+from typing import Iterable, Optional
 
 from .configfile import ConfigFile
 from .allegronetlist import AllegroNetList
+from .netlistheader import peek_header
+from .netsort import net_sort_modes, node_sort_modes
+from .parseprogress import CancelToken, ParseCancelled, ParseProgress
+
+
+MAX_SEARCH_RESULTS = 200  # Nets shown in log for one search
 
 
 class CadenceNetListFormat(Frame):
@@ -25,6 +31,14 @@ class CadenceNetListFormat(Frame):
         Frame.__init__(self, parent)
         self.cnl_fname: Optional[str] = None
         self.output_fname: str = 'NetList.rpt'
+        self.refdes_fname: str = 'NetList_refdes.rpt'
+        self.netlist: Optional[AllegroNetList] = None  # Last parsed Netlist (reused by search)
+        self.netlist_mtime: Optional[int] = None  # Netlist file mtime when parsed
+        self.net_order: str = 'name'
+        self.node_order: str = 'file'
+        self.cancel_token: Optional[CancelToken] = None  # Token of running parse
+        self.progress_step: int = 0  # Last logged progress step (10% steps)
+        self.action_buttons: list[Button] = []  # Disabled while parsing
         self.cfg: Optional[ConfigFile] = None
         self.read_config_file()
         self.master.title("Cadence Allegro Netlist Formatter")
@@ -75,16 +89,21 @@ class CadenceNetListFormat(Frame):
         self.file_entry = Entry(file_entry_frame, textvariable=self.gui_cnl_fname, state='readonly')
         self.file_entry.pack(side='left', fill='x', expand=True, padx=(0, 5))
 
-        Button(file_entry_frame, text='Browse...', command=self.select_netlist,
-               width=12).pack(side='left')
+        browse_button = Button(file_entry_frame, text='Browse...', command=self.select_netlist, width=12)
+        browse_button.pack(side='left')
 
         # Action buttons section
         action_frame = Frame(self)
         action_frame.pack(fill='x', pady=10)
 
-        Button(action_frame, text='Format Netlist', command=self.format_netlist,
-               height=2, width=15, bg='#4CAF50', fg='white',
-               font=('TkDefaultFont', 9, 'bold')).pack(side='left', padx=5)
+        format_button = Button(action_frame, text='Format Netlist', command=self.format_netlist,
+                               height=2, width=15, bg='#4CAF50', fg='white',
+                               font=('TkDefaultFont', 9, 'bold'))
+        format_button.pack(side='left', padx=5)
+
+        refdes_button = Button(action_frame, text='Refdes Report', command=self.refdes_report,
+                               height=2, width=15)
+        refdes_button.pack(side='left', padx=5)
 
         Button(action_frame, text='Open Output File', command=self.open_output_file,
                height=2, width=15).pack(side='left', padx=5)
@@ -92,6 +111,38 @@ class CadenceNetListFormat(Frame):
         Button(action_frame, text='Open Output Folder', command=self.open_output_dir,
                height=2, width=15).pack(side='left', padx=5)
 
+        Button(action_frame, text='Cancel', command=self.cancel_parse,
+               height=2, width=10).pack(side='left', padx=5)
+
+        # Report order section
+        order_frame = Frame(self)
+        order_frame.pack(fill='x', pady=(0, 5))
+
+        Label(order_frame, text='Net Order:', font=('TkDefaultFont', 9, 'bold')).pack(side='left')
+        self.gui_net_order = StringVar(value=self.net_order)
+        OptionMenu(order_frame, self.gui_net_order, *net_sort_modes(),
+                   command=lambda _: self.apply_sort_order()).pack(side='left', padx=5)
+
+        Label(order_frame, text='Node Order:', font=('TkDefaultFont', 9, 'bold')).pack(side='left')
+        self.gui_node_order = StringVar(value=self.node_order)
+        OptionMenu(order_frame, self.gui_node_order, *node_sort_modes(),
+                   command=lambda _: self.apply_sort_order()).pack(side='left', padx=5)
+
+        # Net search section
+        search_frame = Frame(self)
+        search_frame.pack(fill='x', pady=(0, 5))
+
+        Label(search_frame, text='Search Nets:', font=('TkDefaultFont', 9, 'bold')).pack(side='left')
+
+        self.gui_search = StringVar()
+        search_entry = Entry(search_frame, textvariable=self.gui_search)
+        search_entry.pack(side='left', fill='x', expand=True, padx=5)
+        search_entry.bind('<Return>', lambda event: self.search_nets())
+
+        search_button = Button(search_frame, text='Search', command=self.search_nets, width=12)
+        search_button.pack(side='left')
+        self.action_buttons = [browse_button, format_button, refdes_button, search_button]
+
         # Status and log section
         status_frame = Frame(self)
         status_frame.pack(fill='both', expand=True, pady=10)
@@ -138,6 +189,8 @@ class CadenceNetListFormat(Frame):
 
     def format_netlist(self) -> None:
         """format Netlist into readable report"""
+        if self._parse_running():
+            return
         # Validate input file
         if not self.cnl_fname or self.cnl_fname == '':
             messagebox.showerror("Error", "Please select a Netlist file first.")
@@ -163,12 +216,11 @@ class CadenceNetListFormat(Frame):
             self.log_message(f'ERROR: Path is not a regular file: {self.cnl_fname}')
             return
 
-        # Basic format validation: check if file starts with expected header
+        # Basic format validation: check header lines only (file is not parsed)
         try:
-            with open(self.cnl_fname, 'r') as f:
-                first_line = f.readline().strip()
-                if not first_line.startswith('FILE_TYPE'):
-                    self.log_message('WARNING: File may not be a valid Cadence Netlist (missing FILE_TYPE header)')
+            header = peek_header(self.cnl_fname, sample_size=0)
+            for problem in header.problems:
+                self.log_message(f'WARNING: File may not be a valid Cadence Netlist ({problem})')
         except IOError as e:
             messagebox.showerror("Error", f"Cannot read file:\n{str(e)}")
             self.log_message(f'ERROR: Cannot read file: {str(e)}')
@@ -181,9 +233,16 @@ class CadenceNetListFormat(Frame):
             self.log_message(f'Starting format at {datetime.datetime.now().strftime("%H:%M:%S")}')
             self.log_message(f'Input file: {self.cnl_fname}')
 
-            # Parse Netlist
-            self.log_message('Parsing Netlist file...')
-            n = AllegroNetList(self.cnl_fname)
+            # Parse Netlist (reuse parsed Netlist if file is not changed)
+            if self._netlist_is_current():
+                self.log_message('Netlist file not changed, reusing parsed Netlist...')
+                n = self.netlist
+            else:
+                self.log_message('Parsing Netlist file...')
+                n = self._parse_netlist()
+                self.netlist = n
+                self.netlist_mtime = self._file_mtime(self.cnl_fname)
+            self._sort_netlist(n)
 
             # Generate report
             self.log_message('Generating formatted report...')
@@ -205,14 +264,149 @@ class CadenceNetListFormat(Frame):
             self.log_message(error_msg)
             self.log_message('=' * 60)
             messagebox.showerror("File Error", f"Failed to read or write file:\n\n{str(e)}")
+        except ParseCancelled:
+            self.log_message('Parsing cancelled.')
+            self.log_message('=' * 60)
         except ValueError as e:
             error_msg = f'ERROR: Invalid file format or data: {str(e)}'
             self.log_message(error_msg)
             self.log_message('=' * 60)
             messagebox.showerror("Format Error", f"File format is invalid:\n\n{str(e)}")
 
+    @staticmethod
+    def _file_mtime(fname: str) -> Optional[int]:
+        """Returns file modification time (ns), None if file cannot be accessed"""
+        try:
+            return Path(fname).stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _netlist_is_current(self) -> bool:
+        """True if last parsed Netlist is of selected file and the file is not changed"""
+        return (self.netlist is not None and self.netlist.fname == self.cnl_fname
+                and self.netlist_mtime is not None
+                and self.netlist_mtime == self._file_mtime(self.cnl_fname))
+
+    def _sort_netlist(self, netlist: AllegroNetList) -> None:
+        """Apply selected net/node order to Netlist (only if changed)"""
+        if netlist.net_order != self.net_order:
+            netlist.sort_nets(self.net_order)
+        if netlist.node_order != self.node_order:
+            netlist.sort_nodes(self.node_order)
+
+    def apply_sort_order(self) -> None:
+        """Apply net/node order selected in GUI to parsed Netlist (without reparsing)"""
+        self.net_order = self.gui_net_order.get()
+        self.node_order = self.gui_node_order.get()
+        self.log_message(f'Order: nets by {self.net_order}, nodes by {self.node_order}')
+        if self.netlist is not None:
+            self._sort_netlist(self.netlist)
+
+    def _parse_netlist(self) -> AllegroNetList:
+        """Parse selected Netlist file with progress log (can be stopped with Cancel button)
+
+        Raises:
+            ParseCancelled: If Cancel button was pressed
+        """
+        self.cancel_token = CancelToken()
+        self.progress_step = 0
+        # GUI events are processed while parsing: actions must not start another parse
+        for button in self.action_buttons:
+            button.config(state=DISABLED)
+        try:
+            netlist = AllegroNetList(self.cnl_fname, progress=self.parse_progress,
+                                     cancel_token=self.cancel_token)
+        finally:
+            self.cancel_token = None
+            for button in self.action_buttons:
+                button.config(state=NORMAL)
+        if netlist.diagnostics:
+            self.log_message(f'WARNING: {netlist.diagnostics.summary()}')
+        return netlist
+
+    def parse_progress(self, progress: ParseProgress) -> None:
+        """Log parsing progress (10% steps) and process GUI events (Cancel button)"""
+        step = int(progress.fraction * 10)
+        if step > self.progress_step and step < 10:
+            self.progress_step = step
+            self.log_message(f'  {step * 10}%: {progress.nets} nets, {progress.nodes} nodes '
+                             f'({progress.elapsed:.1f} s)')
+        self.update()
+
+    def _parse_running(self) -> bool:
+        """True (and log message) if a parse is running: action is ignored"""
+        if self.cancel_token is None:
+            return False
+        self.log_message('Parsing in progress: wait or press Cancel.')
+        return True
+
+    def cancel_parse(self) -> None:
+        """Cancel running parse"""
+        if self.cancel_token is not None:
+            self.cancel_token.cancel()
+            self.log_message('Cancelling...')
+
+    def get_netlist(self) -> Optional[AllegroNetList]:
+        """Returns parsed Netlist of selected file (parsed once, then reused while file is not changed)"""
+        if self._netlist_is_current():
+            return self.netlist
+        if not self.cnl_fname or not Path(self.cnl_fname).is_file():
+            messagebox.showerror("Error", "Please select a Netlist file first.")
+            self.log_message('ERROR: No Netlist file selected.')
+            return None
+        try:
+            self.log_message('Parsing Netlist file...')
+            self.netlist = self._parse_netlist()
+            self.netlist_mtime = self._file_mtime(self.cnl_fname)
+            self._sort_netlist(self.netlist)
+        except ParseCancelled:
+            self.log_message('Parsing cancelled.')
+            return None
+        except (IOError, OSError, ValueError) as e:
+            self.log_message(f'ERROR: Cannot parse Netlist file: {str(e)}')
+            messagebox.showerror("Error", f"Cannot parse Netlist file:\n\n{str(e)}")
+            return None
+        return self.netlist
+
+    def search_nets(self) -> None:
+        """Search nets by name (substring, or glob if query has * or ?) and log them"""
+        if self._parse_running():  # Search entry <Return> is not disabled
+            return
+        query = self.gui_search.get().strip()
+        if not query:
+            self.log_message('Search: enter a net name or part of it.')
+            return
+        netlist = self.get_netlist()
+        if netlist is None:
+            return
+        mode = 'glob' if any(c in query for c in '*?[') else 'substring'
+        matches = netlist.search_nets(query, mode, ignore_case=True)
+        self.log_message(f"Search '{query}': {len(matches)} nets found")
+        for i in matches[:MAX_SEARCH_RESULTS]:
+            self.log_message(netlist.net2string(i))
+        if len(matches) > MAX_SEARCH_RESULTS:
+            self.log_message(f'... {len(matches) - MAX_SEARCH_RESULTS} more nets not shown')
+
+    def refdes_report(self) -> None:
+        """Write refdes report of all components (refdes pin pin_name net) to file"""
+        if self._parse_running():
+            return
+        netlist = self.get_netlist()
+        if netlist is None:
+            return
+        try:
+            # Written one component at a time (report is not built in memory)
+            self.write2newfile(self.refdes_fname, netlist.iter_refdes_report())
+            self.log_message(f'SUCCESS: Refdes report written to: {Path.cwd() / self.refdes_fname} '
+                             f'({len(netlist.component_index())} components)')
+        except (IOError, OSError) as e:
+            self.log_message(f'ERROR: File I/O error: {str(e)}')
+            messagebox.showerror("File Error", f"Failed to write file:\n\n{str(e)}")
+
     def select_netlist(self) -> None:
         """GUI to select Netlist"""
+        if self._parse_running():
+            return
         fname = askopenfilename(filetypes=(("Cadence Netlist", "pstxnet.dat"),
                                            ("All files", "*.*")))
         if fname != '':
@@ -222,6 +416,7 @@ class CadenceNetListFormat(Frame):
 
     def save_and_exit(self) -> None:
         """save configuration data and exit"""
+        self.cancel_parse()
         self.update_and_save_config()
         self.quit()
 
@@ -299,7 +494,7 @@ class CadenceNetListFormat(Frame):
             messagebox.showerror("Error", f"Failed to open directory:\n{e}")
             self.log_message(f'ERROR: Failed to open directory: {e}')
 
-    def write2newfile(self, fname: str | Path, s: str) -> None:
+    def write2newfile(self, fname: str | Path, s: str | Iterable[str]) -> None:
         """Write data to file with two-phase commit to prevent data loss.
 
         Uses atomic write pattern:
@@ -310,7 +505,7 @@ class CadenceNetListFormat(Frame):
 
         Args:
             fname: Target filename
-            s: Data to write
+            s: Data to write (string, or strings written one by one)
         """
         file_path = Path(fname)
         temp_path = file_path.with_suffix(file_path.suffix + '.tmp')
@@ -357,10 +552,13 @@ class CadenceNetListFormat(Frame):
 
             raise  # Re-raise the exception for caller to handle
 
-    def write2file(self, fname: str | Path, s: str) -> None:
-        """write data to file"""
+    def write2file(self, fname: str | Path, s: str | Iterable[str]) -> None:
+        """write data (string, or strings written one by one) to file"""
         with open(fname, 'w') as f:
-            f.write(s)
+            if isinstance(s, str):
+                f.write(s)
+            else:
+                f.writelines(s)
 
 
 if __name__ == '__main__':
@@ -1,9 +1,15 @@
 """Get arguments from command line"""
 
 from __future__ import annotations
+import re
 from argparse import ArgumentParser, Namespace
 
 from .__init__ import __version__
+from .netlistengines import engine_names
+from .netlistrules import CONNECTOR_PREFIXES, FANOUT_LIMIT
+from .netlistwriters import writer_names
+from .parsediagnostics import MAX_PARSE_ERRORS
+from .netsort import net_sort_modes, node_sort_modes
 
 __prog__ = "cnl_format"
 __description__ = "Format Cadence Allegro Netlist (cnl - Cadence Net List) to readable file"
@@ -11,10 +17,110 @@ __version_string__ = f'{__prog__} {__version__}'
 
 
 def get_args() -> Namespace:
-    """Run Argument Parser and get argument from command line"""
+    """Run Argument Parser and get argument from command line
+
+    Without a command the GUI is started (args.command is None).
+    """
     parser = ArgumentParser(prog=__prog__,
                             description=__description__)
     parser.add_argument('-V', '--version',
                         action='version',
                         version=__version_string__)
+    subparsers = parser.add_subparsers(dest='command', metavar='COMMAND',
+                                       help='run command without GUI')
+
+    peek = subparsers.add_parser('peek',
+                                 help='show Netlist header info without parsing the Netlist',
+                                 description='Show Netlist header info (version, date, time, '
+                                             'size, number of nets) without parsing the Netlist')
+    peek.add_argument('paths', nargs='+', metavar='PATH',
+                      help='Netlist file or directory (searched recursively)')
+    peek.add_argument('-p', '--pattern', default='*.dat',
+                      help='file name pattern for directory search (default: %(default)s)')
+    peek.add_argument('-j', '--jobs', type=int, default=None,
+                      help='number of parallel workers')
+    peek.add_argument('--sample-size', type=int, default=64 * 1024,
+                      help='bytes to sample for net count estimate, 0 - header only (default: %(default)s)')
+
+    fmt = subparsers.add_parser('format',
+                                help='write Netlist report file',
+                                description='Write Netlist report file (same report as GUI)')
+    fmt.add_argument('netlist', metavar='NETLIST',
+                     help='Cadence Netlist file (pstxnet.dat)')
+    fmt.add_argument('-o', '--output', default='NetList.rpt',
+                     help='output report file (default: %(default)s)')
+    fmt.add_argument('--format', default='rpt', metavar='FORMATS',
+                     help=f"comma-separated output formats: {', '.join(writer_names())}; other formats "
+                          "are written next to the report with their suffix (default: %(default)s)")
+    fmt.add_argument('--net', action='append', metavar='GLOB',
+                     help='report only nets matching glob pattern (can be repeated)')
+    fmt.add_argument('--net-regex', metavar='REGEX', type=re.compile,
+                     help='report only nets matching regular expression')
+    fmt.add_argument('--refdes', action='append', metavar='GLOB',
+                     help='report only refdes matching glob pattern (can be repeated)')
+    fmt.add_argument('--refdes-regex', metavar='REGEX', type=re.compile,
+                     help='report only refdes matching regular expression')
+    fmt.add_argument('--extended-nets', metavar='PREFIXES',
+                     help='add extended nets section, comma-separated series part prefixes (e.g. R,L,FB)')
+    fmt.add_argument('--refdes-report', action='store_true',
+                     help='add refdes report section: refdes pin pin_name net of all components '
+                          '(as file: --format refdes)')
+    fmt.add_argument('-j', '--jobs', type=int, default=None,
+                     help='number of worker processes rendering the report')
+    fmt.add_argument('--memory-budget', metavar='MB', type=float,
+                     help='keep pin indexes on disk if they need more memory (MB)')
+    fmt.add_argument('--sort-nets', default='name', choices=net_sort_modes(),
+                     help='net order in report (default: %(default)s)')
+    fmt.add_argument('--sort-nodes', default='file', choices=node_sort_modes(),
+                     help='node order within net (default: %(default)s)')
+    fmt.add_argument('--engine', default='auto', choices=engine_names(),
+                     help='parser engine, auto - selected by file size and CPUs (default: %(default)s)')
+    fmt.add_argument('--max-errors', metavar='N', type=int, default=MAX_PARSE_ERRORS,
+                     help='malformed lines to skip before failing, -1 - no limit (default: %(default)s)')
+    fmt.add_argument('--check', action='store_true',
+                     help='check connectivity rules, add rule check section, exit status 2 on violations')
+    fmt.add_argument('--check-json', metavar='FILE',
+                     help='write rule check result to JSON file (implies --check)')
+    fmt.add_argument('--fanout-limit', metavar='N', type=int, default=FANOUT_LIMIT,
+                     help='max nodes of a signal net for rule check (default: %(default)s)')
+    fmt.add_argument('--connector-prefixes', metavar='PREFIXES', default=','.join(CONNECTOR_PREFIXES),
+                     help='comma-separated connector refdes prefixes for rule check (default: %(default)s)')
+    fmt.add_argument('--plugin', action='append', metavar='NAME',
+                     help='run plugin while parsing and print its report, built-in or installed '
+                          '(entry point group cadence_netlist_format.plugins), e.g. rules')
+
+    pins = subparsers.add_parser('pins',
+                                 help='find pins by pin name',
+                                 description='Find pins by pin name, print: refdes pin pin_name net')
+    pins.add_argument('netlist', metavar='NETLIST',
+                      help='Cadence Netlist file (pstxnet.dat)')
+    pins.add_argument('name', metavar='PIN_NAME',
+                      help='pin name (e.g. RESET_N) or pin name prefix with --prefix')
+    pins.add_argument('--prefix', action='store_true',
+                      help='find pin names starting with PIN_NAME')
+    pins.add_argument('-i', '--ignore-case', action='store_true',
+                      help='compare pin names case-insensitively')
+    pins.add_argument('--engine', default='auto', choices=engine_names(),
+                      help='parser engine, auto - selected by file size and CPUs (default: %(default)s)')
+
+    fingerprint = subparsers.add_parser('fingerprint',
+                                        help='print connectivity fingerprint',
+                                        description='Print connectivity fingerprint: hash of nets as sets of '
+                                                    '(refdes, pin), independent of net names, order and formatting')
+    fingerprint.add_argument('paths', nargs='+', metavar='NETLIST',
+                             help='Cadence Netlist file, or fingerprint file (*.fingerprint.json)')
+    fingerprint.add_argument('--save', action='store_true',
+                             help='write fingerprint file next to parsed Netlist (NETLIST_STEM.fingerprint.json)')
+
+    compare = subparsers.add_parser('compare',
+                                    help='compare connectivity of two Netlists by fingerprint',
+                                    description='Compare connectivity of two Netlists by fingerprint '
+                                                '(exit status: 0 - equivalent, 2 - different, 1 - error); up-to-date '
+                                                'fingerprint files are used instead of parsing')
+    compare.add_argument('first', metavar='NETLIST1',
+                         help='Cadence Netlist file, or fingerprint file (*.fingerprint.json)')
+    compare.add_argument('second', metavar='NETLIST2',
+                         help='Cadence Netlist file, or fingerprint file (*.fingerprint.json)')
+    compare.add_argument('--save', action='store_true',
+                         help='write fingerprint files of parsed Netlists')
     return parser.parse_args()
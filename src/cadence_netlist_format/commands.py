@@ -0,0 +1,167 @@
+"""Commands of command line interface (run without GUI)"""
+
+from __future__ import annotations
+import logging
+import re
+from argparse import Namespace
+from typing import Optional
+
+from .allegronetlist import AllegroNetList, NameFilter
+from .netlistfingerprint import FingerprintPlugin, load_fingerprint
+from .netlistheader import scan_headers
+from .netlistplugins import load_plugin
+from .netlistrules import RuleCheckPlugin, default_rules
+from .netlistwriters import output_fnames
+
+
+def _name_filter(globs: Optional[list[str]], regex: Optional[re.Pattern]) -> Optional[NameFilter]:
+    """Returns name filter from command line glob patterns or regular expression"""
+    return regex if regex is not None else globs
+
+
+def _megabytes(size: Optional[float]) -> Optional[int]:
+    """Returns size in bytes from command line size in MB"""
+    return None if size is None else int(size * 1024 * 1024)
+
+
+def peek_command(args: Namespace) -> int:
+    """Print header info of Netlist files
+
+    Returns:
+        Exit status: 0 - all headers are valid, 1 - invalid header found
+    """
+    headers = scan_headers(args.paths, args.pattern, args.sample_size, args.jobs)
+    for header in headers:
+        print(header)
+    return 0 if all(header.valid for header in headers) else 1
+
+
+def format_command(args: Namespace) -> int:
+    """Write Netlist report file
+
+    Rule check and plugins run while the Netlist is parsed.
+
+    Returns:
+        Exit status: 0 - report written, 2 - report written, rule check found violations
+    """
+    formats = [name for name in args.format.split(',') if name]
+    output_fnames(args.output, formats)  # Check format names before parsing
+    partial = any(value is not None for value in (args.net, args.net_regex, args.refdes, args.refdes_regex))
+    if 'fingerprint' in formats and partial:
+        raise ValueError('Format fingerprint cannot be used with --net/--net-regex/--refdes/--refdes-regex: '
+                         'sidecar file is the fingerprint of the whole Netlist file')
+    plugins = [load_plugin(name) for name in args.plugin or []]
+    if 'fingerprint' in formats:
+        plugins.append(FingerprintPlugin())  # Computed while parsing
+    rule_check = None
+    if args.check or args.check_json is not None:
+        prefixes = [prefix for prefix in args.connector_prefixes.split(',') if prefix]
+        rule_check = RuleCheckPlugin(default_rules(args.fanout_limit, prefixes))
+    netlist = AllegroNetList(args.netlist,
+                             net_filter=_name_filter(args.net, args.net_regex),
+                             refdes_filter=_name_filter(args.refdes, args.refdes_regex),
+                             memory_budget=_megabytes(args.memory_budget),
+                             engine=args.engine,
+                             max_errors=None if args.max_errors < 0 else args.max_errors,
+                             plugins=plugins + ([rule_check] if rule_check is not None else []))
+    if args.sort_nets != 'name':
+        netlist.sort_nets(args.sort_nets)
+    if args.sort_nodes != 'file':
+        netlist.sort_nodes(args.sort_nodes)
+    extended_nets = None
+    if args.extended_nets is not None:
+        extended_nets = [prefix for prefix in args.extended_nets.split(',') if prefix]
+    rule_report = None
+    if rule_check is not None:
+        rule_report = rule_check.rule_report
+        if args.check_json is not None:
+            rule_report.write_json(args.check_json)
+    if formats == ['rpt']:
+        netlist.net_list2file(args.output, extended_nets=extended_nets, jobs=args.jobs, rule_report=rule_report,
+                              refdes_report=args.refdes_report)
+        print(f'Wrote Netlist report file: {args.output} ({netlist.net_list_length()} nets)')
+    else:
+        # One pass over nets feeds all writers (report rendered in a writer thread, --jobs not used)
+        outputs = output_fnames(args.output, formats)
+        netlist.write_outputs(outputs, extended_nets=extended_nets, rule_report=rule_report,
+                              refdes_report=args.refdes_report)
+        for name, fname in outputs.items():
+            print(f'Wrote Netlist {name} file: {fname} ({netlist.net_list_length()} nets)')
+    for plugin in plugins:
+        text = plugin.report()
+        if text:
+            print(text, end='' if text.endswith('\n') else '\n')
+    if rule_report is not None:
+        print(f'Rule check: {len(rule_report.violations)} violations')
+        if rule_report:
+            return 2
+    return 0
+
+
+def pins_command(args: Namespace) -> int:
+    """Print pins with pin name
+
+    Returns:
+        Exit status: 0 - pins found, 1 - no pins found
+    """
+    netlist = AllegroNetList(args.netlist, engine=args.engine)
+    pins = netlist.find_pins(args.name, prefix=args.prefix, ignore_case=args.ignore_case)
+    for refdes, pin, net in pins:
+        print(f'{refdes} {pin} {netlist.get_refdes_pin_name(refdes, pin)} {net}')
+    return 0 if pins else 1
+
+
+def fingerprint_command(args: Namespace) -> int:
+    """Print connectivity fingerprints: fingerprint nets pins path
+
+    Returns:
+        Exit status
+    """
+    for path in args.paths:
+        fingerprint, _ = load_fingerprint(path, save=args.save)
+        print(f'{fingerprint.hex} {fingerprint.nets} {fingerprint.pins} {path}')
+    return 0
+
+
+def compare_command(args: Namespace) -> int:
+    """Compare connectivity of two Netlists by fingerprint
+
+    Returns:
+        Exit status: 0 - equivalent, 2 - different (1 - error, see run_command)
+    """
+    fingerprints = []
+    for path in (args.first, args.second):
+        fingerprint, source = load_fingerprint(path, save=args.save)
+        print(f'{path}: {fingerprint} [{source}]')
+        fingerprints.append(fingerprint)
+    if fingerprints[0] == fingerprints[1]:
+        print('Connectivity: equivalent')
+        return 0
+    print('Connectivity: different')
+    return 2
+
+
+COMMANDS = {
+    'peek': peek_command,
+    'format': format_command,
+    'pins': pins_command,
+    'fingerprint': fingerprint_command,
+    'compare': compare_command,
+}
+
+
+def run_command(args: Namespace) -> int:
+    """Run command selected in command line arguments
+
+    Args:
+        args: parsed command line arguments (args.command - command name)
+
+    Returns:
+        Exit status of command, 1 if it failed (file cannot be read, invalid Netlist)
+    """
+    logging.basicConfig(level=logging.WARNING, format='%(levelname)s: %(message)s')
+    try:
+        return COMMANDS[args.command](args)
+    except (IOError, OSError, ValueError) as e:
+        logging.getLogger(__name__).error(str(e))
+        return 1
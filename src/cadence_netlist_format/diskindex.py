@@ -0,0 +1,191 @@
+#!/usr/bin/env python
+
+"""Disk-backed (refdes, pin) indexes for Netlists larger than the memory budget
+
+pin_name_index and net_name_index of AllegroNetList are dicts with one
+entry per pin. When their estimated size exceeds the memory budget, both
+are kept in one temporary SQLite file instead:
+    pins: refdes, pin (primary key), net_name, pin_name
+DiskIndex is a dict-like view of one column with an LRU read cache in
+front, so get_refdes_pin_name()/get_net_name4refdes_pin() work unchanged.
+"""
+
+from __future__ import annotations
+import logging
+import os
+import sqlite3
+import tempfile
+import weakref
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from itertools import islice
+from typing import Iterable, Iterator, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .netrecords import Net
+
+
+# Configure module logger
+logger = logging.getLogger(__name__)
+
+INDEX_BYTES_PER_PIN = 250   # Estimated memory of both dict indexes per pin
+CACHE_SIZE = 65536          # Cached lookups per index
+BATCH_SIZE = 10000          # Rows per executemany() call
+COLUMNS = ('net_name', 'pin_name')
+_MISSING = object()
+
+_SCHEMA = """
+CREATE TABLE pins (refdes TEXT NOT NULL,
+                   pin TEXT NOT NULL,
+                   net_name TEXT,
+                   pin_name TEXT,
+                   PRIMARY KEY (refdes, pin)) WITHOUT ROWID
+"""
+
+# Later nodes win, as with dict assignment; pin name is replaced only by a pin name
+_UPSERT = """
+INSERT INTO pins VALUES (?, ?, ?, ?)
+ON CONFLICT (refdes, pin) DO UPDATE SET net_name = excluded.net_name,
+                                        pin_name = COALESCE(excluded.pin_name, pin_name)
+"""
+
+
+def estimate_index_size(pin_count: int) -> int:
+    """Returns estimated memory (bytes) of in-memory pin_name_index and net_name_index"""
+    return pin_count * INDEX_BYTES_PER_PIN
+
+
+def _close_store(con: sqlite3.Connection, path: str) -> None:
+    con.close()
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+class DiskIndexStore:
+    """Temporary SQLite file with indexes of all pins (removed on close or when garbage collected)
+
+    Attributes:
+        path: database file name
+    """
+
+    def __init__(self, directory: Optional[str] = None) -> None:
+        """Create empty store
+
+        Args:
+            directory: directory of temporary file (default: system temp directory)
+        """
+        fd, self.path = tempfile.mkstemp(suffix='.db', prefix='cnl_index_', dir=directory)
+        os.close(fd)
+        # Read-only after load(); the GUI may look up from another thread
+        self.con = sqlite3.connect(self.path, check_same_thread=False)
+        self.con.execute('PRAGMA journal_mode = OFF')  # Temporary data: no crash recovery needed
+        self.con.execute('PRAGMA synchronous = OFF')
+        self.con.execute(_SCHEMA)
+        self._finalizer = weakref.finalize(self, _close_store, self.con, self.path)
+
+    def load(self, net_list: Iterable[Net]) -> None:
+        """Insert all pins of net_list (one transaction, batched)"""
+        rows = ((node.refdes, node.pin, net.name, node.pin_name)
+                for net in net_list for node in net.nodes)
+        with self.con:
+            while True:
+                batch = list(islice(rows, BATCH_SIZE))
+                if not batch:
+                    break
+                self.con.executemany(_UPSERT, batch)
+
+    def close(self) -> None:
+        """Close database and remove the file"""
+        self._finalizer()
+
+
+class DiskIndex(MutableMapping):
+    """Dict-like (refdes, pin) -> column value view of DiskIndexStore
+
+    Pins without value in the column (NULL pin name) are not in the mapping.
+    The LRU cache is a plain OrderedDict: functools.lru_cache of a bound method
+    would be a reference cycle, keeping the store (connection and file) alive
+    until a cyclic garbage collection.
+
+    Attributes:
+        hits: lookups answered from cache
+        misses: lookups queried from database
+    """
+
+    def __init__(self, store: DiskIndexStore, column: str, cache_size: int = CACHE_SIZE) -> None:
+        """
+        Args:
+            store: index store
+            column: 'net_name' or 'pin_name'
+            cache_size: number of cached lookups (LRU)
+        """
+        if column not in COLUMNS:
+            raise ValueError(f"Unknown index column '{column}' (valid: {', '.join(COLUMNS)})")
+        self.store = store
+        self.column = column
+        self._select = f'SELECT {column} FROM pins WHERE refdes = ? AND pin = ?'
+        self.cache_size = cache_size
+        self._cache: OrderedDict[tuple[str, str], object] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _lookup(self, refdes: str, pin: str) -> object:
+        """Returns column value of pin, _MISSING if pin has no value (cached)"""
+        key = (refdes, pin)
+        cache = self._cache
+        try:
+            value = cache[key]
+        except KeyError:
+            pass
+        else:
+            cache.move_to_end(key)
+            self.hits += 1
+            return value
+        self.misses += 1
+        row = self.store.con.execute(self._select, key).fetchone()
+        value = _MISSING if row is None or row[0] is None else row[0]
+        cache[key] = value
+        if len(cache) > self.cache_size:
+            cache.popitem(last=False)
+        return value
+
+    def get(self, key: tuple[str, str], default: object = None) -> object:
+        value = self._lookup(*key)
+        return default if value is _MISSING else value
+
+    def __getitem__(self, key: tuple[str, str]) -> str:
+        value = self._lookup(*key)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, tuple) and len(key) == 2 and self._lookup(*key) is not _MISSING
+
+    def __setitem__(self, key: tuple[str, str], value: str) -> None:
+        with self.store.con:
+            self.store.con.execute(
+                f'INSERT INTO pins (refdes, pin, {self.column}) VALUES (?, ?, ?) '
+                f'ON CONFLICT (refdes, pin) DO UPDATE SET {self.column} = excluded.{self.column}',
+                (key[0], key[1], value))
+        self._cache.clear()
+
+    def __delitem__(self, key: tuple[str, str]) -> None:
+        if key not in self:
+            raise KeyError(key)
+        with self.store.con:
+            self.store.con.execute(f'UPDATE pins SET {self.column} = NULL WHERE refdes = ? AND pin = ?', key)
+        self._cache.clear()
+
+    def __iter__(self) -> Iterator[tuple[str, str]]:
+        rows = self.store.con.execute(f'SELECT refdes, pin FROM pins WHERE {self.column} IS NOT NULL')
+        return iter(rows.fetchall())
+
+    def __len__(self) -> int:
+        return self.store.con.execute(f'SELECT COUNT(*) FROM pins WHERE {self.column} IS NOT NULL').fetchone()[0]
+
+    def items(self) -> list[tuple[tuple[str, str], str]]:
+        rows = self.store.con.execute(f'SELECT refdes, pin, {self.column} FROM pins WHERE {self.column} IS NOT NULL')
+        return [((refdes, pin), value) for refdes, pin, value in rows]
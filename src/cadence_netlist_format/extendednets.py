@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+
+"""Extended nets of Cadence Allegro Netlist
+
+Extended net - group of nets joined through 2-pin series parts (resistors,
+zero-ohm links, inductors, ferrite beads, ...). Groups are computed with a
+union-find (disjoint set) structure in one pass over the component index.
+"""
+
+from __future__ import annotations
+from array import array
+from typing import Iterable, TYPE_CHECKING
+
+from .netlistgraph import DEFAULT_PASS_THROUGH, refdes_prefix
+
+if TYPE_CHECKING:
+    from .allegronetlist import AllegroNetList
+
+
+class UnionFind:
+    """Disjoint set of integer items (union by size, path halving)
+
+    Attributes:
+        parent: parent item of each item (root items point to themselves)
+        size: set size of each root item
+    """
+
+    def __init__(self, count: int) -> None:
+        """Create count single-item sets
+
+        Args:
+            count: number of items
+        """
+        self.parent = array('i', range(count))
+        self.size = array('i', [1]) * count
+
+    def find(self, item: int) -> int:
+        """Returns root item of item set"""
+        parent = self.parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, a: int, b: int) -> bool:
+        """Join sets of a and b
+
+        Returns:
+            True if sets were joined, False if a and b were already in one set
+        """
+        root_a = self.find(a)
+        root_b = self.find(b)
+        if root_a == root_b:
+            return False
+        if self.size[root_a] < self.size[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        self.size[root_a] += self.size[root_b]
+        return True
+
+    def groups(self) -> list[list[int]]:
+        """Returns sets with more than one item (items ascending, sets by first item)"""
+        members: dict[int, list[int]] = {}
+        for item in range(len(self.parent)):
+            root = self.find(item)
+            if self.size[root] > 1:
+                members.setdefault(root, []).append(item)
+        return list(members.values())
+
+
+def find_extended_nets(netlist: AllegroNetList,
+                       prefixes: Iterable[str] = DEFAULT_PASS_THROUGH,
+                       refdes: Iterable[str] = ()) -> list[list[int]]:
+    """Returns extended nets of Netlist
+
+    Args:
+        netlist: parsed Netlist
+        prefixes: refdes prefixes of series parts (e.g. 'R' for R1, R2, ...)
+        refdes: explicit refdes of series parts
+
+    Returns:
+        Groups of net indexes (only groups with two or more nets)
+    """
+    prefixes = frozenset(prefixes)
+    explicit = frozenset(refdes)
+    union_find = UnionFind(netlist.net_list_length())
+    for part, pins in netlist.component_index().items():
+        if len(pins) != 2:
+            continue
+        if part in explicit or refdes_prefix(part) in prefixes:
+            union_find.union(pins[0][1], pins[1][1])
+    return union_find.groups()
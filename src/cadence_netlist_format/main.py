@@ -1,12 +1,18 @@
 """Run point"""
 
 from __future__ import annotations
+import sys
 
-from .cadence_netlist_format import CadenceNetListFormat
 from .commandlinearg import get_args
+from .commands import run_command
 
 
 def main() -> None:
     """Run point for the application script"""
-    get_args()
-    CadenceNetListFormat().mainloop()
+    args = get_args()
+    if args.command is None:
+        # GUI is imported only when needed (tkinter may be missing on build servers)
+        from .cadence_netlist_format import CadenceNetListFormat
+        CadenceNetListFormat().mainloop()
+    else:
+        sys.exit(run_command(args))
@@ -0,0 +1,197 @@
+#!/usr/bin/env python
+
+"""Columnar (NumPy) representation of Cadence Allegro Netlist pin table
+
+Every pin of the Netlist is one row of four int32 columns:
+    net_id:      index in nets (and in AllegroNetList.net_list)
+    refdes_id:   index in refdes
+    pin_id:      index in pins (pin numbers)
+    pin_name_id: index in pin_names, -1 if the node has no pin name
+
+String tables (nets, refdes, pins, pin_names) are dictionary-encoded:
+each distinct string is stored once. Rows are grouped by net in net_list
+order, so net_offsets[i]:net_offsets[i + 1] is the row range of net i.
+
+NumPy is an optional dependency: pip install cadence_netlist_format[numpy]
+"""
+
+from __future__ import annotations
+from array import array
+from pathlib import Path
+from typing import Any, TYPE_CHECKING
+
+from .netrecords import Net, Node
+
+if TYPE_CHECKING:
+    from .allegronetlist import AllegroNetList
+
+
+COLUMNS = ('net_id', 'refdes_id', 'pin_id', 'pin_name_id')
+STRING_TABLES = ('nets', 'refdes', 'pins', 'pin_names')
+
+
+def _import_numpy() -> Any:
+    """Import NumPy or raise ImportError with installation hint"""
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError('NumPy is required for columnar Netlist data: '
+                          'pip install cadence_netlist_format[numpy]') from e
+    return numpy
+
+
+class NetListArrays:
+    """Columnar Netlist pin table
+
+    Attributes:
+        net_id, refdes_id, pin_id, pin_name_id: per-pin int32 columns
+        net_offsets: int64 row offsets of each net (length: number of nets + 1)
+        nets, refdes, pins, pin_names: string tables (NumPy unicode arrays)
+        version, date, time, fname: Netlist info
+    """
+
+    def __init__(self, columns: dict, tables: dict, net_offsets: Any,
+                 version: str = '', date: str = '', time: str = '', fname: str = '') -> None:
+        """Create pin table from NumPy arrays
+
+        Args:
+            columns: per-pin arrays, keys: COLUMNS
+            tables: string tables, keys: STRING_TABLES
+            net_offsets: row offsets of each net
+            version, date, time, fname: Netlist info
+        """
+        self.net_id = columns['net_id']
+        self.refdes_id = columns['refdes_id']
+        self.pin_id = columns['pin_id']
+        self.pin_name_id = columns['pin_name_id']
+        self.nets = tables['nets']
+        self.refdes = tables['refdes']
+        self.pins = tables['pins']
+        self.pin_names = tables['pin_names']
+        self.net_offsets = net_offsets
+        self.version = version
+        self.date = date
+        self.time = time
+        self.fname = fname
+
+    @classmethod
+    def from_netlist(cls, netlist: AllegroNetList) -> NetListArrays:
+        """Encode net_list as columnar arrays (single pass over net_list)
+
+        Args:
+            netlist: parsed Netlist
+
+        Returns:
+            NetListArrays
+        """
+        np = _import_numpy()
+        refdes_ids: dict[str, int] = {}
+        pin_ids: dict[str, int] = {}
+        pin_name_ids: dict[str, int] = {}
+        columns = {name: array('i') for name in COLUMNS}
+        net_id_column = columns['net_id']
+        refdes_column = columns['refdes_id']
+        pin_column = columns['pin_id']
+        pin_name_column = columns['pin_name_id']
+        net_offsets = array('q', [0])
+
+        for net_id, net in enumerate(netlist.net_list):
+            for node in net.nodes:
+                net_id_column.append(net_id)
+                refdes_column.append(refdes_ids.setdefault(node.refdes, len(refdes_ids)))
+                pin_column.append(pin_ids.setdefault(node.pin, len(pin_ids)))
+                if node.pin_name is not None:
+                    pin_name_column.append(pin_name_ids.setdefault(node.pin_name, len(pin_name_ids)))
+                else:
+                    pin_name_column.append(-1)
+            net_offsets.append(len(net_id_column))
+
+        # dict preserves insertion order, so keys are ordered by id
+        tables = {'nets': np.array([net.name for net in netlist.net_list], dtype=str),
+                  'refdes': np.array(list(refdes_ids), dtype=str),
+                  'pins': np.array(list(pin_ids), dtype=str),
+                  'pin_names': np.array(list(pin_name_ids), dtype=str)}
+        arrays = {name: np.frombuffer(columns[name], dtype=np.int32).copy() for name in COLUMNS}
+        return cls(arrays, tables, np.frombuffer(net_offsets, dtype=np.int64).copy(),
+                   str(netlist.version), str(netlist.date), str(netlist.time), netlist.fname)
+
+    def __len__(self) -> int:
+        """Returns number of pins (rows)"""
+        return len(self.net_id)
+
+    def as_structured(self) -> Any:
+        """Returns pin table as NumPy structured array (one record per pin)"""
+        np = _import_numpy()
+        table = np.empty(len(self), dtype=[(name, np.int32) for name in COLUMNS])
+        for name in COLUMNS:
+            table[name] = getattr(self, name)
+        return table
+
+    def net_fanout(self) -> Any:
+        """Returns number of pins of each net (indexed by net_id)"""
+        np = _import_numpy()
+        return np.diff(self.net_offsets)
+
+    def refdes_pin_count(self) -> Any:
+        """Returns number of pins of each refdes (indexed by refdes_id)"""
+        np = _import_numpy()
+        return np.bincount(self.refdes_id, minlength=len(self.refdes))
+
+    def save(self, fname: str | Path) -> None:
+        """Save pin table to compressed .npz file
+
+        Args:
+            fname: output file name
+
+        Raises:
+            IOError: If file write fails
+        """
+        np = _import_numpy()
+        info = np.array([self.version, self.date, self.time, self.fname], dtype=str)
+        arrays = {name: getattr(self, name) for name in COLUMNS + STRING_TABLES}
+        with open(fname, 'wb') as f:
+            np.savez_compressed(f, info=info, net_offsets=self.net_offsets, **arrays)
+
+    @classmethod
+    def load(cls, fname: str | Path) -> NetListArrays:
+        """Load pin table from .npz file written by save()
+
+        Args:
+            fname: .npz file name
+
+        Returns:
+            NetListArrays
+
+        Raises:
+            IOError: If file cannot be read
+            ValueError: If file is not a Netlist pin table
+        """
+        np = _import_numpy()
+        with np.load(fname, allow_pickle=False) as data:
+            missing = [name for name in ('info', 'net_offsets') + COLUMNS + STRING_TABLES
+                       if name not in data.files]
+            if missing:
+                raise ValueError(f"File '{fname}' is not a Netlist pin table (missing: {', '.join(missing)})")
+            version, date, time, source = (str(v) for v in data['info'])
+            columns = {name: data[name] for name in COLUMNS}
+            tables = {name: data[name] for name in STRING_TABLES}
+            net_offsets = data['net_offsets']
+        return cls(columns, tables, net_offsets, version, date, time, source)
+
+    def to_net_list(self) -> list:
+        """Decode pin table to AllegroNetList.net_list format"""
+        refdes = self.refdes.tolist()
+        pins = self.pins.tolist()
+        pin_names = self.pin_names.tolist()
+        refdes_id = self.refdes_id.tolist()
+        pin_id = self.pin_id.tolist()
+        pin_name_id = self.pin_name_id.tolist()
+        offsets = self.net_offsets.tolist()
+        net_list = []
+        for i, name in enumerate(self.nets.tolist()):
+            nodes = []
+            for row in range(offsets[i], offsets[i + 1]):
+                pin_name = pin_names[pin_name_id[row]] if pin_name_id[row] >= 0 else None
+                nodes.append(Node(refdes[refdes_id[row]], pins[pin_id[row]], pin_name))
+            net_list.append(Net(name, nodes))
+        return net_list
@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+
+"""In-process cache of parsed Netlists
+
+Entries are keyed by (absolute path, mtime, size), so a changed file is
+parsed again. Concurrent requests for the same file (from threads or asyncio
+tasks) share one parse: the first request starts it, the others wait for
+the same future; cancelling one waiting task does not cancel the parse for
+the others. The Netlist keeps the file name of the request that parsed it.
+Cached Netlists are shared objects - do not modify them (e.g. with
+sort_nets()) if other users may hold them.
+"""
+
+from __future__ import annotations
+import asyncio
+import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Optional
+
+from .allegronetlist import AllegroNetList
+
+
+# Configure module logger
+logger = logging.getLogger(__name__)
+
+MAX_ENTRIES = 8   # Parsed Netlists kept in cache
+MAX_WORKERS = 4   # Threads of cache executor (async loads without executor)
+
+CacheKey = tuple[str, int, int]
+
+
+def cache_key(fname: str | Path) -> CacheKey:
+    """Returns cache key of file: (absolute path, mtime in ns, size)
+
+    Raises:
+        OSError: If file cannot be accessed
+    """
+    path = os.path.abspath(fname)
+    st = os.stat(path)
+    return path, st.st_mtime_ns, st.st_size
+
+
+class NetListCache:
+    """LRU cache of parsed Netlists with coalescing of in-flight parses
+
+    Attributes:
+        max_entries: max number of cached Netlists
+        hits: requests served from cache or by joining a running parse
+        misses: requests that started a parse
+    """
+
+    def __init__(self, max_entries: int = MAX_ENTRIES,
+                 loader: Callable[[str | Path], AllegroNetList] = AllegroNetList) -> None:
+        """
+        Args:
+            max_entries: max number of cached Netlists
+            loader: function parsing Netlist file (default: AllegroNetList)
+        """
+        self.max_entries = max_entries
+        self.loader = loader
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[CacheKey, AllegroNetList] = OrderedDict()
+        self._in_flight: dict[CacheKey, Future] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Remove all cached Netlists (running parses are not affected)"""
+        with self._lock:
+            self._entries.clear()
+
+    def load(self, fname: str | Path, executor: Optional[Executor] = None) -> Future:
+        """Returns future of parsed Netlist (cached, running, or new parse)
+
+        Args:
+            fname: Netlist file name
+            executor: executor of new parse (default: None, parse in current thread
+                      before returning)
+
+        Raises:
+            OSError: If file cannot be accessed
+        """
+        key = cache_key(fname)
+        with self._lock:
+            netlist = self._entries.get(key)
+            if netlist is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                future: Future = Future()
+                future.set_result(netlist)
+                return future
+            future = self._in_flight.get(key)
+            if future is not None:
+                self.hits += 1
+                return future
+            self.misses += 1
+            if executor is not None:
+                future = executor.submit(self.loader, fname)
+            else:
+                future = Future()
+                future.set_running_or_notify_cancel()
+            self._in_flight[key] = future
+        future.add_done_callback(lambda done: self._finish(key, done))
+
+        if executor is None:
+            try:
+                future.set_result(self.loader(fname))
+            except BaseException as e:
+                future.set_exception(e)
+        return future
+
+    def _finish(self, key: CacheKey, future: Future) -> None:
+        """Move finished parse from in-flight to cache (failed parses are not cached)"""
+        with self._lock:
+            self._in_flight.pop(key, None)
+            if future.cancelled() or future.exception() is not None:
+                return
+            self._entries[key] = future.result()
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get(self, fname: str | Path) -> AllegroNetList:
+        """Returns parsed Netlist (parses in current thread if not cached or running)
+
+        Raises:
+            OSError: If file cannot be accessed or read
+            ValueError: If file is not a valid Netlist
+        """
+        return self.load(fname).result()
+
+    async def aget(self, fname: str | Path, executor: Optional[Executor] = None) -> AllegroNetList:
+        """Returns parsed Netlist without blocking the event loop
+
+        Cancelling the awaiting task does not cancel the parse (other tasks
+        may wait for it), the parsed Netlist is cached.
+
+        Args:
+            fname: Netlist file name
+            executor: executor of new parse (default: cache thread pool)
+
+        Raises:
+            OSError: If file cannot be accessed or read
+            ValueError: If file is not a valid Netlist
+        """
+        if executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=MAX_WORKERS,
+                                                        thread_name_prefix='netlist_cache')
+                executor = self._executor
+        return await asyncio.shield(asyncio.wrap_future(self.load(fname, executor)))
+
+
+# Cache used by AllegroNetList.aload()
+netlist_cache = NetListCache()
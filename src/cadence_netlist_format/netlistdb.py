@@ -0,0 +1,179 @@
+#!/usr/bin/env python
+
+"""Export Cadence Allegro Netlist data to SQLite database and load it back
+
+Database layout:
+    info:    key/value pairs (schema version, Netlist version, date, time, file name)
+    nets:    net_id (index in AllegroNetList.net_list), net name
+    pins:    net_id, refdes, pin, pin_name (pin order within a net = rowid order)
+    pin_net: view joining pins and nets - (refdes, pin, pin_name, net)
+
+Example query:
+    SELECT net FROM pin_net WHERE refdes = 'DD68' AND pin = '40';
+"""
+
+from __future__ import annotations
+import logging
+import os
+import sqlite3
+from itertools import islice
+from pathlib import Path
+from typing import Iterator, TYPE_CHECKING
+
+from .netrecords import Net, Node
+
+if TYPE_CHECKING:
+    from .allegronetlist import AllegroNetList
+
+
+# Configure module logger
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = '1'
+BATCH_SIZE = 10000  # Rows per executemany() call
+_SQLITE_ERROR = 1   # Primary result code of SQL errors (e.g. 'no such table': not a Netlist database)
+
+_SCHEMA = """
+CREATE TABLE info (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE nets (net_id INTEGER PRIMARY KEY, name TEXT NOT NULL);
+CREATE TABLE pins (net_id INTEGER NOT NULL REFERENCES nets (net_id),
+                   refdes TEXT NOT NULL,
+                   pin TEXT NOT NULL,
+                   pin_name TEXT);
+CREATE VIEW pin_net AS
+    SELECT pins.refdes, pins.pin, pins.pin_name, nets.name AS net
+    FROM pins JOIN nets USING (net_id);
+"""
+
+# Indexes are created after bulk insert (faster than maintaining them per row)
+_INDEXES = """
+CREATE INDEX idx_nets_name ON nets (name);
+CREATE INDEX idx_pins_refdes ON pins (refdes, pin);
+CREATE INDEX idx_pins_net ON pins (net_id);
+CREATE INDEX idx_pins_pin_name ON pins (pin_name);
+"""
+
+
+def _pin_rows(netlist: AllegroNetList) -> Iterator[tuple]:
+    """Yield (net_id, refdes, pin, pin_name) rows from net_list"""
+    for net_id, net in enumerate(netlist.net_list):
+        for node in net.nodes:
+            yield (net_id, node.refdes, node.pin, node.pin_name)
+
+
+def _executemany_batched(con: sqlite3.Connection, sql: str, rows: Iterator[tuple]) -> None:
+    """Insert rows with executemany() in batches of BATCH_SIZE"""
+    while True:
+        batch = list(islice(rows, BATCH_SIZE))
+        if not batch:
+            break
+        con.executemany(sql, batch)
+
+
+def net_list2sqlite(netlist: AllegroNetList, fname: str | Path) -> None:
+    """Write Netlist data to SQLite database in a single transaction
+
+    The database is written to a temporary file next to fname, which then
+    replaces fname: a failed write leaves an existing file unchanged.
+
+    Args:
+        netlist: parsed Netlist
+        fname: output database file name (existing file is replaced)
+
+    Raises:
+        IOError: If database write fails
+    """
+    db_path = Path(fname)
+    temp_path = db_path.with_name(db_path.name + '.tmp')
+    try:
+        if temp_path.exists():
+            temp_path.unlink()
+        con = sqlite3.connect(temp_path)
+        try:
+            # Fresh file: journal is not needed, data is committed once at the end
+            con.execute('PRAGMA journal_mode = OFF')
+            con.execute('PRAGMA synchronous = OFF')
+            with con:
+                con.executescript('BEGIN;' + _SCHEMA)
+                info = [('schema_version', SCHEMA_VERSION),
+                        ('version', str(netlist.version)),
+                        ('date', str(netlist.date)),
+                        ('time', str(netlist.time)),
+                        ('fname', netlist.fname)]
+                con.executemany('INSERT INTO info VALUES (?, ?)', info)
+                nets = ((net_id, net.name) for net_id, net in enumerate(netlist.net_list))
+                _executemany_batched(con, 'INSERT INTO nets VALUES (?, ?)', nets)
+                _executemany_batched(con, 'INSERT INTO pins VALUES (?, ?, ?, ?)', _pin_rows(netlist))
+                for statement in _INDEXES.strip().splitlines():
+                    con.execute(statement)
+        finally:
+            con.close()
+        os.replace(temp_path, db_path)
+    except (sqlite3.Error, OSError) as e:
+        try:
+            temp_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+        error_msg = f"Failed to write database file '{fname}': {e}"
+        logger.error(error_msg)
+        raise IOError(error_msg)
+
+
+def _is_format_error(e: sqlite3.Error) -> bool:
+    """True if error means the file is not a Netlist database (not an access error: locked, I/O)"""
+    if not isinstance(e, sqlite3.OperationalError):
+        return isinstance(e, sqlite3.DatabaseError)  # Not a database, corrupted
+    code = getattr(e, 'sqlite_errorcode', None)  # Python 3.11+
+    if code is not None:
+        return code & 0xff == _SQLITE_ERROR
+    return str(e).startswith('no such')
+
+
+def sqlite2net_list(fname: str | Path, cls: type[AllegroNetList]) -> AllegroNetList:
+    """Read Netlist data from SQLite database written by net_list2sqlite()
+
+    Args:
+        fname: database file name
+        cls: AllegroNetList class (or subclass) to create
+
+    Returns:
+        AllegroNetList with net_list and indexes restored
+
+    Raises:
+        IOError: If database cannot be read
+        ValueError: If file is not a Netlist database
+    """
+    if not Path(fname).is_file():
+        error_msg = f"Cannot read database file '{fname}': file not found"
+        logger.error(error_msg)
+        raise IOError(error_msg)
+    try:
+        # Read-only URI: file name percent-encoded ('#', '?' and '%' are URI syntax)
+        con = sqlite3.connect(f'{Path(fname).resolve().as_uri()}?mode=ro', uri=True)
+        try:
+            info = dict(con.execute('SELECT key, value FROM info'))
+            if info.get('schema_version') != SCHEMA_VERSION:
+                raise ValueError(f"Unsupported Netlist database schema version: {info.get('schema_version')}")
+            netlist = cls._new_empty(info.get('fname', str(fname)))
+            netlist.version = info.get('version', 0)
+            netlist.date = info.get('date', 0)
+            netlist.time = info.get('time', 0)
+
+            net_list = [Net(name) for _, name in con.execute('SELECT net_id, name FROM nets ORDER BY net_id')]
+            rows = con.execute('SELECT net_id, refdes, pin, pin_name FROM pins ORDER BY rowid')
+            for net_id, refdes, pin, pin_name in rows:
+                net_list[net_id].nodes.append(Node(refdes, pin, pin_name))
+        finally:
+            con.close()
+    except sqlite3.Error as e:
+        if _is_format_error(e):
+            error_msg = f"File '{fname}' is not a Netlist database: {e}"
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+        error_msg = f"Cannot read database file '{fname}': {e}"
+        logger.error(error_msg)
+        raise IOError(error_msg)
+
+    netlist.net_list = net_list
+    netlist.build_indexes()
+    return netlist
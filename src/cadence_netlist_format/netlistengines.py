@@ -0,0 +1,678 @@
+#!/usr/bin/env python
+
+"""Parser engines of Netlist file
+
+All engines produce the same net_list (file order, before sorting) and header:
+    line     - line-by-line state machine (streaming, lowest memory)
+    bulk     - whole file read at once, net blocks and nodes found by regex
+    parallel - file split at NET_NAME boundaries, chunks parsed by bulk
+               parser in worker processes
+
+An engine is a function (netlist, fname, file_size) -> ParseStats that fills
+netlist.net_list, version, date and time, applying netlist.net_filter and
+netlist.refdes_filter, and passes each completed net to plugin hooks (see
+netlistplugins module). select_engine() picks one by file size and core count.
+"""
+
+from __future__ import annotations
+import logging
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterator, NamedTuple, Optional, TYPE_CHECKING
+
+from .netlistheader import parse_pstwriter_line
+from .netrecords import Net, Node
+from .parsediagnostics import Diagnostics, ParseErrorLimit
+from .parseprogress import PROGRESS_INTERVAL
+
+if TYPE_CHECKING:
+    from .allegronetlist import AllegroNetList
+
+
+# Configure module logger
+logger = logging.getLogger(__name__)
+
+HEADER_LINE_COUNT = 3
+PIN_NAME_LINE_OFFSET = 2
+
+# Engine selection (see select_engine)
+BULK_MIN_SIZE = 256 * 1024             # Smaller files: line engine (no whole-file buffer)
+PARALLEL_MIN_SIZE = 32 * 1024 * 1024   # Smaller files: process start-up costs more than it saves
+PARALLEL_CHUNK_SIZE = 8 * 1024 * 1024  # Approximate bytes per worker chunk
+_BOUNDARY_READ_SIZE = 64 * 1024
+
+# Translation table for cleaning pin names (performance optimization)
+_PIN_NAME_TRANSLATE_TABLE = str.maketrans('', '', r"\ ';:")
+
+# Lines that end a net block
+_NET_END_MARKERS = ('NET_NAME', 'END.')
+
+_MARKER_RE = re.compile(r'\n(?:NET_NAME|END\.)')  # '\n' prefix: much faster than '^' with re.M
+# NODE_NAME line: refdes, pin (missing - '') and, if none of the next 2 lines is
+# a NODE_NAME line, the pin name: clean name of a usual " 'NAME':;" line, or
+# the raw line with a leading '\n' to clean up with translate() (missing - '')
+_NODE_RE = re.compile(r"\nNODE_NAME\S*(?:[^\S\n]+(\S+))?(?:[^\S\n]+(\S+))?[^\n]*"
+                      r"(?:\n(?!NODE_NAME)[^\n]*(?:\n *'([^\s\\';:]+)':;[^\S\n]*(?=\n)"
+                      r"|(\n(?!NODE_NAME)[^\n]*)(?=\n)))?")
+_BOUNDARY = b'\nNET_NAME'
+
+_NODE_ERROR = 'NODE_NAME line without refdes and pin'
+
+
+class ParseStats(NamedTuple):
+    """Result of engine run
+
+    Attributes:
+        nets: net blocks parsed (including nets skipped by net filter)
+        nodes: nodes parsed
+        header_lines: header lines read (3 for complete header)
+        errors: lines that could not be parsed (see netlist.diagnostics)
+    """
+    nets: int
+    nodes: int
+    header_lines: int
+    errors: int
+
+
+Engine = Callable[['AllegroNetList', str, int], ParseStats]
+
+
+def _line_state(s: str, header_line_number: int, waiting_for_pin_name: bool) -> str:
+    """Returns parser state name of line for diagnostics"""
+    if header_line_number < HEADER_LINE_COUNT:
+        return 'header'
+    if s.startswith('NODE_NAME'):
+        return 'node'
+    return 'pin_name' if waiting_for_pin_name else 'net_name'
+
+
+def line_engine(netlist: AllegroNetList, fname: str, file_size: int) -> ParseStats:
+    """Parse file line by line with a state machine
+
+    The state machine processes:
+    1. Header lines (first 3 lines contain version/date/time)
+    2. NET_NAME declarations (net name on next line)
+    3. NODE_NAME entries (component + pin, with pin name 2 lines later)
+    4. END marker (final Netlist termination)
+
+    Nets rejected by net_filter are skipped up to the next NET_NAME without
+    tokenizing their lines. After a malformed line the rest of the net block
+    is skipped the same way (nodes read before it are kept).
+    """
+    with open(fname, 'r') as f:
+        # State machine variables
+        expecting_net_name = False  # Next line contains the net name
+        processing_net = False      # Currently processing a net's nodes
+        current_net = ''
+        current_nodes = []
+
+        # Pin name extraction state
+        waiting_for_pin_name = False
+        pin_name_line_counter = 0
+        current_node_ref = None  # Reference to node being processed
+
+        # Header parsing
+        header_line_number = 0
+
+        # Error tracking (line numbers only: offsets are resolved when errors occurred)
+        diagnostics = netlist.diagnostics
+
+        # Filters (predicate pushdown)
+        net_filter = netlist.net_filter
+        refdes_filter = netlist.refdes_filter
+        skipping_net = False  # Net rejected by net_filter, skip to next NET_NAME
+
+        on_net = _on_net_hook(netlist)
+
+        # Tokens repeat (refdes on every pin, pin numbers, pin names): keep one
+        # str object per distinct value
+        intern = sys.intern
+
+        # Progress/cancellation (checked at net boundaries only when requested)
+        monitored = netlist.progress is not None or netlist.cancel_token is not None
+        nets_seen = -1  # Net blocks completed (each marker ends previous block)
+        nodes_seen = 0
+        next_check = PROGRESS_INTERVAL
+        start_time = time.perf_counter()
+
+        net_list = netlist.net_list = []
+
+        for line_number, line in enumerate(f, 1):
+            if skipping_net:
+                if not line.startswith(_NET_END_MARKERS):
+                    continue
+                skipping_net = False
+
+            s = line.rstrip()
+
+            try:
+                # State 1: Extract net name (line after NET_NAME)
+                if expecting_net_name:
+                    expecting_net_name = False
+                    # Remove surrounding single quotes from net name
+                    current_net = intern(s.strip("'"))
+                    if net_filter is None or net_filter(current_net):
+                        processing_net = True
+                    else:
+                        skipping_net = True
+                        continue
+
+                # State 2: Process NET_NAME or END markers
+                if s.startswith(_NET_END_MARKERS):
+                    nets_seen += 1
+                    nodes_seen += len(current_nodes)
+                    if monitored and nets_seen >= next_check:
+                        next_check += PROGRESS_INTERVAL
+                        netlist._check_progress(f.buffer.tell(), file_size, nets_seen,
+                                                nodes_seen, start_time)
+
+                    # Save previous net if we were processing one
+                    if processing_net:
+                        processing_net = False
+                        if refdes_filter is None or current_nodes:
+                            net = Net(current_net, current_nodes)
+                            if on_net is not None:
+                                on_net(net)
+                            net_list.append(net)
+                        current_net = ''
+                        current_nodes = []
+
+                    # Reset pin name extraction state (fixes state machine bug)
+                    waiting_for_pin_name = False
+                    pin_name_line_counter = 0
+                    current_node_ref = None
+
+                    # Prepare for next net name
+                    expecting_net_name = True
+                    current_net = s
+
+                # State 3: Process NODE_NAME (component + pin)
+                elif s.startswith('NODE_NAME'):
+                    parts = s.split()
+                    ref_des = intern(parts[1])
+                    pin_number = intern(parts[2])
+                    if refdes_filter is None or refdes_filter(ref_des):
+                        ref_and_pin = Node(ref_des, pin_number)
+                        current_nodes.append(ref_and_pin)
+
+                        # Prepare to extract pin name (appears 2 lines later)
+                        waiting_for_pin_name = True
+                        pin_name_line_counter = 0
+                        current_node_ref = ref_and_pin
+                    else:
+                        waiting_for_pin_name = False
+
+                # State 4: Extract pin name (2 lines after NODE_NAME)
+                if waiting_for_pin_name:
+                    if pin_name_line_counter < PIN_NAME_LINE_OFFSET:
+                        pin_name_line_counter += 1
+                    else:
+                        waiting_for_pin_name = False
+                        # Clean up pin name (remove special characters) - optimized with str.translate()
+                        pin_name = s.translate(_PIN_NAME_TRANSLATE_TABLE)
+                        # Pin name equal to pin number (passives) shares the pin str
+                        pin_number = current_node_ref.pin
+                        current_node_ref.pin_name = pin_number if pin_name == pin_number else intern(pin_name)
+
+                # State 5: Parse header (first 3 lines contain metadata)
+                if header_line_number < HEADER_LINE_COUNT:
+                    header_line_number += 1
+
+                if header_line_number == 2:
+                    # Example header line 2:
+                    #   { Using PSTWRITER 16.3.0 p002Mar-22-2016 at 10:54:51 }
+                    netlist.version, netlist.date, netlist.time = parse_pstwriter_line(s)
+
+            except (IndexError, KeyError) as e:
+                state = _line_state(s, header_line_number, waiting_for_pin_name)
+                message = _NODE_ERROR if state == 'node' and isinstance(e, IndexError) else f'{type(e).__name__}: {e}'
+                diagnostics.add(line_number, state, message, s)
+                # Resynchronize: skip to next NET_NAME
+                skipping_net = True
+                waiting_for_pin_name = False
+
+    return ParseStats(max(nets_seen, 0), nodes_seen, header_line_number, diagnostics.count)
+
+
+def _on_net_hook(netlist: AllegroNetList) -> Optional[Callable[[Net], None]]:
+    """Returns plugin hook to call with each completed net (None - no plugins)"""
+    hooks = netlist._plugin_hooks
+    return hooks.net if hooks is not None else None
+
+
+def _header_lines(text: str) -> list[str]:
+    """Returns up to HEADER_LINE_COUNT first lines of text"""
+    parts = text.split('\n', HEADER_LINE_COUNT)
+    if len(parts) <= HEADER_LINE_COUNT and parts[-1] == '':
+        parts.pop()  # Empty rest after final newline is not a line
+    return parts[:HEADER_LINE_COUNT]
+
+
+def _parse_header(netlist: AllegroNetList, text: str) -> int:
+    """Parse header lines at start of text, returns number of header lines read
+
+    A malformed PSTWRITER line is recorded in netlist.diagnostics as the
+    line engine does (nets start at the first marker, nothing to skip).
+
+    Raises:
+        ParseErrorLimit: If diagnostics error budget is exceeded
+    """
+    lines = _header_lines(text)
+    if len(lines) >= 2:
+        s = lines[1].rstrip()
+        try:
+            netlist.version, netlist.date, netlist.time = parse_pstwriter_line(s)
+        except (IndexError, ValueError) as e:
+            netlist.diagnostics.add(2, 'header', f'{type(e).__name__}: {e}', s)
+    return len(lines)
+
+
+class _LineCounter:
+    """Line numbers of text positions, counted incrementally (positions must increase)"""
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.position = 0
+        self.line = 1
+
+    def line_at(self, position: int) -> int:
+        self.line += self.text.count('\n', self.position, position)
+        self.position = position
+        return self.line
+
+    def first_node_error(self, diagnostics: Diagnostics, nodes_start: int, end: int) -> bool:
+        """Record first malformed node in text[nodes_start:end], returns True if found"""
+        for i, (_, pin, _, _) in enumerate(_NODE_RE.findall(self.text, nodes_start, end)):
+            if not pin:
+                self.node_error(diagnostics, nodes_start, end, i)
+                return True
+        return False
+
+    def node_error(self, diagnostics: Diagnostics, nodes_start: int, end: int, index: int) -> None:
+        """Record malformed node: match `index` of _NODE_RE in text[nodes_start:end]"""
+        for i, m in enumerate(_NODE_RE.finditer(self.text, nodes_start, end)):
+            if i == index:
+                line_start = m.start() + 1
+                line_end = self.text.find('\n', line_start)
+                diagnostics.add(self.line_at(line_start), 'node', _NODE_ERROR,
+                                self.text[line_start:line_end if line_end >= 0 else len(self.text)].rstrip())
+                return
+
+
+def _net_blocks(text: str, final: bool) -> Iterator[tuple[int, str, int, int]]:
+    """Yield (block start, net name, nodes start, block end) of net blocks in text
+
+    A net block runs from a NET_NAME marker line to the next NET_NAME/END
+    marker line: net name on the first line, then NODE_NAME lines with the
+    pin name 2 lines later. A net name line starting with NODE_NAME is a
+    node line too, as in the line engine.
+
+    If final, lines after the last marker are yielded as a last block ending
+    at len(text): it is not a net, but the line engine reports its malformed
+    lines.
+    """
+    find = text.find
+    markers = [m.start() + 1 for m in _MARKER_RE.finditer(text)]
+    if text.startswith(_NET_END_MARKERS):
+        markers.insert(0, 0)
+    if not final or (markers and find('\n', markers[-1]) >= 0):
+        markers.append(len(text))
+    for start, end in zip(markers, markers[1:]):
+        name_start = find('\n', start) + 1
+        if name_start == end:
+            # Marker right after marker: it is the net name of an empty net
+            name_end = find('\n', end)
+            name_line = text[end:name_end if name_end >= 0 else len(text)]
+            name_end = end
+        else:
+            name_end = find('\n', name_start, end)
+            if name_end < 0:
+                name_end = end  # Last line of file without newline
+            name_line = text[name_start:name_end]
+            if name_line.startswith('NODE_NAME'):
+                name_end = name_start - 1
+        # Remove surrounding single quotes from net name
+        yield start, name_line.rstrip().strip("'"), name_end, end
+
+
+def parse_text(text: str, final: bool = True,
+               net_filter: Optional[Callable[[str], bool]] = None,
+               refdes_filter: Optional[Callable[[str], bool]] = None,
+               progress: Optional[Callable[[int, int, int], None]] = None,
+               diagnostics: Optional[Diagnostics] = None,
+               on_net: Optional[Callable[[Net], None]] = None) -> tuple[list[Net], ParseStats]:
+    """Parse net blocks of Netlist text (header is not parsed)
+
+    A malformed NODE_NAME line ends its net block (nodes before it are kept).
+    If final, malformed lines after the last marker are reported too.
+
+    Args:
+        text: Netlist text (whole file or chunk starting at a marker)
+        final: text ends the file, block after last marker is not a net;
+               if False, text ends before a marker and last block is a net
+        net_filter: keep only nets with matching names
+        refdes_filter: keep only matching nodes (nets without them are skipped)
+        progress: called with (text position, nets, nodes) every PROGRESS_INTERVAL nets
+        diagnostics: collects malformed lines (line numbers relative to text start)
+        on_net: called with each net added to result
+
+    Returns:
+        (nets in text order, stats with header_lines == 0)
+
+    Raises:
+        ParseErrorLimit: If diagnostics error budget is exceeded
+    """
+    if diagnostics is None:
+        diagnostics = Diagnostics()
+    errors_before = diagnostics.count
+    line_counter = _LineCounter(text)
+    intern = sys.intern
+    translate_table = _PIN_NAME_TRANSLATE_TABLE
+    findall = _NODE_RE.findall
+    nets: list[Net] = []
+    nets_seen = nodes_seen = 0
+    tail_end = len(text) if final else -1
+
+    for start, name, nodes_start, end in _net_blocks(text, final):
+        if end == tail_end:
+            # Lines after last marker of file: not a net
+            if net_filter is None or net_filter(name):
+                line_counter.first_node_error(diagnostics, nodes_start, end)
+            break
+        nets_seen += 1
+        if progress is not None and nets_seen % PROGRESS_INTERVAL == 0:
+            progress(start, nets_seen, nodes_seen)
+        name = intern(name)
+        if net_filter is not None and not net_filter(name):
+            continue
+
+        nodes = []
+        for i, (refdes, pin, pin_name, pin_line) in enumerate(findall(text, nodes_start, end)):
+            nodes_seen += 1
+            if not pin:
+                line_counter.node_error(diagnostics, nodes_start, end, i)
+                break
+            refdes = intern(refdes)
+            if refdes_filter is not None and not refdes_filter(refdes):
+                continue
+            pin = intern(pin)
+            if pin_line:
+                pin_name = pin_line[1:].rstrip().translate(translate_table)
+            elif not pin_name:
+                nodes.append(Node(refdes, pin))
+                continue
+            # Pin name equal to pin number (passives) shares the pin str
+            nodes.append(Node(refdes, pin, pin if pin_name == pin else intern(pin_name)))
+        if refdes_filter is None or nodes:
+            net = Net(name, nodes)
+            if on_net is not None:
+                on_net(net)
+            nets.append(net)
+    return nets, ParseStats(nets_seen, nodes_seen, 0, diagnostics.count - errors_before)
+
+
+def bulk_engine(netlist: AllegroNetList, fname: str, file_size: int) -> ParseStats:
+    """Read whole file at once and parse it with parse_text()"""
+    with open(fname, 'r') as f:
+        text = f.read()
+    header_lines = _parse_header(netlist, text)
+
+    progress = None
+    if netlist.progress is not None or netlist.cancel_token is not None:
+        start_time = time.perf_counter()
+        scale = file_size / len(text) if text else 0.0
+
+        def progress(position: int, nets: int, nodes: int) -> None:
+            netlist._check_progress(int(position * scale), file_size, nets, nodes, start_time)
+
+    netlist.net_list, stats = parse_text(text, True, netlist.net_filter, netlist.refdes_filter, progress,
+                                         netlist.diagnostics, _on_net_hook(netlist))
+    return stats._replace(header_lines=header_lines)
+
+
+def available_cpus() -> int:
+    """Returns number of CPUs this process may run on"""
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def chunk_bounds(fname: str, file_size: int, chunk_size: int = PARALLEL_CHUNK_SIZE) -> list[tuple[int, int]]:
+    """Split file into byte ranges that start at NET_NAME lines (except the first)
+
+    Returns:
+        [(start, end), ...] covering the whole file
+    """
+    bounds = []
+    start = 0
+    with open(fname, 'rb') as f:
+        while start < file_size:
+            boundary = file_size
+            offset = start + chunk_size
+            while offset < file_size:
+                # Search from 1 byte before offset: the marker may start exactly at offset
+                f.seek(offset - 1)
+                block = f.read(_BOUNDARY_READ_SIZE + len(_BOUNDARY))
+                pos = block.find(_BOUNDARY)
+                if pos >= 0:
+                    boundary = offset + pos
+                    break
+                offset += _BOUNDARY_READ_SIZE
+            bounds.append((start, boundary))
+            start = boundary
+    return bounds
+
+
+def _decode_chunk(data: bytes, encoding: str) -> str:
+    """Decode file bytes as text mode open() does (universal newlines)"""
+    return data.decode(encoding).replace('\r\n', '\n').replace('\r', '\n')
+
+
+class _ChunkColumns(NamedTuple):
+    """Nets of chunk as string columns (pickled much faster than Net/Node objects)
+
+    Attributes:
+        net_names: net names
+        node_counts: number of nodes of each net
+        refdes, pins, pin_names: node columns (pin name None if missing)
+        stats: parse statistics of chunk
+        header: header lines of first chunk, None for other chunks
+        diagnostics: malformed lines (line numbers relative to chunk start)
+        error_nets: index in net_names of the net of each error
+        lines: number of lines in chunk
+        tail: last of net_names names the lines after the last marker of
+              the file (not a net, without nodes)
+    """
+    net_names: list[str]
+    node_counts: list[int]
+    refdes: list[str]
+    pins: list[str]
+    pin_names: list[Optional[str]]
+    stats: ParseStats
+    header: Optional[str]
+    diagnostics: Diagnostics
+    error_nets: list[int]
+    lines: int
+    tail: bool
+
+
+def _parse_chunk(fname: str, start: int, end: int, final: bool, encoding: str,
+                 max_errors: Optional[int]) -> _ChunkColumns:
+    """Worker: parse byte range of file (starting at a marker, except the first)
+
+    Parsing stops when the chunk alone exceeds the error budget (max_errors,
+    None - no limit); the error is raised by the main process, which knows
+    line numbers in the file.
+    """
+    with open(fname, 'rb') as f:
+        f.seek(start)
+        text = _decode_chunk(f.read(end - start), encoding)
+    # Interned tokens are pickled once per chunk (pickle memo)
+    intern = sys.intern
+    translate_table = _PIN_NAME_TRANSLATE_TABLE
+    findall = _NODE_RE.findall
+    net_names: list[str] = []
+    node_counts: list[int] = []
+    refdes_column: list[str] = []
+    pins: list[str] = []
+    pin_names: list[Optional[str]] = []
+    diagnostics = Diagnostics(max_errors)
+    error_nets: list[int] = []
+    line_counter = _LineCounter(text)
+    nodes_seen = 0
+    tail = False
+    tail_end = len(text) if final else -1
+    try:
+        for _, name, nodes_start, block_end in _net_blocks(text, final):
+            net_names.append(name)
+            node_counts.append(0)
+            if block_end == tail_end:
+                # Lines after last marker of file: only errors (net_filter applies to them)
+                tail = True
+                if line_counter.first_node_error(diagnostics, nodes_start, block_end):
+                    error_nets.append(len(net_names) - 1)
+                break
+            for i, (refdes, pin, pin_name, pin_line) in enumerate(findall(text, nodes_start, block_end)):
+                nodes_seen += 1
+                if not pin:
+                    error_nets.append(len(net_names) - 1)
+                    line_counter.node_error(diagnostics, nodes_start, block_end, i)
+                    break
+                node_counts[-1] += 1
+                refdes_column.append(intern(refdes))
+                pins.append(intern(pin))
+                if pin_line:
+                    pin_name = pin_line[1:].rstrip().translate(translate_table)
+                pin_names.append(intern(pin_name) if pin_name or pin_line else None)
+    except ParseErrorLimit:
+        pass
+    header = '\n'.join(_header_lines(text)) + '\n' if start == 0 else None
+    return _ChunkColumns(net_names, node_counts, refdes_column, pins, pin_names,
+                         ParseStats(len(net_names) - tail, nodes_seen, 0, diagnostics.count), header,
+                         diagnostics, error_nets, text.count('\n'), tail)
+
+
+def parallel_engine(netlist: AllegroNetList, fname: str, file_size: int) -> ParseStats:
+    """Parse file chunks in worker processes, build nets from their columns
+
+    Filters are applied in this process (they may not be picklable), errors
+    in nets rejected by net_filter are dropped as the other engines do not
+    parse these nets; tokens are interned again, as interning does not cross
+    process boundaries. A file of one chunk (or empty) is parsed in this
+    process by bulk_engine().
+    """
+    bounds = chunk_bounds(fname, file_size)
+    if len(bounds) < 2:
+        return bulk_engine(netlist, fname, file_size)
+    with open(fname, 'r') as f:
+        encoding = f.encoding
+    net_filter = netlist.net_filter
+    refdes_filter = netlist.refdes_filter
+    on_net = _on_net_hook(netlist)
+    monitored = netlist.progress is not None or netlist.cancel_token is not None
+    intern = sys.intern
+    start_time = time.perf_counter()
+
+    net_list = netlist.net_list = []
+    nets_seen = nodes_seen = header_lines = lines_before = 0
+    jobs = min(available_cpus(), len(bounds))
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        # Errors of filtered nets do not count: the chunk budget is checked here
+        chunk_max_errors = netlist.diagnostics.max_errors if net_filter is None else None
+        futures = [executor.submit(_parse_chunk, fname, start, end, end == file_size, encoding,
+                                   chunk_max_errors)
+                   for start, end in bounds]
+        try:
+            for future, (_, end) in zip(futures, bounds):
+                chunk = future.result()
+                if chunk.header is not None:
+                    header_lines = _parse_header(netlist, chunk.header)
+                nets_seen += chunk.stats.nets
+                nodes_seen += chunk.stats.nodes
+                if chunk.diagnostics:
+                    diagnostics = chunk.diagnostics
+                    if net_filter is not None:
+                        diagnostics = diagnostics.select(
+                            k for k, net in enumerate(chunk.error_nets) if net_filter(chunk.net_names[net]))
+                    netlist.diagnostics.extend(diagnostics, lines_before)
+                lines_before += chunk.lines
+                nodes_end = 0
+                net_names = chunk.net_names[:-1] if chunk.tail else chunk.net_names
+                for name, count in zip(net_names, chunk.node_counts):
+                    nodes_start = nodes_end
+                    nodes_end += count
+                    name = intern(name)
+                    if net_filter is not None and not net_filter(name):
+                        continue
+                    nodes = []
+                    for i in range(nodes_start, nodes_end):
+                        refdes = intern(chunk.refdes[i])
+                        if refdes_filter is not None and not refdes_filter(refdes):
+                            continue
+                        pin = intern(chunk.pins[i])
+                        pin_name = chunk.pin_names[i]
+                        if pin_name is not None:
+                            # Pin name equal to pin number (passives) shares the pin str
+                            pin_name = pin if pin_name == pin else intern(pin_name)
+                        nodes.append(Node(refdes, pin, pin_name))
+                    if refdes_filter is None or nodes:
+                        net = Net(name, nodes)
+                        if on_net is not None:
+                            on_net(net)
+                        net_list.append(net)
+                if monitored:
+                    netlist._check_progress(end, file_size, nets_seen, nodes_seen, start_time)
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+    return ParseStats(nets_seen, nodes_seen, header_lines, netlist.diagnostics.count)
+
+
+ENGINES: dict[str, Engine] = {
+    'line': line_engine,
+    'bulk': bulk_engine,
+    'parallel': parallel_engine,
+}
+
+
+def register_engine(name: str, engine: Engine) -> None:
+    """Add parser engine (or replace engine with the same name)"""
+    ENGINES[name] = engine
+
+
+def engine_names() -> list[str]:
+    """Returns engine names for command line choices: 'auto' and registered engines"""
+    return ['auto', *ENGINES]
+
+
+def select_engine(file_size: int, cpus: Optional[int] = None,
+                  memory_budget: Optional[int] = None) -> str:
+    """Returns engine name for file size and number of CPUs
+
+    Small files (and any file with a memory budget) use the streaming line
+    engine, larger files the bulk engine, large files on multi-core machines
+    the parallel engine.
+    """
+    if memory_budget is not None or file_size < BULK_MIN_SIZE:
+        return 'line'
+    if cpus is None:
+        cpus = available_cpus()
+    if cpus > 1 and file_size >= PARALLEL_MIN_SIZE:
+        return 'parallel'
+    return 'bulk'
+
+
+def get_engine(name: str) -> Engine:
+    """Returns registered engine
+
+    Raises:
+        ValueError: If engine name is unknown
+    """
+    try:
+        return ENGINES[name]
+    except KeyError:
+        raise ValueError(f"Unknown parser engine '{name}' (valid: {', '.join(ENGINES)})") from None
@@ -0,0 +1,225 @@
+#!/usr/bin/env python
+
+"""Connectivity fingerprint of Netlist
+
+The fingerprint is a hash of the connectivity: the set of nets, each a set
+of (refdes, pin). Net names, net/node order, file formatting and header
+timestamps do not change it. Each net is hashed as SHA-256 of its sorted
+'refdes pin' lines; the fingerprint is the sum of net hashes modulo 2**256,
+so it does not depend on net order and is computed while nets are parsed
+(FingerprintPlugin, plugin 'fingerprint') without keeping net hashes.
+
+Equal fingerprints mean equivalent connectivity (up to the SHA-256 collision
+probability), different fingerprints mean a full diff will find changes.
+Fingerprints are saved to JSON sidecar files ('NetList.fingerprint.json')
+with the path, size and mtime of the Netlist file, so a sidecar of an
+unchanged file is used instead of parsing it. A sidecar is the fingerprint of
+the whole file: fingerprints of partial Netlists (net/refdes filter applied)
+are not saved.
+
+Example:
+    netlist = AllegroNetList(fname, plugins=[FingerprintPlugin()])
+    write_fingerprint(sidecar_fname(fname), netlist.fingerprint(), fname)
+"""
+
+from __future__ import annotations
+import json
+import logging
+import os
+from hashlib import sha256
+from pathlib import Path
+from typing import Iterable, NamedTuple, Optional, TYPE_CHECKING
+
+from .netlistplugins import NetListPlugin
+
+if TYPE_CHECKING:
+    from .allegronetlist import AllegroNetList
+    from .netrecords import Net, Node
+
+
+# Configure module logger
+logger = logging.getLogger(__name__)
+
+ALGORITHM = 'sha256-sum-v1'  # Saved in sidecar: fingerprints of other algorithms are not compared
+SIDECAR_SUFFIX = '.fingerprint.json'
+_MODULUS_MASK = (1 << 256) - 1
+
+
+class Fingerprint(NamedTuple):
+    """Connectivity fingerprint
+
+    Attributes:
+        digest: sum of net hashes modulo 2**256
+        nets: nets with nodes
+        pins: (refdes, pin) connections (distinct in each net)
+    """
+    digest: int
+    nets: int
+    pins: int
+
+    @property
+    def hex(self) -> str:
+        return f'{self.digest:064x}'
+
+    def __str__(self) -> str:
+        return f'{self.hex} ({self.nets} nets, {self.pins} pins)'
+
+
+def net_hash(nodes: Iterable[Node]) -> tuple[int, int]:
+    """Returns (hash of net connections as int, number of distinct connections)"""
+    pins = sorted({f'{node.refdes} {node.pin}' for node in nodes})
+    return int.from_bytes(sha256('\n'.join(pins).encode()).digest(), 'big'), len(pins)
+
+
+class FingerprintPlugin(NetListPlugin):
+    """Plugin computing fingerprint while nets are parsed (sets netlist fingerprint)
+
+    Attributes:
+        fingerprint: result (set when parsing is complete)
+    """
+
+    def __init__(self) -> None:
+        self.digest = 0
+        self.nets = 0
+        self.pins = 0
+        self.fingerprint: Optional[Fingerprint] = None
+
+    def on_net(self, net: Net) -> None:
+        if net.nodes:
+            digest, pins = net_hash(net.nodes)
+            self.digest = (self.digest + digest) & _MODULUS_MASK
+            self.nets += 1
+            self.pins += pins
+
+    def on_end(self, netlist: AllegroNetList) -> None:
+        self.fingerprint = Fingerprint(self.digest, self.nets, self.pins)
+        netlist._fingerprint = self.fingerprint
+
+    def report(self) -> str:
+        return f'Fingerprint: {self.fingerprint}' if self.fingerprint is not None else ''
+
+
+def fingerprint_nets(nets: Iterable[Net]) -> Fingerprint:
+    """Returns fingerprint of nets (one pass)"""
+    plugin = FingerprintPlugin()
+    for net in nets:
+        plugin.on_net(net)
+    return Fingerprint(plugin.digest, plugin.nets, plugin.pins)
+
+
+def sidecar_fname(fname: str | Path) -> Path:
+    """Returns sidecar file name of Netlist or report: 'NetList.rpt' -> 'NetList.fingerprint.json'"""
+    fname = Path(fname)
+    return fname.with_name(fname.stem + SIDECAR_SUFFIX)
+
+
+def check_saveable(netlist: AllegroNetList) -> None:
+    """Check that fingerprint of Netlist can be saved to a sidecar file
+
+    Raises:
+        ValueError: If Netlist is partial (net/refdes filter applied)
+    """
+    if netlist.net_filter is not None or netlist.refdes_filter is not None:
+        error_msg = ('Fingerprint of partial Netlist (net/refdes filter applied) is not saved: '
+                     'sidecar file is the fingerprint of the whole Netlist file')
+        logger.error(error_msg)
+        raise ValueError(error_msg)
+
+
+def sidecar_data(fingerprint: Fingerprint, netlist_fname: str | Path) -> dict:
+    """Returns sidecar file content (with Netlist file size and mtime)
+
+    Raises:
+        OSError: If Netlist file cannot be accessed
+    """
+    st = os.stat(netlist_fname)
+    return {'algorithm': ALGORITHM, 'fingerprint': fingerprint.hex,
+            'nets': fingerprint.nets, 'pins': fingerprint.pins,
+            'netlist': os.path.abspath(netlist_fname), 'size': st.st_size, 'mtime_ns': st.st_mtime_ns}
+
+
+def write_fingerprint(fname: str | Path, fingerprint: Fingerprint, netlist_fname: str | Path) -> None:
+    """Write fingerprint sidecar file
+
+    Raises:
+        IOError: If file write fails
+    """
+    try:
+        data = sidecar_data(fingerprint, netlist_fname)
+        with open(fname, 'w') as f:
+            json.dump(data, f, indent=1)
+            f.write('\n')
+    except OSError as e:
+        error_msg = f"Failed to write fingerprint file '{fname}': {e}"
+        logger.error(error_msg)
+        raise IOError(error_msg)
+
+
+def read_fingerprint(fname: str | Path, netlist_fname: Optional[str | Path] = None) -> Optional[Fingerprint]:
+    """Read fingerprint sidecar file
+
+    Args:
+        fname: sidecar file name
+        netlist_fname: if set, sidecar is used only if it was written for this
+                       file with the same size and mtime
+
+    Returns:
+        Fingerprint, None if sidecar is missing, of other algorithm or out of date
+
+    Raises:
+        ValueError: If sidecar file is not valid
+    """
+    try:
+        with open(fname) as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, json.JSONDecodeError) as e:
+        error_msg = f"Cannot read fingerprint file '{fname}': {e}"
+        logger.error(error_msg)
+        raise ValueError(error_msg)
+    try:
+        if data['algorithm'] != ALGORITHM:
+            return None
+        if netlist_fname is not None:
+            st = os.stat(netlist_fname)
+            if ((data['netlist'], data['size'], data['mtime_ns'])
+                    != (os.path.abspath(netlist_fname), st.st_size, st.st_mtime_ns)):
+                return None
+        return Fingerprint(int(data['fingerprint'], 16), data['nets'], data['pins'])
+    except (KeyError, TypeError, ValueError) as e:
+        error_msg = f"Invalid fingerprint file '{fname}': {e}"
+        logger.error(error_msg)
+        raise ValueError(error_msg)
+
+
+def load_fingerprint(fname: str | Path, save: bool = False) -> tuple[Fingerprint, str]:
+    """Returns fingerprint of sidecar file or Netlist file, and its source
+
+    A Netlist with an up-to-date sidecar is not parsed.
+
+    Args:
+        fname: sidecar file (*.fingerprint.json) or Netlist file
+        save: write sidecar of parsed Netlist
+
+    Returns:
+        (fingerprint, source: 'sidecar' or 'parsed')
+
+    Raises:
+        OSError: If file cannot be read
+        ValueError: If file is not a valid sidecar or Netlist
+    """
+    from .allegronetlist import AllegroNetList
+    if str(fname).endswith(SIDECAR_SUFFIX):
+        fingerprint = read_fingerprint(fname)
+        if fingerprint is None:
+            raise ValueError(f"Fingerprint file '{fname}' not found or of other algorithm (not {ALGORITHM})")
+        return fingerprint, 'sidecar'
+    sidecar = sidecar_fname(fname)
+    fingerprint = read_fingerprint(sidecar, fname)
+    if fingerprint is not None:
+        return fingerprint, 'sidecar'
+    fingerprint = AllegroNetList(fname, plugins=[FingerprintPlugin()]).fingerprint()
+    if save:
+        write_fingerprint(sidecar, fingerprint, fname)
+    return fingerprint, 'parsed'
@@ -0,0 +1,247 @@
+#!/usr/bin/env python
+
+"""Connectivity graph of Cadence Allegro Netlist
+
+Bipartite net/component graph stored as CSR (compressed sparse row) arrays:
+    net_indptr[i]:net_indptr[i + 1]   -> slice of net_adj with component ids of net i
+    comp_indptr[c]:comp_indptr[c + 1] -> slice of comp_adj with net ids of component c
+
+Net ids are indexes in AllegroNetList.net_list. Signal tracing crosses only
+pass-through components (series parts: resistors, inductors, ferrite beads, ...),
+selected by refdes prefix (letters before the number: 'R12' -> 'R').
+Nets with the same name (duplicated NET_NAME entries) are one signal: a
+trace that reaches one of them reaches all of them.
+"""
+
+from __future__ import annotations
+import re
+from array import array
+from collections import deque
+from typing import Iterable, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .allegronetlist import AllegroNetList
+
+
+DEFAULT_PASS_THROUGH = ('R', 'L', 'FB')
+
+_REFDES_PREFIX_RE = re.compile(r'\D*')
+
+
+def refdes_prefix(refdes: str) -> str:
+    """Returns refdes prefix (part before the first digit), e.g. 'FB' for 'FB3'"""
+    return _REFDES_PREFIX_RE.match(refdes).group()
+
+
+class ConnectivityGraph:
+    """Net/component connectivity graph in CSR arrays
+
+    Attributes:
+        netlist: source Netlist
+        components: component id -> refdes
+        component_ids: refdes -> component id
+        net_indptr, net_adj: net -> components adjacency (CSR)
+        comp_indptr, comp_adj: component -> nets adjacency (CSR)
+        pass_through: 1 for pass-through components (by component id)
+        net_ids: net name -> net ids of nets with this name (ascending)
+    """
+
+    def __init__(self, netlist: AllegroNetList,
+                 pass_through: Iterable[str] = DEFAULT_PASS_THROUGH,
+                 pass_through_refdes: Iterable[str] = ()) -> None:
+        """Build graph from net_list in linear time
+
+        Args:
+            netlist: parsed Netlist
+            pass_through: refdes prefixes of components that signals pass through
+            pass_through_refdes: explicit refdes of pass-through components
+        """
+        self.netlist = netlist
+        self.components: list[str] = []
+        self.component_ids: dict[str, int] = {}
+        self.net_indptr = array('i', [0])
+        self.net_adj = array('i')
+        self.net_ids: dict[str, list[int]] = {}
+
+        # Pass 1: net -> components (each component once per net)
+        components = self.components
+        component_ids = self.component_ids
+        net_adj = self.net_adj
+        last_net = array('i')  # last net id where component was added (dedup)
+        for net_id, net in enumerate(netlist.net_list):
+            ids = self.net_ids.get(net.name)
+            if ids is None:
+                self.net_ids[net.name] = [net_id]
+            else:
+                ids.append(net_id)
+            for node in net.nodes:
+                comp = component_ids.get(node.refdes)
+                if comp is None:
+                    comp = len(components)
+                    component_ids[node.refdes] = comp
+                    components.append(node.refdes)
+                    last_net.append(-1)
+                if last_net[comp] != net_id:
+                    last_net[comp] = net_id
+                    net_adj.append(comp)
+            self.net_indptr.append(len(net_adj))
+
+        # Pass 2: component -> nets by counting sort of net_adj
+        comp_count = len(components)
+        degree = array('i', bytes(4 * (comp_count + 1)))
+        for comp in net_adj:
+            degree[comp + 1] += 1
+        for comp in range(comp_count):
+            degree[comp + 1] += degree[comp]
+        self.comp_indptr = array('i', degree)
+        self.comp_adj = array('i', bytes(4 * len(net_adj)))
+        fill = degree  # reuse as insertion cursor
+        net_indptr = self.net_indptr
+        for net_id in range(len(net_indptr) - 1):
+            for k in range(net_indptr[net_id], net_indptr[net_id + 1]):
+                comp = net_adj[k]
+                self.comp_adj[fill[comp]] = net_id
+                fill[comp] += 1
+
+        # Net id -> ids of all nets with its name, only for duplicated names
+        self._same_name: dict[int, list[int]] = {net_id: ids for ids in self.net_ids.values() if len(ids) > 1
+                                                 for net_id in ids}
+
+        prefixes = frozenset(pass_through)
+        explicit = frozenset(pass_through_refdes)
+        self.pass_through = bytearray(1 if refdes in explicit or refdes_prefix(refdes) in prefixes else 0
+                                      for refdes in components)
+
+    def net_components(self, net_id: int) -> list[str]:
+        """Returns refdes connected to net
+
+        Args:
+            net_id: net index
+        """
+        return [self.components[c] for c in self.net_adj[self.net_indptr[net_id]:self.net_indptr[net_id + 1]]]
+
+    def component_nets(self, refdes: str) -> list[int]:
+        """Returns net indexes connected to component (empty if refdes is unknown)
+
+        Args:
+            refdes: refdes value
+        """
+        comp = self.component_ids.get(refdes)
+        if comp is None:
+            return []
+        return list(self.comp_adj[self.comp_indptr[comp]:self.comp_indptr[comp + 1]])
+
+    def _start(self, refdes: str, pin: str) -> Optional[tuple[int, int]]:
+        """Returns (net id, component id) of pin or None if pin is not connected"""
+        net_name = self.netlist.get_net_name4refdes_pin(refdes, pin)
+        if net_name is None:
+            return None
+        return self.net_ids[net_name][0], self.component_ids[refdes]
+
+    def _bfs(self, start_net: int, start_comp: int,
+             target_comp: int = -1) -> tuple[list[int], dict[int, int], dict[int, int]]:
+        """Breadth-first search from net through pass-through components
+
+        The start component is never crossed. Search stops early when
+        target_comp is reached.
+
+        Returns:
+            (visited net ids in BFS order, net parent component, component parent net)
+        """
+        same_name = self._same_name
+        order = same_name.get(start_net, [start_net])
+        net_parent = dict.fromkeys(order, -1)
+        comp_parent = {start_comp: -1}
+        order = list(order)
+        queue = deque(order)
+        net_indptr, net_adj = self.net_indptr, self.net_adj
+        comp_indptr, comp_adj = self.comp_indptr, self.comp_adj
+        pass_through = self.pass_through
+        while queue:
+            net_id = queue.popleft()
+            for k in range(net_indptr[net_id], net_indptr[net_id + 1]):
+                comp = net_adj[k]
+                if comp in comp_parent:
+                    continue
+                comp_parent[comp] = net_id
+                if comp == target_comp:
+                    return order, net_parent, comp_parent
+                if not pass_through[comp]:
+                    continue
+                for j in range(comp_indptr[comp], comp_indptr[comp + 1]):
+                    next_net = comp_adj[j]
+                    if next_net not in net_parent:
+                        for next_net in same_name.get(next_net, (next_net,)):
+                            if next_net not in net_parent:
+                                net_parent[next_net] = comp
+                                order.append(next_net)
+                                queue.append(next_net)
+        return order, net_parent, comp_parent
+
+    def trace(self, refdes: str, pin: str) -> list[int]:
+        """Returns net indexes reachable from pin through pass-through components
+
+        Args:
+            refdes: refdes value
+            pin: pin number
+
+        Returns:
+            Net indexes in BFS order (starting with the pin net), empty if pin is not connected
+        """
+        start = self._start(refdes, pin)
+        if start is None:
+            return []
+        return self._bfs(*start)[0]
+
+    def endpoints(self, refdes: str, pin: str) -> list[tuple[str, str, str]]:
+        """Returns pins of non pass-through components on the traced nets
+
+        Args:
+            refdes: refdes value
+            pin: pin number
+
+        Returns:
+            List of (refdes, pin, net name), the start pin is excluded
+        """
+        result = []
+        net_list = self.netlist.net_list
+        pass_through = self.pass_through
+        component_ids = self.component_ids
+        for net_id in self.trace(refdes, pin):
+            net = net_list[net_id]
+            for node in net.nodes:
+                if pass_through[component_ids[node.refdes]]:
+                    continue
+                if node.refdes == refdes and node.pin == pin:
+                    continue
+                result.append((node.refdes, node.pin, net.name))
+        return result
+
+    def shortest_path(self, refdes: str, pin: str, target_refdes: str) -> Optional[list[str]]:
+        """Returns shortest path from pin to component through pass-through components
+
+        Args:
+            refdes: refdes value of start pin
+            pin: pin number of start pin
+            target_refdes: refdes of target component
+
+        Returns:
+            Alternating net names and refdes, e.g. ['CLK', 'R5', 'CLK_R', 'DD2'],
+            None if target is not reachable
+        """
+        start = self._start(refdes, pin)
+        target = self.component_ids.get(target_refdes)
+        if start is None or target is None:
+            return None
+        _, net_parent, comp_parent = self._bfs(*start, target_comp=target)
+        if target not in comp_parent or target == start[1]:
+            return None
+        path = []
+        comp = target
+        while comp != -1:
+            path.append(self.components[comp])
+            net_id = comp_parent[comp]
+            path.append(self.netlist.net_list[net_id].name)
+            comp = net_parent[net_id]
+        path.reverse()
+        return path
@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+
+"""Fast probe of Cadence Allegro Netlist file header (without parsing the Netlist)
+
+Header example:
+    FILE_TYPE = EXPANDEDNETLIST;
+    { Using PSTWRITER 16.3.0 p002Mar-22-2016 at 10:54:51 }
+"""
+
+from __future__ import annotations
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable, Optional
+
+
+HEADER_PROBE_SIZE = 512       # Bytes read to validate the header
+SAMPLE_SIZE = 64 * 1024       # Bytes read to estimate the number of nets
+_NET_MARKER = b'\nNET_NAME'
+
+
+def parse_pstwriter_line(s: str) -> tuple[str, str, str]:
+    """Returns (version, date, time) from PSTWRITER header line
+
+    Args:
+        s: header line, e.g. '{ Using PSTWRITER 16.3.0 p002Mar-22-2016 at 10:54:51 }'
+
+    Raises:
+        IndexError: If line has too few fields
+    """
+    cfg = s.split()
+    version = cfg[3]
+    date = cfg[4][4:]  # Remove "p002" prefix
+    time = cfg[6]
+    return version, date, time
+
+
+class NetListHeader:
+    """Netlist file header info
+
+    Attributes:
+        fname: Netlist file name
+        file_type: FILE_TYPE value (e.g. 'EXPANDEDNETLIST'), '' if missing
+        version: Version of Cadence Allegro Netlist, '' if missing
+        date: Date of create Netlist, '' if missing
+        time: Time of create Netlist, '' if missing
+        file_size: File size in bytes
+        net_count: Number of nets (exact if net_count_exact, otherwise estimate)
+        net_count_exact: True if the whole file was sampled
+        problems: Header validation problems (empty for a valid header)
+    """
+
+    def __init__(self, fname: str | Path) -> None:
+        self.fname: str = str(fname)
+        self.file_type: str = ''
+        self.version: str = ''
+        self.date: str = ''
+        self.time: str = ''
+        self.file_size: int = 0
+        self.net_count: int = 0
+        self.net_count_exact: bool = False
+        self.problems: list[str] = []
+
+    @property
+    def valid(self) -> bool:
+        """True if FILE_TYPE and PSTWRITER header lines are valid"""
+        return not self.problems
+
+    def __str__(self) -> str:
+        if not self.valid:
+            return f"{self.fname}: INVALID ({'; '.join(self.problems)})"
+        nets = f'{self.net_count}' if self.net_count_exact else f'~{self.net_count}'
+        return (f'{self.fname}: Netlist {self.date} {self.time} (version: {self.version}) '
+                f'size: {self.file_size} nets: {nets}')
+
+
+def peek_header(fname: str | Path, sample_size: int = SAMPLE_SIZE) -> NetListHeader:
+    """Read Netlist header info from the beginning of file
+
+    Reads max(HEADER_PROBE_SIZE, sample_size) bytes: header lines are
+    validated, the number of nets is counted in the sample and scaled by
+    file size (exact for files not larger than the sample).
+
+    Args:
+        fname: Netlist file name
+        sample_size: bytes to sample for net count estimate (0 - header only)
+
+    Returns:
+        NetListHeader
+
+    Raises:
+        OSError: If file cannot be read
+    """
+    header = NetListHeader(fname)
+    with open(fname, 'rb') as f:
+        header.file_size = os.fstat(f.fileno()).st_size
+        data = f.read(max(HEADER_PROBE_SIZE, sample_size))
+
+    lines = data[:HEADER_PROBE_SIZE].decode('latin-1').splitlines()
+    first_line = lines[0].strip() if lines else ''
+    if first_line.startswith('FILE_TYPE'):
+        header.file_type = first_line.partition('=')[2].strip(' ;')
+    else:
+        header.problems.append('missing FILE_TYPE header')
+
+    second_line = lines[1] if len(lines) > 1 else ''
+    if 'PSTWRITER' in second_line:
+        try:
+            header.version, header.date, header.time = parse_pstwriter_line(second_line)
+        except IndexError:
+            pass
+    if not header.version:
+        header.problems.append('missing PSTWRITER header line')
+
+    if sample_size > 0:
+        count = data.count(_NET_MARKER)
+        if len(data) >= header.file_size:
+            header.net_count = count
+            header.net_count_exact = True
+        elif data:
+            header.net_count = round(count * header.file_size / len(data))
+    return header
+
+
+def _peek_or_error(fname: Path, sample_size: int) -> NetListHeader:
+    """peek_header() that records read errors as header problems"""
+    try:
+        return peek_header(fname, sample_size)
+    except OSError as e:
+        header = NetListHeader(fname)
+        header.problems.append(f'cannot read file: {e}')
+        return header
+
+
+def scan_headers(paths: Iterable[str | Path], pattern: str = '*.dat',
+                 sample_size: int = SAMPLE_SIZE, max_workers: Optional[int] = None) -> list[NetListHeader]:
+    """Probe headers of Netlist files in parallel
+
+    Args:
+        paths: Netlist files and/or directories (searched recursively)
+        pattern: file name pattern for directory search
+        sample_size: bytes to sample for net count estimate (0 - header only)
+        max_workers: number of worker threads (default: ThreadPoolExecutor default)
+
+    Returns:
+        Headers in input order (directory files sorted by path)
+    """
+    files: list[Path] = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            files.extend(sorted(p for p in path.rglob(pattern) if p.is_file()))
+        else:
+            files.append(path)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(lambda f: _peek_or_error(f, sample_size), files))
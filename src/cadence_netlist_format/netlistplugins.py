@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+
+"""Plugins called by the parser while it reads a Netlist
+
+All plugins of a Netlist share one read of the file. A plugin implements any
+of the hooks (subclass NetListPlugin, or any object with these methods):
+    on_header(netlist) - header parsed (version, date, time), before the first net
+    on_net(net)        - net complete (pin names read, filters applied), file order
+    on_node(net, node) - each node of the net, after on_net(net)
+    on_end(netlist)    - parsing complete: nets sorted, indexes built
+    report()           - result text (printed by the command line interface)
+
+Hooks are called by all parser engines (the parallel engine calls them in
+the main process). An exception raised by a hook stops parsing.
+
+Plugins are loaded by name: built-in plugins (PLUGINS), then entry points of
+group 'cadence_netlist_format.plugins' of installed packages, for example:
+    [project.entry-points."cadence_netlist_format.plugins"]
+    my_check = "my_package.checks:MyCheck"
+Entry point value is a class (or function) called without arguments.
+
+Example:
+    netlist = AllegroNetList(fname, plugins=[load_plugin('rules')])
+    print(netlist.plugins[0].report())
+"""
+
+from __future__ import annotations
+import logging
+from importlib.metadata import EntryPoint, entry_points
+from typing import Any, Callable, Iterable, TYPE_CHECKING, Union
+
+if TYPE_CHECKING:
+    from .allegronetlist import AllegroNetList
+    from .netrecords import Net, Node
+
+
+# Configure module logger
+logger = logging.getLogger(__name__)
+
+ENTRY_POINT_GROUP = 'cadence_netlist_format.plugins'
+HOOKS = ('on_header', 'on_net', 'on_node', 'on_end')
+
+
+class NetListPlugin:
+    """Base class of plugins (hooks that are not overridden are not called)"""
+
+    def on_header(self, netlist: AllegroNetList) -> None:
+        """Called when header is parsed, before the first net"""
+
+    def on_net(self, net: Net) -> None:
+        """Called for every net when it is complete"""
+
+    def on_node(self, net: Net, node: Node) -> None:
+        """Called for every node of net after on_net(net)"""
+
+    def on_end(self, netlist: AllegroNetList) -> None:
+        """Called when parsing is complete (nets sorted, indexes built)"""
+
+    def report(self) -> str:
+        """Returns result text ('' - nothing to report)"""
+        return ''
+
+
+# Built-in plugins: name -> 'module:attribute' (imported when loaded) or plugin factory
+PLUGINS: dict[str, Union[str, Callable[[], Any]]] = {
+    'rules': 'cadence_netlist_format.netlistrules:RuleCheckPlugin',
+    'fingerprint': 'cadence_netlist_format.netlistfingerprint:FingerprintPlugin',
+}
+
+
+def register_plugin(name: str, factory: Union[str, Callable[[], Any]]) -> None:
+    """Add built-in plugin (or replace plugin with the same name)"""
+    PLUGINS[name] = factory
+
+
+def plugin_names() -> list[str]:
+    """Returns names of built-in and installed (entry point) plugins"""
+    names = list(PLUGINS)
+    names += sorted(ep.name for ep in entry_points(group=ENTRY_POINT_GROUP) if ep.name not in PLUGINS)
+    return names
+
+
+def load_plugin(name: str) -> Any:
+    """Returns new instance of plugin
+
+    Raises:
+        ValueError: If plugin is unknown or cannot be imported
+    """
+    factory = PLUGINS.get(name)
+    try:
+        if factory is None:
+            found = list(entry_points(group=ENTRY_POINT_GROUP, name=name))
+            if not found:
+                raise ValueError(f"Unknown plugin '{name}' (available: {', '.join(plugin_names())})")
+            factory = found[0].load()
+        elif isinstance(factory, str):
+            factory = EntryPoint(name, factory, ENTRY_POINT_GROUP).load()
+    except (ImportError, AttributeError) as e:
+        error_msg = f"Cannot load plugin '{name}': {e}"
+        logger.error(error_msg)
+        raise ValueError(error_msg) from e
+    return factory()
+
+
+def _hooks(plugins: list[Any], hook: str) -> list[Callable]:
+    """Returns bound hook methods implemented by plugins (base class no-ops excluded)"""
+    base = getattr(NetListPlugin, hook)
+    return [getattr(plugin, hook) for plugin in plugins
+            if getattr(type(plugin), hook, base) is not base]
+
+
+class PluginHooks:
+    """Calls hooks of plugins for parser events
+
+    Parser engines call net() for each completed net; header is reported
+    before the first net (engines parse the header first), or at the end if
+    there are no nets.
+    """
+
+    def __init__(self, netlist: AllegroNetList, plugins: Iterable[Any]) -> None:
+        plugins = list(plugins)
+        self.netlist = netlist
+        self.header_done = False
+        self._on_header = _hooks(plugins, 'on_header')
+        self._on_net = _hooks(plugins, 'on_net')
+        self._on_node = _hooks(plugins, 'on_node')
+        self._on_end = _hooks(plugins, 'on_end')
+
+    def header(self) -> None:
+        self.header_done = True
+        for on_header in self._on_header:
+            on_header(self.netlist)
+
+    def net(self, net: Net) -> None:
+        if not self.header_done:
+            self.header()
+        for on_net in self._on_net:
+            on_net(net)
+        if self._on_node:
+            for node in net.nodes:
+                for on_node in self._on_node:
+                    on_node(net, node)
+
+    def end(self) -> None:
+        if not self.header_done:
+            self.header()
+        for on_end in self._on_end:
+            on_end(self.netlist)
@@ -0,0 +1,318 @@
+#!/usr/bin/env python
+
+"""Connectivity rule checks of Netlist
+
+Rules are visitors: check_netlist() calls visit_net() of all rules in one
+pass over the nets, then collects violations with finish(). Rules that only
+need the start/finish steps are not called per net: name rules work on the
+net names with C-level set/Counter operations, and multi_net_pin compares
+the node count with the pin index and scans nets only if a pin is repeated.
+RuleCheckPlugin runs the rules while the Netlist is parsed (plugin 'rules',
+see netlistplugins module). Rules:
+    multi_net_pin             - pin (refdes, pin) connected to more than one net
+    duplicate_net             - net name used by more than one net
+    net_case                  - net names that differ only in case
+    unconnected_connector_pin - connector pin alone on its net
+    fanout                    - net with more nodes than the limit (power nets excluded)
+
+Example:
+    report = netlist.check_rules()
+    print(report.to_text())
+    report.write_json('NetList.check.json')
+"""
+
+from __future__ import annotations
+import json
+import logging
+from collections import Counter
+from operator import attrgetter
+from pathlib import Path
+from typing import Iterable, NamedTuple, Optional, TYPE_CHECKING
+
+from .netlistgraph import refdes_prefix
+from .netlistplugins import NetListPlugin
+from .netsort import is_power_net
+
+if TYPE_CHECKING:
+    from .allegronetlist import AllegroNetList
+    from .netrecords import Net
+
+
+# Configure module logger
+logger = logging.getLogger(__name__)
+
+FANOUT_LIMIT = 64
+CONNECTOR_PREFIXES = ('J', 'X', 'XS', 'XP', 'CN', 'P')
+
+_net_name = attrgetter('name')
+
+
+class Violation(NamedTuple):
+    """Rule violation
+
+    Attributes:
+        rule: rule name
+        subject: net name, or 'refdes pin' for pin rules
+        message: what is wrong
+    """
+    rule: str
+    subject: str
+    message: str
+
+
+class Rule:
+    """Base class of rules
+
+    Attributes:
+        name: rule name (used in report and to select rules)
+    """
+    name = ''
+
+    def start(self, netlist: AllegroNetList) -> None:
+        """Called before the pass over nets (when run while parsing, only the
+        header is read yet: use nets and indexes of netlist in finish())"""
+
+    def visit_net(self, net: Net) -> None:
+        """Called for every net"""
+
+    def finish(self) -> list[Violation]:
+        """Called after the pass, returns violations"""
+        return []
+
+
+class MultiNetPinRule(Rule):
+    """Pin connected to more than one net
+
+    net_name_index has one entry per distinct pin, so with as many entries as
+    nodes no pin is repeated and the nets are not scanned again. Otherwise
+    nodes not on their index net ((refdes, pin) -> last net of pin) are
+    collected in a second pass.
+    """
+    name = 'multi_net_pin'
+
+    def start(self, netlist: AllegroNetList) -> None:
+        self.netlist = netlist
+        self.nodes = 0
+
+    def visit_net(self, net: Net) -> None:
+        self.nodes += len(net.nodes)
+
+    def finish(self) -> list[Violation]:
+        index = self.netlist.net_name_index
+        if len(index) == self.nodes:
+            return []
+        index_get = index.get
+        other_nets: dict[tuple[str, str], set[str]] = {}
+        for net in self.netlist.net_list:
+            name = net.name
+            for node in net.nodes:
+                key = (node.refdes, node.pin)
+                if index_get(key) != name:
+                    other_nets.setdefault(key, set()).add(name)
+        return [Violation(self.name, f'{key[0]} {key[1]}', f"on nets: {', '.join(sorted(nets | {index_get(key)}))}")
+                for key, nets in other_nets.items()]
+
+
+class DuplicateNetRule(Rule):
+    """Net name used by more than one net"""
+    name = 'duplicate_net'
+
+    def start(self, netlist: AllegroNetList) -> None:
+        self.netlist = netlist
+
+    def finish(self) -> list[Violation]:
+        names = list(map(_net_name, self.netlist.net_list))
+        if len(set(names)) == len(names):
+            return []
+        return [Violation(self.name, name, f'{count} nets with this name')
+                for name, count in sorted(Counter(names).items()) if count > 1]
+
+
+class NetCaseRule(Rule):
+    """Net names that differ only in case (e.g. 'Reset' and 'RESET')"""
+    name = 'net_case'
+
+    def start(self, netlist: AllegroNetList) -> None:
+        self.netlist = netlist
+
+    def finish(self) -> list[Violation]:
+        names = set(map(_net_name, self.netlist.net_list))
+        folded = Counter(map(str.casefold, names))
+        if len(folded) == len(names):
+            return []
+        groups: dict[str, list[str]] = {}
+        for name in sorted(names):
+            if folded[name.casefold()] > 1:
+                groups.setdefault(name.casefold(), []).append(name)
+        return sorted(Violation(self.name, group[0], f"differs only in case from: {', '.join(group[1:])}")
+                      for group in groups.values())
+
+
+class UnconnectedConnectorPinRule(Rule):
+    """Connector pin alone on its net (connected to nothing else)"""
+    name = 'unconnected_connector_pin'
+
+    def __init__(self, prefixes: Iterable[str] = CONNECTOR_PREFIXES) -> None:
+        """
+        Args:
+            prefixes: refdes prefixes of connectors (part before the first digit)
+        """
+        self.prefixes = frozenset(prefixes)
+
+    def start(self, netlist: AllegroNetList) -> None:
+        self.violations: list[Violation] = []
+
+    def visit_net(self, net: Net) -> None:
+        if len(net.nodes) == 1:
+            node = net.nodes[0]
+            if refdes_prefix(node.refdes) in self.prefixes:
+                self.violations.append(Violation(self.name, f'{node.refdes} {node.pin}',
+                                                 f'only node of net {net.name}'))
+
+    def finish(self) -> list[Violation]:
+        return self.violations
+
+
+class FanoutRule(Rule):
+    """Net with more nodes than the limit (power and ground nets are excluded)"""
+    name = 'fanout'
+
+    def __init__(self, limit: int = FANOUT_LIMIT) -> None:
+        """
+        Args:
+            limit: max number of nodes of a net
+        """
+        self.limit = limit
+
+    def start(self, netlist: AllegroNetList) -> None:
+        self.violations: list[Violation] = []
+
+    def visit_net(self, net: Net) -> None:
+        if len(net.nodes) > self.limit and not is_power_net(net.name):
+            self.violations.append(Violation(self.name, net.name, f'{len(net.nodes)} nodes (limit {self.limit})'))
+
+    def finish(self) -> list[Violation]:
+        return self.violations
+
+
+# Rule name -> rule class (rules with options use their defaults when selected by name)
+RULES: dict[str, type[Rule]] = {
+    rule.name: rule for rule in (MultiNetPinRule, DuplicateNetRule, NetCaseRule,
+                                 UnconnectedConnectorPinRule, FanoutRule)
+}
+
+
+def register_rule(rule: type[Rule]) -> None:
+    """Add rule class (or replace rule with the same name)"""
+    RULES[rule.name] = rule
+
+
+def default_rules(fanout_limit: int = FANOUT_LIMIT,
+                  connector_prefixes: Iterable[str] = CONNECTOR_PREFIXES) -> list[Rule]:
+    """Returns instances of all registered rules with the given options"""
+    options = {FanoutRule: (fanout_limit,), UnconnectedConnectorPinRule: (connector_prefixes,)}
+    return [rule(*options.get(rule, ())) for rule in RULES.values()]
+
+
+class RuleReport:
+    """Result of rule checks
+
+    Attributes:
+        fname: checked Netlist file name
+        rules: names of checked rules
+        violations: violations, grouped by rule in rule order
+    """
+
+    def __init__(self, fname: str, rules: list[str], violations: list[Violation]) -> None:
+        self.fname = fname
+        self.rules = rules
+        self.violations = violations
+
+    def __bool__(self) -> bool:
+        """True if there are violations"""
+        return bool(self.violations)
+
+    def counts(self) -> dict[str, int]:
+        """Returns number of violations of each checked rule"""
+        counts = Counter(v.rule for v in self.violations)
+        return {rule: counts[rule] for rule in self.rules}
+
+    def to_text(self) -> str:
+        """Returns violations as lines 'rule: subject: message' ('' if none)"""
+        lines = [f'{v.rule}: {v.subject}: {v.message}' for v in self.violations]
+        return '\n'.join(lines) + '\n' if lines else ''
+
+    def to_dict(self) -> dict:
+        return {'netlist': self.fname,
+                'counts': self.counts(),
+                'violations': [v._asdict() for v in self.violations]}
+
+    def write_json(self, fname: str | Path) -> None:
+        """Write report to JSON file
+
+        Raises:
+            IOError: If file write fails
+        """
+        try:
+            with open(fname, 'w') as f:
+                json.dump(self.to_dict(), f, indent=1)
+                f.write('\n')
+        except OSError as e:
+            error_msg = f"Failed to write check file '{fname}': {e}"
+            logger.error(error_msg)
+            raise IOError(error_msg)
+
+
+class RuleCheckPlugin(NetListPlugin):
+    """Plugin running rules in the parser pass over nets
+
+    Attributes:
+        rules: rules to run
+        rule_report: check result (set when parsing is complete)
+    """
+
+    def __init__(self, rules: Optional[Iterable[Rule]] = None) -> None:
+        """
+        Args:
+            rules: rules to run (default: default_rules())
+        """
+        self.rules = default_rules() if rules is None else list(rules)
+        self.rule_report: Optional[RuleReport] = None
+        self._visitors: list = []
+
+    def on_header(self, netlist: AllegroNetList) -> None:
+        for rule in self.rules:
+            rule.start(netlist)
+        self._visitors = [rule.visit_net for rule in self.rules if type(rule).visit_net is not Rule.visit_net]
+
+    def on_net(self, net: Net) -> None:
+        for visit in self._visitors:
+            visit(net)
+
+    def on_end(self, netlist: AllegroNetList) -> None:
+        violations = [violation for rule in self.rules for violation in rule.finish()]
+        self.rule_report = RuleReport(netlist.fname, [rule.name for rule in self.rules], violations)
+
+    def report(self) -> str:
+        if self.rule_report is None:
+            return ''
+        return f'Rule check: {len(self.rule_report.violations)} violations\n{self.rule_report.to_text()}'
+
+
+def check_netlist(netlist: AllegroNetList, rules: Optional[Iterable[Rule]] = None) -> RuleReport:
+    """Run rules in one pass over nets of parsed Netlist
+
+    Args:
+        netlist: parsed Netlist
+        rules: rules to run (default: default_rules())
+
+    Returns:
+        Rule check report
+    """
+    plugin = RuleCheckPlugin(rules)
+    plugin.on_header(netlist)
+    if plugin._visitors:
+        for net in netlist.net_list:
+            plugin.on_net(net)
+    plugin.on_end(netlist)
+    return plugin.rule_report
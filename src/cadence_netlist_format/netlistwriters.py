@@ -0,0 +1,266 @@
+#!/usr/bin/env python
+
+"""Output writers fed from one pass over Netlist nets
+
+write_outputs() walks net_list once and passes each batch of nets to all
+writers. Each writer runs in its own thread with a bounded queue of batches:
+the producer waits when a writer falls behind, so memory use does not grow
+with the Netlist size. Formats:
+    rpt    - report, the same as AllegroNetList.net_list2file()
+    csv    - pin table: net, refdes, pin, pin_name
+    json   - Netlist dump: header and nets with [refdes, pin, pin_name] nodes
+             (Node.to_list(): [refdes, pin] without pin name)
+    refdes - refdes report: 'refdes pin pin_name net' lines in natural refdes order
+    fingerprint - connectivity fingerprint sidecar (see netlistfingerprint module)
+
+Example:
+    write_outputs(netlist, {'rpt': 'NetList.rpt', 'csv': 'NetList.csv'})
+"""
+
+from __future__ import annotations
+import csv
+import json
+import logging
+import queue
+import threading
+from pathlib import Path
+from typing import Any, Iterable, Mapping, Optional, TextIO, TYPE_CHECKING
+
+from .allegronetlist import gc_paused
+from .netlistfingerprint import SIDECAR_SUFFIX, check_saveable, sidecar_data
+
+if TYPE_CHECKING:
+    from .allegronetlist import AllegroNetList
+    from .netrecords import Net
+
+
+# Configure module logger
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 1000  # Nets per batch passed to writers
+QUEUE_SIZE = 8     # Batches buffered per writer
+
+
+class NetWriter:
+    """Base class of writers: start(), write_nets() for each batch, finish()
+
+    Attributes:
+        name: format name
+        suffix: output file name ending (after file name stem)
+        newline: newline argument of open()
+    """
+    name = ''
+    suffix = ''
+    newline: Optional[str] = None
+
+    def __init__(self, netlist: AllegroNetList, f: TextIO, **options: Any) -> None:
+        """
+        Args:
+            netlist: Netlist to write
+            f: output file
+            options: format options (writers ignore options of other formats)
+        """
+        self.netlist = netlist
+        self.f = f
+        self.options = options
+
+    def start(self) -> None:
+        """Write output start"""
+
+    def write_nets(self, nets: list[Net]) -> None:
+        """Write batch of nets (in net_list order)"""
+
+    def finish(self) -> None:
+        """Write output end"""
+
+
+class RptWriter(NetWriter):
+    """Report (options: extended_nets, rule_report, refdes_report, see AllegroNetList.net_list2file)"""
+    name = 'rpt'
+    suffix = '.rpt'
+
+    def start(self) -> None:
+        self.f.write(self.netlist.net_list_title() + '\n')
+        self.warnings: list[str] = []
+        self.empty = True
+
+    def write_nets(self, nets: list[Net]) -> None:
+        lines, warnings = self.netlist._render_nets(nets)
+        self.f.write('\n'.join(lines) + '\n')
+        self.warnings.extend(warnings)
+        self.empty = False
+
+    def finish(self) -> None:
+        netlist = self.netlist
+        if self.empty:
+            self.f.write('\n')  # Empty net section line, as all_data2string()
+        self.f.write(netlist._single_net_warnings_section('\n'.join(self.warnings) + '\n' if self.warnings else ''))
+        if self.options.get('extended_nets') is not None:
+            self.f.write(netlist.extended_nets_section(self.options['extended_nets']))
+        if self.options.get('rule_report') is not None:
+            self.f.write(netlist.rule_check_section(self.options['rule_report']))
+        if self.options.get('refdes_report'):
+            self.f.write(netlist.refdes_report_section())
+        self.f.write('\n')
+
+
+class CsvWriter(NetWriter):
+    """Pin table, one row per node (missing pin name - empty)"""
+    name = 'csv'
+    suffix = '.csv'
+    newline = ''
+
+    def start(self) -> None:
+        self.writer = csv.writer(self.f)
+        self.writer.writerow(('net', 'refdes', 'pin', 'pin_name'))
+
+    def write_nets(self, nets: list[Net]) -> None:
+        self.writer.writerows((net.name, node.refdes, node.pin, node.pin_name or '')
+                              for net in nets for node in net.nodes)
+
+
+class JsonWriter(NetWriter):
+    """Netlist dump: {"netlist", "version", "date", "time", "nets": [{"name", "nodes"}]}"""
+    name = 'json'
+    suffix = '.json'
+
+    def start(self) -> None:
+        netlist = self.netlist
+        header = json.dumps({'netlist': netlist.fname, 'version': netlist.version,
+                             'date': netlist.date, 'time': netlist.time})
+        self.f.write(header[:-1] + ', "nets": [')
+        self.separator = '\n'
+
+    def write_nets(self, nets: list[Net]) -> None:
+        dumps = json.dumps
+        for net in nets:
+            self.f.write(self.separator)
+            self.f.write(dumps({'name': net.name, 'nodes': [node.to_list() for node in net.nodes]}))
+            self.separator = ',\n'
+
+    def finish(self) -> None:
+        self.f.write('\n]}\n')
+
+
+class RefdesWriter(NetWriter):
+    """Refdes report (AllegroNetList.iter_refdes_report(), from component index, nets are not used)"""
+    name = 'refdes'
+    suffix = '_refdes.rpt'
+
+    def finish(self) -> None:
+        self.f.writelines(self.netlist.iter_refdes_report())
+
+
+class FingerprintWriter(NetWriter):
+    """Connectivity fingerprint sidecar (see netlistfingerprint module, nets are not used)"""
+    name = 'fingerprint'
+    suffix = SIDECAR_SUFFIX
+
+    def finish(self) -> None:
+        json.dump(sidecar_data(self.netlist.fingerprint(), self.netlist.fname), self.f, indent=1)
+        self.f.write('\n')
+
+
+# Format name -> writer class
+WRITERS: dict[str, type[NetWriter]] = {
+    writer.name: writer for writer in (RptWriter, CsvWriter, JsonWriter, RefdesWriter, FingerprintWriter)
+}
+
+
+def writer_names() -> list[str]:
+    """Returns output format names"""
+    return list(WRITERS)
+
+
+def output_fnames(fname: str | Path, formats: Iterable[str]) -> dict[str, Path]:
+    """Returns output file names of formats: report 'fname', other formats
+    with their suffix instead of the fname suffix ('NetList.rpt' -> 'NetList.csv')
+
+    Raises:
+        ValueError: If format is unknown, or formats have the same file name
+                    ('-o NetList.csv --format rpt,csv')
+    """
+    fname = Path(fname)
+    outputs: dict[str, Path] = {}
+    formats_of: dict[Path, str] = {}
+    for name in formats:
+        if name not in WRITERS:
+            raise ValueError(f"Unknown output format '{name}' (valid: {', '.join(WRITERS)})")
+        outputs[name] = fname if name == 'rpt' else fname.with_name(fname.stem + WRITERS[name].suffix)
+        other = formats_of.setdefault(outputs[name].resolve(), name)
+        if other != name:
+            raise ValueError(f"Formats '{other}' and '{name}' have the same output file '{outputs[name]}'")
+    return outputs
+
+
+def _run_writer(writer_class: type[NetWriter], netlist: AllegroNetList, fname: str | Path,
+                options: dict[str, Any], batches: queue.Queue, errors: dict[str, Exception]) -> None:
+    """Writer thread: write batches until None; after an error keep taking batches (producer must not block)"""
+    done = False
+    try:
+        with open(fname, 'w', newline=writer_class.newline) as f:
+            writer = writer_class(netlist, f, **options)
+            writer.start()
+            while (nets := batches.get()) is not None:
+                writer.write_nets(nets)
+            done = True
+            writer.finish()
+    except Exception as e:
+        errors[str(fname)] = e
+        while not done and batches.get() is not None:
+            pass
+
+
+def write_outputs(netlist: AllegroNetList, outputs: Mapping[str, str | Path],
+                  batch_size: int = BATCH_SIZE, queue_size: int = QUEUE_SIZE, **options: Any) -> None:
+    """Write Netlist in several formats with one pass over nets
+
+    Args:
+        netlist: Netlist to write
+        outputs: format name -> output file name
+        batch_size: nets per batch
+        queue_size: batches buffered per writer
+        options: format options (rpt: extended_nets, rule_report, refdes_report)
+
+    Raises:
+        ValueError: If format is unknown, or fingerprint of partial Netlist is written
+        IOError: If an output file write fails (other outputs are completed)
+    """
+    writers = []
+    for name, fname in outputs.items():
+        writer_class = WRITERS.get(name)
+        if writer_class is None:
+            raise ValueError(f"Unknown output format '{name}' (valid: {', '.join(WRITERS)})")
+        writers.append((writer_class, fname))
+    if 'fingerprint' in outputs:
+        check_saveable(netlist)
+
+    errors: dict[str, Exception] = {}
+    queues: list[queue.Queue] = []
+    threads = []
+    # Writers create millions of short-lived strings (see gc_paused)
+    with gc_paused():
+        try:
+            for writer_class, fname in writers:
+                batches: queue.Queue = queue.Queue(maxsize=queue_size)
+                thread = threading.Thread(target=_run_writer, name=f'netlist_writer_{writer_class.name}',
+                                          args=(writer_class, netlist, fname, options, batches, errors))
+                thread.start()
+                queues.append(batches)
+                threads.append(thread)
+            net_list = netlist.net_list
+            for start in range(0, len(net_list), batch_size):
+                batch = net_list[start:start + batch_size]
+                for batches in queues:
+                    batches.put(batch)
+        finally:
+            for batches in queues:
+                batches.put(None)
+            for thread in threads:
+                thread.join()
+
+    if errors:
+        fname, e = next(iter(errors.items()))
+        error_msg = f"Failed to write output file '{fname}': {e}"
+        logger.error(error_msg)
+        raise IOError(error_msg)
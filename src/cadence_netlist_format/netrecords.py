@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+
+"""Net and Node records of Netlist
+
+Records have __slots__ (no per-object dict, no list buffer) and keep the
+list view of the original nested lists, so existing code that indexes
+them keeps working:
+    net[0] == net.name, net[1] == net.nodes
+    node[0] == node.refdes, node[1] == node.pin, node[2] == node.pin_name
+    node == ['DD1', 'A1', 'CLK'], len(node) == 2 if node has no pin name
+The mutating part of the list protocol used with the lists also works:
+    net[0] = name, net[1] = nodes
+    node[i] = value (i < len(node)), node.append(pin_name) (node without pin name)
+"""
+
+from __future__ import annotations
+from typing import Iterator, Optional
+
+
+class Node:
+    """Component pin connected to net
+
+    Attributes:
+        refdes: reference designator (e.g. 'DD1')
+        pin: pin number (e.g. 'A1')
+        pin_name: pin name (e.g. 'CLK'), None if Netlist has no pin name
+    """
+
+    __slots__ = ('refdes', 'pin', 'pin_name')
+
+    def __init__(self, refdes: str, pin: str, pin_name: Optional[str] = None) -> None:
+        self.refdes = refdes
+        self.pin = pin
+        self.pin_name = pin_name
+
+    def to_list(self) -> list[str]:
+        """Returns node as list: [refdes, pin, pin_name] ([refdes, pin] without pin name)"""
+        if self.pin_name is None:
+            return [self.refdes, self.pin]
+        return [self.refdes, self.pin, self.pin_name]
+
+    def __len__(self) -> int:
+        return 2 if self.pin_name is None else 3
+
+    def __getitem__(self, i):
+        if i == 0:
+            return self.refdes
+        if i == 1:
+            return self.pin
+        return self.to_list()[i]
+
+    def __setitem__(self, i: int, value) -> None:
+        size = len(self)
+        if not -size <= i < size:
+            raise IndexError('Node index out of range')
+        i %= size
+        if i == 0:
+            self.refdes = value
+        elif i == 1:
+            self.pin = value
+        else:
+            self.pin_name = value
+
+    def append(self, pin_name: str) -> None:
+        """Add pin name to node without pin name (as list.append() did)
+
+        Raises:
+            ValueError: If node has pin name (node has 3 items at most)
+        """
+        if self.pin_name is not None:
+            raise ValueError(f'Node {self.refdes} {self.pin} has pin name already')
+        self.pin_name = pin_name
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.to_list())
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Node):
+            return (self.refdes == other.refdes and self.pin == other.pin
+                    and self.pin_name == other.pin_name)
+        if isinstance(other, (list, tuple)):
+            return self.to_list() == list(other)
+        return NotImplemented
+
+    def __lt__(self, other) -> bool:
+        if isinstance(other, (Node, list, tuple)):
+            return self.to_list() < list(other)
+        return NotImplemented
+
+    __hash__ = None  # Mutable, as the list it replaces
+
+    def __repr__(self) -> str:
+        return f'Node{tuple(self.to_list())!r}'
+
+
+class Net:
+    """Net with connected nodes
+
+    Attributes:
+        name: net name
+        nodes: connected nodes in Netlist file order
+    """
+
+    __slots__ = ('name', 'nodes')
+
+    def __init__(self, name: str, nodes: Optional[list[Node]] = None) -> None:
+        self.name = name
+        self.nodes: list[Node] = [] if nodes is None else nodes
+
+    def to_list(self) -> list:
+        """Returns net as nested lists: [name, [[refdes, pin, pin_name], ...]]"""
+        return [self.name, [node.to_list() for node in self.nodes]]
+
+    def __len__(self) -> int:
+        return 2
+
+    def __getitem__(self, i):
+        if i == 0:
+            return self.name
+        if i == 1:
+            return self.nodes
+        return [self.name, self.nodes][i]
+
+    def __setitem__(self, i: int, value) -> None:
+        if not -2 <= i < 2:
+            raise IndexError('Net index out of range')
+        i %= 2
+        if i == 0:
+            self.name = value
+        else:
+            self.nodes = value
+
+    def __iter__(self) -> Iterator:
+        return iter((self.name, self.nodes))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Net):
+            return self.name == other.name and self.nodes == other.nodes
+        if isinstance(other, (list, tuple)):
+            return len(other) == 2 and self.name == other[0] and self.nodes == other[1]
+        return NotImplemented
+
+    def __lt__(self, other) -> bool:
+        if isinstance(other, (Net, list, tuple)):
+            return [self.name, self.nodes] < list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f'Net({self.name!r}, {self.nodes!r})'
@@ -0,0 +1,213 @@
+#!/usr/bin/env python
+
+"""Trigram index for net name search (substring, glob, regular expression)
+
+Each 3-character substring (trigram) of casefolded net names maps to the
+ascending list of net indexes that contain it. A query is reduced to the
+literal parts it must contain; the posting lists of their trigrams are
+intersected and only these candidates are checked with the exact matcher.
+"""
+
+from __future__ import annotations
+import fnmatch
+import re
+from array import array
+from bisect import bisect_left
+from typing import Callable, Iterable, Optional
+
+
+TRIGRAM = 3
+_GLOB_SPECIAL = re.compile(r'\*|\?|\[!?\]?[^\]]*\]?')
+_REGEX_SPECIAL = set('.^$*+?{}[]()|\\')
+_REGEX_QUANTIFIERS = set('*?{')
+_REGEX_CLASS_ESCAPES = set('dDsSwWbBAZ')  # Match no character, or one of a class
+
+
+def _trigrams(text: str) -> set[str]:
+    """Returns trigrams of text"""
+    return {text[i:i + TRIGRAM] for i in range(len(text) - TRIGRAM + 1)}
+
+
+def _glob_literals(pattern: str) -> list[str]:
+    """Returns literal parts of glob pattern"""
+    return [part for part in _GLOB_SPECIAL.split(pattern) if part]
+
+
+def _regex_set_end(pattern: str, i: int) -> int:
+    """Returns index after character set starting at pattern[i] == '[', -1 if not terminated"""
+    i += 1
+    if pattern.startswith('^', i):
+        i += 1
+    if pattern.startswith(']', i):  # ']' first in set is a literal
+        i += 1
+    while i < len(pattern):
+        if pattern[i] == '\\':
+            i += 2
+        elif pattern[i] == ']':
+            return i + 1
+        else:
+            i += 1
+    return -1
+
+
+def _regex_literals(pattern: str) -> list[str]:
+    """Returns literal parts that every match of regular expression contains
+
+    Conservative (a missing literal only costs candidates, a wrong one loses
+    matches): patterns with alternation, groups or escapes other than
+    character classes and escaped punctuation give no literals.
+    """
+    if '|' in pattern or '(' in pattern:
+        return []
+    literals = []
+    run = []
+    i = 0
+    while i < len(pattern):
+        c = pattern[i]
+        if c == '\\':
+            if i + 1 == len(pattern):
+                return []
+            escaped = pattern[i + 1]
+            i += 2
+            if escaped in _REGEX_CLASS_ESCAPES:
+                literals.append(''.join(run))
+                run = []
+                continue
+            if escaped.isalnum() or escaped == '_':
+                return []  # \x41, \u0041, \N{...}, \n, \0, backreference: not a plain character
+            c = escaped
+        elif c == '[':
+            i = _regex_set_end(pattern, i)
+            if i < 0:
+                return []
+            literals.append(''.join(run))
+            run = []
+            continue
+        elif c == '{':
+            # Skip quantifier {m,n} (or literal '{': dropping it is conservative)
+            end = pattern.find('}', i + 1)
+            i = len(pattern) if end < 0 else end + 1
+            literals.append(''.join(run))
+            run = []
+            continue
+        elif c in _REGEX_SPECIAL:
+            i += 1
+            literals.append(''.join(run))
+            run = []
+            continue
+        else:
+            i += 1
+        if i < len(pattern) and pattern[i] in _REGEX_QUANTIFIERS:
+            # Optional character: ends the literal run
+            literals.append(''.join(run))
+            run = []
+            continue
+        run.append(c)
+    literals.append(''.join(run))
+    return [literal for literal in literals if literal]
+
+
+class NetNameIndex:
+    """Trigram index of net names
+
+    Attributes:
+        names: net names (index in list - net index)
+        postings: trigram -> ascending net indexes (casefolded names)
+    """
+
+    def __init__(self, names: Iterable[str]) -> None:
+        """Build index (one pass over net names)
+
+        Args:
+            names: net names in net index order
+        """
+        self.names: list[str] = list(names)
+        postings: dict[str, array] = {}
+        for i, name in enumerate(self.names):
+            for trigram in _trigrams(name.casefold()):
+                posting = postings.get(trigram)
+                if posting is None:
+                    postings[trigram] = array('i', [i])
+                else:
+                    posting.append(i)
+        self.postings = postings
+
+    def _candidates(self, literals: list[str]) -> Iterable[int]:
+        """Returns net indexes that may contain all literals (casefolded)"""
+        trigrams = set()
+        for literal in literals:
+            trigrams |= _trigrams(literal.casefold())
+        if not trigrams:
+            return range(len(self.names))
+        posting_lists = []
+        for trigram in trigrams:
+            posting = self.postings.get(trigram)
+            if posting is None:
+                return []
+            posting_lists.append(posting)
+        posting_lists.sort(key=len)
+        candidates = posting_lists[0]
+        for posting in posting_lists[1:]:
+            size = len(posting)
+            candidates = [i for i in candidates
+                          if (k := bisect_left(posting, i)) < size and posting[k] == i]
+            if not candidates:
+                break
+        return candidates
+
+    def _search(self, literals: list[str], match: Callable[[str], bool]) -> list[int]:
+        """Returns ascending net indexes of candidates accepted by match"""
+        names = self.names
+        return [i for i in self._candidates(literals) if match(names[i])]
+
+    def substring(self, text: str, ignore_case: bool = False) -> list[int]:
+        """Returns net indexes of net names containing text
+
+        Args:
+            text: substring (e.g. 'DDR_DQ')
+            ignore_case: if True, compare case-insensitively
+        """
+        if ignore_case:
+            folded = text.casefold()
+            return self._search([text], lambda name: folded in name.casefold())
+        return self._search([text], lambda name: text in name)
+
+    def glob(self, pattern: str, ignore_case: bool = False) -> list[int]:
+        """Returns net indexes of net names matching glob pattern
+
+        Args:
+            pattern: glob pattern (e.g. 'DDR?_DQ*')
+            ignore_case: if True, compare case-insensitively
+        """
+        regex = re.compile(fnmatch.translate(pattern), re.IGNORECASE if ignore_case else 0)
+        return self._search(_glob_literals(pattern), lambda name: regex.match(name) is not None)
+
+    def regex(self, pattern: str, ignore_case: bool = False) -> list[int]:
+        """Returns net indexes of net names matching regular expression (re.search)
+
+        Args:
+            pattern: regular expression
+            ignore_case: if True, compare case-insensitively
+
+        Raises:
+            re.error: If pattern is not a valid regular expression
+        """
+        regex = re.compile(pattern, re.IGNORECASE if ignore_case else 0)
+        return self._search(_regex_literals(pattern), lambda name: regex.search(name) is not None)
+
+    def search(self, query: str, mode: str = 'substring', ignore_case: bool = False) -> list[int]:
+        """Returns net indexes matching query
+
+        Args:
+            query: search text
+            mode: 'substring', 'glob' or 'regex'
+            ignore_case: if True, compare case-insensitively
+
+        Raises:
+            ValueError: If mode is unknown
+        """
+        method: Optional[Callable[[str, bool], list[int]]] = {
+            'substring': self.substring, 'glob': self.glob, 'regex': self.regex}.get(mode)
+        if method is None:
+            raise ValueError(f"Unknown search mode '{mode}' (valid: substring, glob, regex)")
+        return method(query, ignore_case)
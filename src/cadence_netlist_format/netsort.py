@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+
+"""Sort modes for nets and for nodes within a net
+
+Sort keys are computed once per item (list.sort(key=...)), and natural
+keys once per distinct string, so sorting never calls Python comparison
+functions. New modes can be added with register_net_sort()/register_node_sort().
+"""
+
+from __future__ import annotations
+import re
+from typing import Callable
+
+from .netrecords import Net, Node
+
+
+_NATURAL_SPLIT_RE = re.compile(r'(\d+)')
+_NATURAL_SIMPLE_MATCH = re.compile(r'(\D*)(\d+)').fullmatch  # 'R10', 'U2', '10': one number at end
+
+# Power/ground net names: GND, AGND_1, VCC, VDD_CORE, +24V, 3V3, -12V, +1.8V, ...
+POWER_NET_RE = re.compile(r'^(?:[AD]?GND|GND|PGND|SGND|VSS|VCC|VDD|VEE|VBAT|VIN|VREF)'
+                          r'|^[+-]?\d+(?:[.V]\d+)?V\d*(?:_|$)', re.IGNORECASE)
+
+
+def natural_key(s: str) -> tuple:
+    """Returns natural sort key: 'DATA2' < 'DATA10', 'R2' < 'R10'"""
+    m = _NATURAL_SIMPLE_MATCH(s)
+    if m is not None:
+        # Usual refdes/pin form: same key as below without split and generator
+        return ((m[1], int(m[2])), ('', -1))
+    parts = _NATURAL_SPLIT_RE.split(s)
+    # Odd items are numbers; (text, number) pairs keep keys comparable
+    return tuple((parts[i], int(parts[i + 1]) if i + 1 < len(parts) else -1)
+                 for i in range(0, len(parts), 2))
+
+
+def is_power_net(name: str) -> bool:
+    """True if net name looks like power or ground net"""
+    return POWER_NET_RE.match(name) is not None
+
+
+def _cached(key: Callable[[str], tuple]) -> Callable[[str], tuple]:
+    """Returns key function computing key once per distinct string"""
+    cache: dict[str, tuple] = {}
+
+    def cached_key(s: str) -> tuple:
+        k = cache.get(s)
+        if k is None:
+            k = cache[s] = key(s)
+        return k
+    return cached_key
+
+
+def _net_key_name(net: Net) -> str:
+    return net.name
+
+
+def _net_key_natural(net: Net) -> tuple:
+    return natural_key(net.name)
+
+
+def _net_key_fanout(net: Net) -> tuple:
+    return (-len(net.nodes), natural_key(net.name))
+
+
+def _net_key_power(net: Net) -> tuple:
+    return (not is_power_net(net.name), natural_key(net.name))
+
+
+# Net sort mode -> factory of key function for nets
+NET_SORT_MODES: dict[str, Callable[[], Callable[[Net], object]]] = {
+    'name': lambda: _net_key_name,          # lexicographic (default)
+    'natural': lambda: _net_key_natural,    # DATA2 before DATA10
+    'fanout': lambda: _net_key_fanout,      # most nodes first
+    'power': lambda: _net_key_power,        # power/ground nets first, then natural
+}
+
+
+def _node_key_natural() -> Callable[[Node], tuple]:
+    refdes_key = _cached(natural_key)
+    pin_key = _cached(natural_key)
+    return lambda node: (refdes_key(node.refdes), pin_key(node.pin))
+
+
+def _node_key_refdes() -> Callable[[Node], tuple]:
+    pin_key = _cached(natural_key)
+    return lambda node: (node.refdes, pin_key(node.pin))
+
+
+# Node sort mode -> factory of key function for nodes ('file' - order in Netlist file)
+NODE_SORT_MODES: dict[str, Callable[[], Callable[[Node], object]]] = {
+    'natural': _node_key_natural,   # R2 before R10, pins natural
+    'refdes': _node_key_refdes,     # refdes lexicographic, pins natural
+}
+
+
+def register_net_sort(mode: str, key_factory: Callable[[], Callable[[Net], object]]) -> None:
+    """Add net sort mode
+
+    Args:
+        mode: mode name
+        key_factory: returns key function for Net
+    """
+    NET_SORT_MODES[mode] = key_factory
+
+
+def register_node_sort(mode: str, key_factory: Callable[[], Callable[[Node], object]]) -> None:
+    """Add node sort mode
+
+    Args:
+        mode: mode name
+        key_factory: returns key function for Node
+    """
+    NODE_SORT_MODES[mode] = key_factory
+
+
+def net_sort_modes() -> list[str]:
+    """Returns names of net sort modes"""
+    return list(NET_SORT_MODES)
+
+
+def node_sort_modes() -> list[str]:
+    """Returns names of node sort modes"""
+    return ['file'] + list(NODE_SORT_MODES)
@@ -0,0 +1,177 @@
+#!/usr/bin/env python
+
+"""Diagnostics of malformed Netlist lines
+
+Parser engines record each line they cannot parse (cheaply: no logging per
+line) and resynchronize at the next NET_NAME. Parsing fails with
+ParseErrorLimit when the error budget is exceeded; otherwise one summary is
+logged when parsing is complete.
+
+Example:
+    netlist = AllegroNetList(fname, max_errors=None)  # recover from any number of errors
+    for diagnostic in netlist.diagnostics:
+        print(diagnostic)
+"""
+
+from __future__ import annotations
+import logging
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Iterable, Iterator, NamedTuple, Optional
+
+
+# Configure module logger
+logger = logging.getLogger(__name__)
+
+MAX_PARSE_ERRORS = 50          # Default error budget: fail if more than 50 parsing errors occur
+MAX_STORED_DIAGNOSTICS = 1000  # Further errors are counted, not stored
+SNIPPET_LENGTH = 80
+SUMMARY_LINES = 10             # Diagnostics listed in summary()
+_READ_SIZE = 1024 * 1024
+_NEWLINE_RE = re.compile(b'\n')
+
+
+class ParseDiagnostic(NamedTuple):
+    """Malformed line
+
+    Attributes:
+        line: line number (1 - first line)
+        offset: byte offset of line start in file (-1 - not resolved)
+        state: parser state: 'header', 'net_name', 'node', 'pin_name'
+        message: what is wrong
+        snippet: start of line text
+    """
+    line: int
+    offset: int
+    state: str
+    message: str
+    snippet: str
+
+    def __str__(self) -> str:
+        offset = f', byte {self.offset}' if self.offset >= 0 else ''
+        return f'line {self.line}{offset} [{self.state}]: {self.message}: {self.snippet!r}'
+
+
+class ParseErrorLimit(ValueError):
+    """More parsing errors than the error budget allows"""
+
+
+class Diagnostics:
+    """Collected parsing errors with error budget
+
+    Attributes:
+        max_errors: errors tolerated before parsing fails, None - no limit
+        count: number of errors (including errors not stored)
+        items: first MAX_STORED_DIAGNOSTICS diagnostics in file order
+    """
+
+    def __init__(self, max_errors: Optional[int] = MAX_PARSE_ERRORS) -> None:
+        self.max_errors = max_errors
+        self.count = 0
+        self.items: list[ParseDiagnostic] = []
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __bool__(self) -> bool:
+        return self.count > 0
+
+    def __iter__(self) -> Iterator[ParseDiagnostic]:
+        return iter(self.items)
+
+    def add(self, line: int, state: str, message: str, text: str, offset: int = -1) -> None:
+        """Record malformed line
+
+        Args:
+            line: line number
+            state: parser state
+            message: what is wrong
+            text: line text (stored truncated to SNIPPET_LENGTH)
+            offset: byte offset of line start if known
+
+        Raises:
+            ParseErrorLimit: If error budget is exceeded
+        """
+        self.count += 1
+        if len(self.items) < MAX_STORED_DIAGNOSTICS:
+            self.items.append(ParseDiagnostic(line, offset, state, message, text[:SNIPPET_LENGTH]))
+        self._check_budget()
+
+    def extend(self, other: Diagnostics, line_offset: int = 0) -> None:
+        """Add diagnostics of a file part starting after line_offset lines
+
+        Raises:
+            ParseErrorLimit: If error budget is exceeded
+        """
+        room = MAX_STORED_DIAGNOSTICS - len(self.items)
+        self.items.extend(d._replace(line=d.line + line_offset) for d in other.items[:max(room, 0)])
+        self.count += other.count
+        self._check_budget()
+
+    def select(self, errors: Iterable[int]) -> Diagnostics:
+        """Returns diagnostics (without error budget) of errors with ascending indexes (0 - first error)"""
+        selected = Diagnostics(None)
+        for k in errors:
+            selected.count += 1
+            if k < len(self.items):
+                selected.items.append(self.items[k])
+        return selected
+
+    def _check_budget(self) -> None:
+        if self.max_errors is not None and self.count > self.max_errors:
+            first = self.items[0]
+            error_msg = (f'Too many parsing errors ({self.count} errors, first at line {first.line}: '
+                         f'{first.message}). File may be corrupted or not a valid netlist.')
+            logger.error(error_msg)
+            raise ParseErrorLimit(error_msg)
+
+    def resolve_offsets(self, fname: str | Path) -> None:
+        """Fill byte offsets of stored diagnostics (one binary pass over file up to last error)"""
+        pending = sorted({d.line for d in self.items if d.offset < 0})
+        if not pending:
+            return
+        offsets = _line_offsets(fname, pending)
+        self.items = [d._replace(offset=offsets.get(d.line, -1)) if d.offset < 0 else d
+                      for d in self.items]
+
+    def summary(self, limit: int = SUMMARY_LINES) -> str:
+        """Returns report: error count by parser state and first `limit` diagnostics"""
+        if not self.count:
+            return 'No parsing errors'
+        by_state = Counter(d.state for d in self.items)
+        states = ', '.join(f'{state}: {n}' for state, n in by_state.most_common())
+        errors = 'error' if self.count == 1 else 'errors'
+        lines = [f'{self.count} parsing {errors}, lines skipped up to next NET_NAME ({states})']
+        lines += [f'  {d}' for d in self.items[:limit]]
+        if self.count > limit:
+            lines.append(f'  ... and {self.count - limit} more')
+        return '\n'.join(lines)
+
+
+def _line_offsets(fname: str | Path, lines: Iterable[int]) -> dict[int, int]:
+    """Returns byte offsets of line starts: {line number: offset}"""
+    offsets = {}
+    wanted = iter(sorted(set(lines)))
+    target = next(wanted, None)
+    line = 1       # Number of line starting at byte `start`
+    start = 0
+    position = 0   # Byte offset of block start
+    with open(fname, 'rb') as f:
+        while target is not None:
+            block = f.read(_READ_SIZE)
+            if not block:
+                break
+            newlines = block.count(b'\n')
+            if target <= line + newlines:
+                # Block has target lines: positions of all line starts in block
+                line_starts = [m.end() for m in _NEWLINE_RE.finditer(block)]
+                while target is not None and target <= line + newlines:
+                    k = target - line
+                    offsets[target] = start if k == 0 else position + line_starts[k - 1]
+                    target = next(wanted, None)
+            if newlines:
+                line += newlines
+                start = position + block.rfind(b'\n') + 1
+            position += len(block)
+    return offsets
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+
+"""Progress reporting and cancellation of Netlist parsing
+
+Example:
+    token = CancelToken()
+    netlist = AllegroNetList(fname, progress=print, cancel_token=token)
+    # token.cancel() from another thread (or from the progress callback)
+    # stops parsing with ParseCancelled
+"""
+
+from __future__ import annotations
+import threading
+from typing import Callable, NamedTuple
+
+
+PROGRESS_INTERVAL = 1000  # Nets between progress callbacks / cancellation checks
+
+
+class ParseCancelled(Exception):
+    """Parsing was stopped by CancelToken"""
+
+
+class ParseProgress(NamedTuple):
+    """Parsing progress passed to progress callback
+
+    Attributes:
+        bytes_read: bytes read from file (approximate: includes read-ahead buffer)
+        total_bytes: file size
+        nets: net blocks parsed (including nets skipped by net filter)
+        nodes: nodes parsed
+        elapsed: seconds since parsing started
+    """
+    bytes_read: int
+    total_bytes: int
+    nets: int
+    nodes: int
+    elapsed: float
+
+    @property
+    def fraction(self) -> float:
+        """Done part of file: 0.0 ... 1.0"""
+        return min(1.0, self.bytes_read / self.total_bytes) if self.total_bytes else 1.0
+
+
+ProgressCallback = Callable[[ParseProgress], None]
+
+
+class CancelToken:
+    """Thread-safe cancellation request, checked by parser every PROGRESS_INTERVAL nets"""
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        """Request cancellation"""
+        self._event.set()
+
+    def reset(self) -> None:
+        """Clear cancellation request (to reuse token)"""
+        self._event.clear()
+
+    @property
+    def cancelled(self) -> bool:
+        """True if cancellation was requested"""
+        return self._event.is_set()
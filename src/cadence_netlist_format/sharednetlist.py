@@ -0,0 +1,302 @@
+#!/usr/bin/env python
+
+"""Read-only Netlist in shared memory for multiprocessing workers
+
+A parsed Netlist is published into one multiprocessing.shared_memory block
+in a flat encoding; workers attach by block name without parsing or
+unpickling nested lists and use the same lookup methods as AllegroNetList.
+
+Block layout (native byte order, sections aligned to 8 bytes):
+    header       HEADER_FIELDS int64 values (magic, counts, section offsets)
+    str_offsets  int64[n_strings + 1]  - string table offsets
+    str_data     utf-8 bytes of all distinct strings
+    net_names    int32[n_nets]         - string id of net name
+    net_indptr   int32[n_nets + 1]     - nodes of net i: net_indptr[i]:net_indptr[i + 1]
+    node_refdes  int32[n_nodes]        - string id of refdes
+    node_pin     int32[n_nodes]        - string id of pin
+    node_name    int32[n_nodes]        - string id of pin name (-1 - no pin name)
+    node_net     int32[n_nodes]        - net index of node
+    pin_table    int32[table_size]     - (refdes, pin) hash table of node indexes (-1 - empty)
+"""
+
+from __future__ import annotations
+import logging
+import struct
+import zlib
+from array import array
+from multiprocessing import resource_tracker, shared_memory
+from typing import Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .allegronetlist import AllegroNetList
+
+
+logger = logging.getLogger(__name__)
+
+MAGIC = 0x434E4C53484D0001  # 'CNLSHM' + layout version
+HEADER_FIELDS = 16
+_HEADER = struct.Struct(f'{HEADER_FIELDS}q')
+_EMPTY = -1
+
+# Header field indexes
+(_MAGIC, _N_STRINGS, _N_NETS, _N_NODES, _TABLE_SIZE, _STR_DATA_SIZE,
+ _FNAME, _DATE, _TIME, _VERSION) = range(10)
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def _pin_hash(refdes: bytes, pin: bytes) -> int:
+    """Returns hash of (refdes, pin), same in all processes (unlike hash())"""
+    return zlib.crc32(pin, zlib.crc32(refdes + b'\0'))
+
+
+def _layout(n_strings: int, str_data_size: int, n_nets: int, n_nodes: int,
+            table_size: int) -> tuple[dict[str, int], int]:
+    """Returns (section name -> byte offset, total size)"""
+    sections = [('str_offsets', 8 * (n_strings + 1)), ('str_data', str_data_size),
+                ('net_names', 4 * n_nets), ('net_indptr', 4 * (n_nets + 1)),
+                ('node_refdes', 4 * n_nodes), ('node_pin', 4 * n_nodes),
+                ('node_name', 4 * n_nodes), ('node_net', 4 * n_nodes),
+                ('pin_table', 4 * table_size)]
+    offsets = {}
+    offset = _HEADER.size
+    for name, size in sections:
+        offset = _align(offset)
+        offsets[name] = offset
+        offset += size
+    return offsets, max(offset, 1)
+
+
+class SharedNetList:
+    """Netlist published in (or attached to) a shared memory block
+
+    Attributes:
+        name: shared memory block name (pass to attach() in workers)
+        owner: True in the publishing process (unlink() removes the block)
+        fname, date, time, version: Netlist file info
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool) -> None:
+        self._shm = shm
+        self.owner = owner
+        buf = shm.buf
+        header = _HEADER.unpack_from(buf, 0)
+        if header[_MAGIC] != MAGIC:
+            shm.close()
+            raise ValueError(f"Shared memory block '{shm.name}' is not a shared Netlist")
+        offsets, _ = _layout(header[_N_STRINGS], header[_STR_DATA_SIZE], header[_N_NETS],
+                             header[_N_NODES], header[_TABLE_SIZE])
+
+        def section(name: str, fmt: str, count: int) -> memoryview:
+            start = offsets[name]
+            return buf[start:start + count * struct.calcsize(fmt)].cast(fmt)
+
+        n_nets, n_nodes = header[_N_NETS], header[_N_NODES]
+        self._str_offsets = section('str_offsets', 'q', header[_N_STRINGS] + 1)
+        self._str_data = section('str_data', 'B', header[_STR_DATA_SIZE])
+        self._net_names = section('net_names', 'i', n_nets)
+        self._net_indptr = section('net_indptr', 'i', n_nets + 1)
+        self._node_refdes = section('node_refdes', 'i', n_nodes)
+        self._node_pin = section('node_pin', 'i', n_nodes)
+        self._node_name = section('node_name', 'i', n_nodes)
+        self._node_net = section('node_net', 'i', n_nodes)
+        self._pin_table = section('pin_table', 'i', header[_TABLE_SIZE])
+        self._views = [self._str_offsets, self._str_data, self._net_names, self._net_indptr,
+                       self._node_refdes, self._node_pin, self._node_name, self._node_net,
+                       self._pin_table]
+        self.name: str = shm.name
+        self.fname = self._string(header[_FNAME])
+        self.date = self._string(header[_DATE])
+        self.time = self._string(header[_TIME])
+        self.version = self._string(header[_VERSION])
+
+    @classmethod
+    def publish(cls, netlist: AllegroNetList, name: Optional[str] = None) -> SharedNetList:
+        """Copy Netlist into a new shared memory block
+
+        Args:
+            netlist: parsed Netlist
+            name: block name (default: generated unique name)
+
+        Returns:
+            Owning SharedNetList (call unlink() when workers are done)
+        """
+        string_ids: dict[str, int] = {}
+        strings: list[bytes] = []
+
+        def string_id(s: str) -> int:
+            sid = string_ids.get(s)
+            if sid is None:
+                sid = string_ids[s] = len(strings)
+                strings.append(s.encode('utf-8'))
+            return sid
+
+        header = [0] * HEADER_FIELDS
+        header[_MAGIC] = MAGIC
+        for field, value in ((_FNAME, netlist.fname), (_DATE, netlist.date),
+                             (_TIME, netlist.time), (_VERSION, netlist.version)):
+            header[field] = string_id(str(value))
+
+        net_names = array('i')
+        net_indptr = array('i', [0])
+        node_refdes, node_pin, node_name, node_net = array('i'), array('i'), array('i'), array('i')
+        for net_index, net in enumerate(netlist.net_list):
+            net_names.append(string_id(net.name))
+            for node in net.nodes:
+                node_refdes.append(string_id(node.refdes))
+                node_pin.append(string_id(node.pin))
+                node_name.append(_EMPTY if node.pin_name is None else string_id(node.pin_name))
+                node_net.append(net_index)
+            net_indptr.append(len(node_refdes))
+
+        # Open addressing with linear probing, load factor <= 0.5
+        table_size = 1
+        while table_size < 2 * len(node_refdes):
+            table_size *= 2
+        mask = table_size - 1
+        pin_table = array('i', [_EMPTY]) * table_size
+        for node in range(len(node_refdes)):
+            refdes_id, pin_id = node_refdes[node], node_pin[node]
+            slot = _pin_hash(strings[refdes_id], strings[pin_id]) & mask
+            while True:
+                other = pin_table[slot]
+                if other == _EMPTY or (node_refdes[other] == refdes_id and node_pin[other] == pin_id):
+                    pin_table[slot] = node  # Last node wins, as in net_name_index
+                    break
+                slot = (slot + 1) & mask
+
+        str_offsets = array('q', [0])
+        for s in strings:
+            str_offsets.append(str_offsets[-1] + len(s))
+        str_data = b''.join(strings)
+
+        header[_N_STRINGS] = len(strings)
+        header[_N_NETS] = len(net_names)
+        header[_N_NODES] = len(node_refdes)
+        header[_TABLE_SIZE] = table_size
+        header[_STR_DATA_SIZE] = len(str_data)
+        offsets, size = _layout(len(strings), len(str_data), len(net_names), len(node_refdes), table_size)
+
+        shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        buf = shm.buf
+        _HEADER.pack_into(buf, 0, *header)
+        for section, data in (('str_offsets', str_offsets), ('str_data', str_data),
+                              ('net_names', net_names), ('net_indptr', net_indptr),
+                              ('node_refdes', node_refdes), ('node_pin', node_pin),
+                              ('node_name', node_name), ('node_net', node_net),
+                              ('pin_table', pin_table)):
+            raw = memoryview(data).cast('B')
+            buf[offsets[section]:offsets[section] + len(raw)] = raw
+        logger.debug(f"Published Netlist '{netlist.fname}' to shared memory '{shm.name}' ({size} bytes)")
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> SharedNetList:
+        """Attach to Netlist published by another process (zero-copy)
+
+        Args:
+            name: block name (SharedNetList.name of publisher)
+
+        Raises:
+            FileNotFoundError: If block does not exist
+            ValueError: If block is not a shared Netlist
+        """
+        try:
+            shm = shared_memory.SharedMemory(name=name, track=False)  # Python 3.13+
+        except TypeError:
+            shm = shared_memory.SharedMemory(name=name)
+            # Attaching registers the block with resource tracker of this process,
+            # which would unlink it when the process exits: the publisher owns it
+            resource_tracker.unregister(shm._name, 'shared_memory')
+        return cls(shm, owner=False)
+
+    def __reduce__(self):
+        # Pickled (e.g. passed to pool workers) as a reference to the block
+        return SharedNetList.attach, (self.name,)
+
+    def __enter__(self) -> SharedNetList:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+        if self.owner:
+            self.unlink()
+
+    def close(self) -> None:
+        """Release views of the block in this process"""
+        for view in self._views:
+            view.release()
+        self._views = []
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """Remove the block (publisher only, after workers are done)"""
+        if self.owner:
+            self._shm.unlink()
+
+    def _string(self, sid: int) -> str:
+        offsets = self._str_offsets
+        return str(self._str_data[offsets[sid]:offsets[sid + 1]], 'utf-8')
+
+    def net_list_length(self) -> int:
+        """Returns length of Netlist"""
+        return len(self._net_names)
+
+    def check_net_index(self, i: int) -> bool:
+        """Check valid Netlist index (as AllegroNetList.check_net_index)
+
+        Raises:
+            TypeError: If i is not an integer
+        """
+        if not isinstance(i, int):
+            raise TypeError(f'Index must be an integer, got {type(i).__name__}')
+        length = len(self._net_names)
+        if i < 0 or i >= length:
+            logger.error(f'Invalid net index {i} (valid range: 0 to {length-1})')
+            return False
+        return True
+
+    def net_name(self, i: int) -> Optional[str]:
+        """Returns net name by index, None if index is invalid"""
+        if not self.check_net_index(i):
+            return None
+        return self._string(self._net_names[i])
+
+    def node_list(self, i: int) -> Optional[list]:
+        """Returns refdes and pin list by index ([[refdes, pin], ...]), None if index is invalid"""
+        if not self.check_net_index(i):
+            return None
+        string = self._string
+        return [[string(self._node_refdes[node]), string(self._node_pin[node])]
+                for node in range(self._net_indptr[i], self._net_indptr[i + 1])]
+
+    def _find_node(self, refdes: str, pin: str) -> int:
+        """Returns node index of (refdes, pin), -1 if not found"""
+        refdes_bytes, pin_bytes = refdes.encode('utf-8'), pin.encode('utf-8')
+        table = self._pin_table
+        mask = len(table) - 1
+        slot = _pin_hash(refdes_bytes, pin_bytes) & mask
+        offsets, data = self._str_offsets, self._str_data
+        while True:
+            node = table[slot]
+            if node == _EMPTY:
+                return _EMPTY
+            refdes_id, pin_id = self._node_refdes[node], self._node_pin[node]
+            if (data[offsets[pin_id]:offsets[pin_id + 1]] == pin_bytes
+                    and data[offsets[refdes_id]:offsets[refdes_id + 1]] == refdes_bytes):
+                return node
+            slot = (slot + 1) & mask
+
+    def get_net_name4refdes_pin(self, refdes: str, pin: str) -> Optional[str]:
+        """Returns net name of (refdes, pin), None if not found"""
+        node = self._find_node(refdes, pin)
+        return None if node == _EMPTY else self._string(self._net_names[self._node_net[node]])
+
+    def get_refdes_pin_name(self, refdes: str, pin: str) -> Optional[str]:
+        """Returns pin name of (refdes, pin), None if not found or has no pin name"""
+        node = self._find_node(refdes, pin)
+        if node == _EMPTY or self._node_name[node] == _EMPTY:
+            return None
+        return self._string(self._node_name[node])
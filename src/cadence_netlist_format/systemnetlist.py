@@ -0,0 +1,179 @@
+#!/usr/bin/env python
+
+"""System level Netlist of multi-board products
+
+Each board is a separate Cadence Allegro Netlist. Boards are joined through
+connector mappings (J1 on board A <-> P1 on board B); nets joined across
+boards form system nets. Nets with the same name on a board (duplicated
+NET_NAME entries) are one board net.
+"""
+
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+from .allegronetlist import AllegroNetList
+from .extendednets import UnionFind
+
+
+class SystemNetList:
+    """Multi-board Netlist joined through connectors
+
+    Attributes:
+        boards: board name -> Netlist
+        connections: connector mappings [(board_a, refdes_a, board_b, refdes_b, {pin_a: pin_b}), ...]
+        board_offsets: board name -> first system id of board nets
+    """
+
+    def __init__(self, boards: dict[str, AllegroNetList]) -> None:
+        """Create system from parsed board Netlists
+
+        Args:
+            boards: board name -> Netlist
+        """
+        self.boards = dict(boards)
+        self.connections: list[tuple[str, str, str, str, dict[str, str]]] = []
+        self.board_offsets: dict[str, int] = {}
+        self._board_by_id: list[str] = []
+        self._net_ids: dict[str, dict[str, list[int]]] = {}
+        self._members: dict[int, list[int]] = {}
+        self._union_find: Optional[UnionFind] = None
+
+    @classmethod
+    def load(cls, fnames: dict[str, str | Path], max_workers: Optional[int] = None) -> SystemNetList:
+        """Parse board Netlist files in parallel worker processes
+
+        Args:
+            fnames: board name -> Netlist file name
+            max_workers: number of worker processes (default: number of CPUs),
+                         1 - parse in current process
+
+        Returns:
+            SystemNetList
+        """
+        names = list(fnames)
+        paths = [str(fnames[name]) for name in names]
+        if max_workers == 1 or len(paths) <= 1:
+            netlists = [AllegroNetList(path) for path in paths]
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                netlists = list(executor.map(AllegroNetList, paths))
+        return cls(dict(zip(names, netlists)))
+
+    def connect(self, board_a: str, refdes_a: str, board_b: str, refdes_b: str,
+                pin_map: Optional[dict[str, str]] = None) -> None:
+        """Declare connector mapping between two boards
+
+        Args:
+            board_a: board name of first connector
+            refdes_a: refdes of first connector (e.g. 'J1')
+            board_b: board name of mating connector
+            refdes_b: refdes of mating connector (e.g. 'P1')
+            pin_map: pin of first connector -> pin of mating connector
+                     (default: None, same pin numbers)
+
+        Raises:
+            KeyError: If board or connector refdes is not found
+        """
+        for board, refdes in ((board_a, refdes_a), (board_b, refdes_b)):
+            if board not in self.boards:
+                raise KeyError(f"Unknown board '{board}'")
+            if refdes not in self.boards[board].component_index():
+                raise KeyError(f"Cannot find refdes '{refdes}' on board '{board}'")
+        if pin_map is None:
+            pin_map = {pin: pin for pin, _ in self.boards[board_a].component_index()[refdes_a]}
+        self.connections.append((board_a, refdes_a, board_b, refdes_b, dict(pin_map)))
+        self._union_find = None
+
+    def merge(self) -> None:
+        """Build system connectivity index (joins connector pins by (refdes, pin) hash lookups)"""
+        self.board_offsets = {}
+        self._board_by_id = []
+        self._net_ids = {}
+        for board, netlist in self.boards.items():
+            self.board_offsets[board] = len(self._board_by_id)
+            self._board_by_id.extend([board] * netlist.net_list_length())
+            net_ids: dict[str, list[int]] = {}
+            for i, net in enumerate(netlist.net_list):
+                ids = net_ids.get(net.name)
+                if ids is None:
+                    net_ids[net.name] = [i]
+                else:
+                    ids.append(i)
+            self._net_ids[board] = net_ids
+        union_find = UnionFind(len(self._board_by_id))
+
+        # Nets with the same name are one board net
+        for board, net_ids in self._net_ids.items():
+            offset = self.board_offsets[board]
+            for ids in net_ids.values():
+                for i in ids[1:]:
+                    union_find.union(offset + ids[0], offset + i)
+
+        for board_a, refdes_a, board_b, refdes_b, pin_map in self.connections:
+            pins_a = dict(self.boards[board_a].component_index()[refdes_a])
+            pins_b = dict(self.boards[board_b].component_index()[refdes_b])
+            offset_a = self.board_offsets[board_a]
+            offset_b = self.board_offsets[board_b]
+            for pin_a, pin_b in pin_map.items():
+                net_a = pins_a.get(pin_a)
+                net_b = pins_b.get(pin_b)
+                if net_a is None or net_b is None:
+                    # Unconnected connector pin - nothing to join
+                    continue
+                union_find.union(offset_a + net_a, offset_b + net_b)
+        self._union_find = union_find
+        self._members = {}
+        for group in union_find.groups():
+            self._members[union_find.find(group[0])] = group
+
+    def _system_id(self, board: str, net_name: str) -> int:
+        """Returns system id of board net"""
+        if self._union_find is None:
+            self.merge()
+        if board not in self.boards:
+            raise KeyError(f"Unknown board '{board}'")
+        net_ids = self._net_ids[board].get(net_name)
+        if net_ids is None:
+            raise KeyError(f"Cannot find net '{net_name}' on board '{board}'")
+        return self.board_offsets[board] + net_ids[0]
+
+    def _board_net(self, system_id: int) -> tuple[str, str]:
+        """Returns (board, net name) of system id"""
+        board = self._board_by_id[system_id]
+        return board, self.boards[board].net_list[system_id - self.board_offsets[board]].name
+
+    def trace(self, board: str, net_name: str) -> list[tuple[str, str]]:
+        """Returns all board nets of system net containing board net
+
+        Args:
+            board: board name
+            net_name: net name on board
+
+        Returns:
+            List of (board, net name), starting with the requested net
+
+        Raises:
+            KeyError: If board or net is not found
+        """
+        system_id = self._system_id(board, net_name)
+        members = self._members.get(self._union_find.find(system_id), [])
+        # Nets with the same name are listed once
+        return list(dict.fromkeys([(board, net_name)] + [self._board_net(i) for i in members]))
+
+    def system_nets(self) -> list[list[tuple[str, str]]]:
+        """Returns system nets spanning more than one board net: [[(board, net name), ...], ...]"""
+        if self._union_find is None:
+            self.merge()
+        system_nets = []
+        for group in self._members.values():
+            board_nets = list(dict.fromkeys(self._board_net(i) for i in group))
+            if len(board_nets) > 1:  # Not only nets with the same name on one board
+                system_nets.append(board_nets)
+        return system_nets
+
+    def system_nets2string(self) -> str:
+        """Return system nets as string (one 'board:net' group per line)"""
+        lines = [' '.join(f'{board}:{net}' for board, net in group) for group in self.system_nets()]
+        return '\n'.join(lines) + '\n' if lines else ''
@@ -1,9 +1,11 @@
 """Pytest configuration and shared fixtures for cadence_netlist_format tests."""
 
+import datetime
 import os
 import pytest
 import tempfile
 import shutil
+from unittest.mock import Mock
 
 
 @pytest.fixture
@@ -117,6 +119,104 @@ END.
 """
 
 
+@pytest.fixture
+def write_netlist(tmp_path):
+    """Provide a factory that writes a netlist file from net definitions.
+
+    The factory takes a list of (net_name, [(refdes, pin, pin_name), ...])
+    and an optional file name, and returns the path (str) of the written file.
+
+    Args:
+        tmp_path: pytest's built-in tmp_path fixture
+
+    Returns:
+        callable: Netlist file factory
+    """
+    def _write_netlist(nets, name='netlist.dat'):
+        lines = ['FILE_TYPE = EXPANDEDNETLIST;',
+                 '{ Using PSTWRITER 16.3.0 p002Mar-22-2016 at 10:54:51 }']
+        for net_name, nodes in nets:
+            lines += ['NET_NAME', f"'{net_name}'",
+                      " '@CAPTURENAME.test':", " C_SIGNAL='@test';"]
+            for refdes, pin, pin_name in nodes:
+                lines += [f'NODE_NAME\t{refdes} {pin}',
+                          " '@CAPTURENAME.test':", f" '{pin_name}':;"]
+        lines.append('END.')
+        netlist_file = tmp_path / name
+        netlist_file.write_text('\n'.join(lines) + '\n')
+        return str(netlist_file)
+    return _write_netlist
+
+
+# Boards shared by test modules (written with write_netlist)
+
+@pytest.fixture
+def small_netlist_path(write_netlist):
+    """Netlist with two nets: CLK (DD1 1, R1 1) and DATA (DD1 2, R1 2).
+
+    Returns:
+        str: Path to small.dat
+    """
+    return write_netlist([
+        ('CLK', [('DD1', '1', 'CLK'), ('R1', '1', '1')]),
+        ('DATA', [('DD1', '2', 'D0'), ('R1', '2', '2')]),
+    ], name='small.dat')
+
+
+@pytest.fixture
+def series_netlist_path(write_netlist):
+    """Netlist with signal chain: connector J1 -> R1 -> FB1 -> DD2, DD1 on the middle net.
+
+    Returns:
+        str: Path to series.dat
+    """
+    return write_netlist([
+        ('CLK_J', [('J1', '3', 'CLK'), ('R1', '1', '1')]),
+        ('CLK_R', [('R1', '2', '2'), ('FB1', '1', '1'), ('DD1', 'A4', 'CLK_IN')]),
+        ('CLK_FB', [('FB1', '2', '2'), ('DD2', 'B7', 'CLK')]),
+        ('GND', [('J1', '1', 'GND'), ('DD1', 'A1', 'GND'), ('DD2', 'A1', 'GND')]),
+    ], name='series.dat')
+
+
+@pytest.fixture
+def joined_nets_netlist_path(write_netlist):
+    """Netlist with nets joined through R1 (2-pin), R0 (zero-ohm link), RN1 (4-pin array) and X1.
+
+    Returns:
+        str: Path to joined.dat
+    """
+    return write_netlist([
+        ('A', [('DD1', '1', 'OUT'), ('R1', '1', '1')]),
+        ('A_R', [('R1', '2', '2'), ('DD2', '3', 'IN'), ('R0', '1', '1')]),
+        ('A_R0', [('R0', '2', '2'), ('DD3', '1', 'IN')]),
+        ('B', [('RN1', '1', '1'), ('RN1', '2', '2')]),
+        ('C', [('RN1', '3', '3'), ('RN1', '4', '4')]),
+        ('D', [('DD1', '2', 'IO'), ('X1', '1', '1')]),
+        ('D_X', [('X1', '2', '2'), ('DD2', '4', 'IO')]),
+    ], name='joined.dat')
+
+
+@pytest.fixture
+def board_files(write_netlist):
+    """Two boards: main board connector J1 mates with module connector P1.
+
+    Returns:
+        dict: Board name -> path of main.dat and module.dat
+    """
+    main = write_netlist([
+        ('I2C_SCL', [('DD1', '5', 'SCL'), ('J1', '1', '1')]),
+        ('I2C_SDA', [('DD1', '6', 'SDA'), ('J1', '2', '2')]),
+        ('GND', [('DD1', '1', 'GND'), ('J1', '3', '3')]),
+    ], name='main.dat')
+    module = write_netlist([
+        ('SCL', [('P1', 'A', 'A'), ('DD9', '1', 'SCL')]),
+        ('SDA', [('P1', 'B', 'B'), ('DD9', '2', 'SDA')]),
+        ('GND_M', [('P1', 'C', 'C'), ('DD9', '8', 'GND')]),
+        ('LOCAL', [('DD9', '3', 'IO'), ('DD9', '4', 'IO')]),
+    ], name='module.dat')
+    return {'main': main, 'module': module}
+
+
 @pytest.fixture
 def change_to_temp_dir(temp_dir, monkeypatch):
     """Change working directory to temp_dir for the test.
@@ -129,6 +229,24 @@ def change_to_temp_dir(temp_dir, monkeypatch):
     return temp_dir
 
 
+@pytest.fixture
+def fixed_clock(monkeypatch):
+    """Fix the report title time, so reports written at different times are equal.
+
+    Args:
+        monkeypatch: pytest monkeypatch fixture
+
+    Returns:
+        datetime.datetime: Time returned by datetime.datetime.now()
+    """
+    import cadence_netlist_format.allegronetlist as allegronetlist
+    now = datetime.datetime(2024, 1, 2, 3, 4, 5)
+    clock = Mock()
+    clock.now.return_value = now
+    monkeypatch.setattr(allegronetlist.datetime, 'datetime', clock)
+    return now
+
+
 # Test count validation hook
 def get_expected_test_count():
     """Read expected test count from pyproject.toml.
@@ -10,6 +10,7 @@ import re
 import tempfile
 from pathlib import Path
 from cadence_netlist_format.allegronetlist import AllegroNetList
+from cadence_netlist_format.netrecords import Net, Node
 
 
 # Test data paths
@@ -188,7 +189,7 @@ def test_all_netlists_have_consistent_structure():
         # Check first net structure (if exists)
         if len(netlist.net_list) > 0:
             first_net = netlist.net_list[0]
-            assert isinstance(first_net, list), f"{name}: net entry should be a list"
+            assert isinstance(first_net, Net), f"{name}: net entry should be a Net"
             assert len(first_net) == 2, f"{name}: net entry should have 2 elements [name, nodes]"
 
             net_name, nodes = first_net
@@ -198,5 +199,5 @@ def test_all_netlists_have_consistent_structure():
             # Check node structure (if any nodes exist)
             if len(nodes) > 0:
                 first_node = nodes[0]
-                assert isinstance(first_node, list), f"{name}: node should be a list"
+                assert isinstance(first_node, Node), f"{name}: node should be a Node"
                 assert len(first_node) >= 2, f"{name}: node should have at least [refdes, pin]"
@@ -8,6 +8,7 @@ import pytest
 import tempfile
 from pathlib import Path
 from cadence_netlist_format.allegronetlist import AllegroNetList
+from cadence_netlist_format.netrecords import Net, Node
 
 
 @pytest.fixture
@@ -109,20 +110,22 @@ def test_net_list_data_structure(sample_netlist_file):
     """Test that net_list data structure is correctly built."""
     netlist = AllegroNetList(sample_netlist_file)
 
-    # net_list should be a list of [net_name, [[refdes, pin], ...]]
+    # net_list should be a list of Net(net_name, [Node(refdes, pin, pin_name), ...])
     assert isinstance(netlist.net_list, list)
 
     for net_entry in netlist.net_list:
-        assert isinstance(net_entry, list)
+        assert isinstance(net_entry, Net)
         assert len(net_entry) == 2
 
         net_name, nodes = net_entry
+        assert net_name is net_entry.name and nodes is net_entry.nodes
         assert isinstance(net_name, str)
         assert isinstance(nodes, list)
 
         for node in nodes:
-            assert isinstance(node, list)
+            assert isinstance(node, Node)
             assert len(node) >= 2  # At least [refdes, pin], may have pin name
+            assert node == node.to_list() and node[:2] == [node.refdes, node.pin]
 
 
 @pytest.mark.unit
@@ -276,3 +279,231 @@ END.
         elif net[0] == 'NET2':
             assert len(net[1]) == 1  # Should have C1
             assert net[1][0][0] == 'C1'
+
+
+@pytest.mark.unit
+def test_net_and_refdes_filters(sample_netlist_v1_path):
+    """Test that filters applied during parsing match filtering the full Netlist."""
+    import re
+    full = AllegroNetList(sample_netlist_v1_path)
+
+    netlist = AllegroNetList(sample_netlist_v1_path, net_filter='A*')
+    assert netlist.net_list == [net for net in full.net_list if net[0].startswith('A')]
+    assert 'Partial Netlist' in netlist.net_list_title()
+
+    netlist = AllegroNetList(sample_netlist_v1_path, net_filter=re.compile(r'_XXX\d$'))
+    assert netlist.net_list == [net for net in full.net_list if re.search(r'_XXX\d$', net[0])]
+
+    names = {full.net_list[0][0], full.net_list[-1][0]}
+    netlist = AllegroNetList(sample_netlist_v1_path, net_filter=names)
+    assert [net[0] for net in netlist.net_list] == sorted(names)
+
+    netlist = AllegroNetList(sample_netlist_v1_path, refdes_filter=['X*', 'DD1'])
+    expected = []
+    for name, nodes in full.net_list:
+        kept = [node for node in nodes if node[0].startswith('X') or node[0] == 'DD1']
+        if kept:
+            expected.append([name, kept])
+    assert netlist.net_list == expected
+    assert netlist.net_list_length() > 0
+
+
+@pytest.mark.unit
+def test_format_command_with_filter(sample_netlist_v3_path, tmp_path, monkeypatch):
+    """Test CLI format command with net filter."""
+    import sys
+    from cadence_netlist_format.commandlinearg import get_args
+    from cadence_netlist_format.commands import run_command
+
+    output = tmp_path / 'out.rpt'
+    monkeypatch.setattr(sys, 'argv', ['cnl_format', 'format', sample_netlist_v3_path,
+                                      '-o', str(output), '--net', 'A*'])
+    assert run_command(get_args()) == 0
+
+    full = AllegroNetList(sample_netlist_v3_path)
+    report = output.read_text()
+    for name, _ in full.net_list:
+        assert (f'\n{name} ' in report) == name.startswith('A')
+
+
+@pytest.mark.unit
+def test_find_pins_by_pin_name(write_netlist):
+    """Test exact, prefix and case-insensitive pin name lookups."""
+    netlist = AllegroNetList(write_netlist([
+        ('TDI', [('DD1', 'A1', 'JTAG_TDI'), ('X1', '3', 'TDI')]),
+        ('TDO', [('DD1', 'A2', 'JTAG_TDO'), ('X1', '5', 'TDO')]),
+        ('RST', [('DD1', 'B1', 'RESET_N'), ('DD2', '7', 'reset_n'), ('R1', '1', '1')]),
+    ]))
+
+    assert netlist.find_pins('JTAG_TDI') == [('DD1', 'A1', 'TDI')]
+    assert netlist.find_pins('JTAG_', prefix=True) == [('DD1', 'A1', 'TDI'), ('DD1', 'A2', 'TDO')]
+    assert sorted(netlist.find_pins('Reset_N', ignore_case=True)) == [('DD1', 'B1', 'RST'), ('DD2', '7', 'RST')]
+    assert netlist.find_pins('jtag_td', prefix=True, ignore_case=True) == [('DD1', 'A1', 'TDI'), ('DD1', 'A2', 'TDO')]
+    assert netlist.find_pins('VCC') == []
+    assert netlist.find_pins('Z', prefix=True) == []
+
+
+@pytest.mark.unit
+def test_sort_nets_and_nodes(write_netlist):
+    """Test net/node sort modes and restoring file node order without reparsing."""
+    netlist = AllegroNetList(write_netlist([
+        ('DATA10', [('R10', '1', '1'), ('R2', '2', '2')]),
+        ('DATA2', [('DD1', '10', 'D2'), ('DD1', '9', 'D1'), ('R1', '1', '1')]),
+        ('GND', [('C1', '2', '2')]),
+        ('+3V3', [('C1', '1', '1'), ('DD1', '1', 'VCC')]),
+    ]))
+    names = lambda: [net[0] for net in netlist.net_list]  # noqa: E731
+
+    assert names() == ['+3V3', 'DATA10', 'DATA2', 'GND']
+    netlist.sort_nets('natural')
+    assert names() == ['+3V3', 'DATA2', 'DATA10', 'GND']
+    netlist.sort_nets('fanout')
+    assert names() == ['DATA2', '+3V3', 'DATA10', 'GND']
+    netlist.sort_nets('power')
+    assert names() == ['+3V3', 'GND', 'DATA2', 'DATA10']
+    assert netlist.component_index()['R1'] == [('1', 2)]
+    assert netlist.search_nets('DATA1') == [3]
+
+    netlist.sort_nodes('natural')
+    assert [node[:2] for node in netlist.node_list(2)] == [['DD1', '9'], ['DD1', '10'], ['R1', '1']]
+    assert [node[0] for node in netlist.node_list(3)] == ['R2', 'R10']
+    netlist.sort_nodes('file')
+    assert [node[0] for node in netlist.node_list(3)] == ['R10', 'R2']
+
+    with pytest.raises(ValueError):
+        netlist.sort_nets('unknown')
+
+
+@pytest.mark.unit
+def test_parsed_tokens_are_shared(small_netlist_path):
+    """Test repeated refdes/pin tokens and pin names equal to pin share one str object."""
+    netlist = AllegroNetList(small_netlist_path)
+    clk, data = netlist.net_list[1].nodes, netlist.net_list[0].nodes
+    assert clk[0].refdes is data[0].refdes
+    assert clk[1].pin_name is clk[1].pin and data[1].pin_name is data[1].pin
+    assert netlist.get_refdes_pin_name('R1', '2') == '2'
+    assert netlist.get_refdes_pin_name('DD1', '2') == 'D0'
+
+
+@pytest.mark.unit
+def test_fused_rendering_matches_net2string(write_netlist):
+    """Test single-pass report rendering gives the same lines and warnings as net2string()."""
+    netlist = AllegroNetList(write_netlist([
+        ('ONE', [('R1', '1', '1')]),
+        ('TWO', [('R1', '2', '2'), ('C1', '1', '1')]),
+        ('A B', [('R2', '1', '1'), ('C2', '1', '1')]),
+        ('THREE', [('R3', '1', '1'), ('C3', '1', '1'), ('DD1', '5', 'X')]),
+    ]))
+    netlist.net_list.append(Net('EMPTY', []))
+    netlist.net_list.append(Net(' ', [Node('R4', '1'), Node('C4', '1')]))
+
+    lines = [netlist.net2string(i) for i in range(netlist.net_list_length())]
+    warnings = [line for line in lines if len(line.split()) < 5]
+    assert netlist.net_list2string() == '\n'.join(lines) + '\n'
+    assert netlist.single_net_list2string() == '\n'.join(warnings) + '\n'
+    assert warnings == ['ONE R1 1', 'EMPTY ', '  R4 1 C4 1']
+    assert netlist.single_net_warnings() in netlist.all_data2string()
+
+
+@pytest.mark.unit
+def test_parallel_report_is_identical(sample_netlist_v1_path, tmp_path, monkeypatch, fixed_clock):
+    """Test report rendered in worker process chunks equals serial report."""
+    import cadence_netlist_format.allegronetlist as allegronetlist
+    monkeypatch.setattr(allegronetlist, 'RENDER_CHUNK_MIN', 50)
+
+    netlist = AllegroNetList(sample_netlist_v1_path)
+    assert netlist.net_list_length() > 2 * 50
+    serial, parallel = tmp_path / 'serial.rpt', tmp_path / 'parallel.rpt'
+    netlist.net_list2file(serial, extended_nets=['R'])
+    netlist.net_list2file(parallel, extended_nets=['R'], jobs=2)
+    assert parallel.read_bytes() == serial.read_bytes()
+
+
+@pytest.mark.unit
+def test_parse_progress_and_cancel(sample_netlist_v1_path, monkeypatch):
+    """Test progress callback is called during parsing and cancel token stops parsing."""
+    import cadence_netlist_format.netlistengines as netlistengines
+    from cadence_netlist_format.parseprogress import CancelToken, ParseCancelled
+    monkeypatch.setattr(netlistengines, 'PROGRESS_INTERVAL', 100)
+
+    calls = []
+    netlist = AllegroNetList(sample_netlist_v1_path, progress=calls.append)
+    assert len(calls) == netlist.net_list_length() // 100 + 1
+    assert [c.nets for c in calls[:-1]] == [100 * (i + 1) for i in range(len(calls) - 1)]
+    assert calls[-1].nets == netlist.net_list_length()
+    assert calls[-1].nodes == sum(len(net.nodes) for net in netlist.net_list)
+    assert calls[-1].fraction == 1.0
+    assert all(a.bytes_read <= b.bytes_read for a, b in zip(calls, calls[1:]))
+
+    token = CancelToken()
+    calls = []
+
+    def cancel_at_second_call(progress):
+        calls.append(progress)
+        if len(calls) == 2:
+            token.cancel()
+
+    with pytest.raises(ParseCancelled):
+        AllegroNetList(sample_netlist_v1_path, progress=cancel_at_second_call, cancel_token=token)
+    assert len(calls) == 2
+
+
+@pytest.mark.unit
+def test_refdes_report(write_netlist, tmp_path):
+    """Test refdes report lists all components and pins in natural order."""
+    netlist = AllegroNetList(write_netlist([
+        ('CLK', [('U10', 'A2', 'CLK'), ('U2', '10', 'CLK_IN')]),
+        ('GND', [('U2', '2', 'GND'), ('R1', '2', '2'), ('U10', 'A10', 'VSS')]),
+        ('SIG', [('R1', '1', '1'), ('U2', '1', 'OUT')]),
+    ]))
+    report = netlist.refdes_report2string()
+    assert report == ('R1 1 1 SIG\n'
+                      'R1 2 2 GND\n'
+                      'U2 1 OUT SIG\n'
+                      'U2 2 GND GND\n'
+                      'U2 10 CLK_IN CLK\n'
+                      'U10 A2 CLK CLK\n'
+                      'U10 A10 VSS GND\n')
+    assert len(list(netlist.iter_refdes_report())) == 3  # One chunk per component
+
+    fname = tmp_path / 'refdes.rpt'
+    netlist.refdes_report2file(fname)
+    assert fname.read_text() == report
+    text = netlist.all_data2string(refdes_report=True)
+    assert text.endswith('| Components: refdes pin pin_name net' + ' ' * 37 + '|\n'
+                         '+' + '-' * 73 + '+\n' + report + '\n')
+
+
+@pytest.mark.unit
+def test_gc_paused_in_overlapping_threads(small_netlist_path):
+    """Test GC is paused while any thread parses and its state is restored after the last one."""
+    import gc
+    import threading
+    from cadence_netlist_format.allegronetlist import gc_paused
+
+    assert gc.isenabled()
+    first_started, second_done = threading.Event(), threading.Event()
+    states = []
+
+    def first():
+        with gc_paused():
+            first_started.set()
+            second_done.wait(5)
+            states.append(gc.isenabled())
+
+    thread = threading.Thread(target=first)
+    thread.start()
+    first_started.wait(5)
+    assert AllegroNetList(small_netlist_path).net_list  # Second parse ends first
+    assert not gc.isenabled()
+    second_done.set()
+    thread.join()
+    assert states == [False] and gc.isenabled()
+
+    gc.disable()
+    try:
+        with gc_paused():
+            pass
+        assert not gc.isenabled()
+    finally:
+        gc.enable()
@@ -7,6 +7,7 @@ error handling, and cross-platform compatibility.
 Note: GUI components (tkinter Frame, widgets) are mocked to avoid X11/display requirements.
 """
 
+import os
 import pytest
 import sys
 from pathlib import Path
@@ -28,7 +29,15 @@ def create_test_app(monkeypatch=None):
         app.master.minsize = Mock()
         app.cnl_fname = None
         app.output_fname = 'NetList.rpt'
+        app.refdes_fname = 'NetList_refdes.rpt'
         app.cfg = None
+        app.netlist = None
+        app.netlist_mtime = None
+        app.net_order = 'name'
+        app.node_order = 'file'
+        app.cancel_token = None
+        app.progress_step = 0
+        app.action_buttons = []
         app.log_text = Mock()  # Mock text widget
         app.gui_cnl_fname = Mock()  # Mock StringVar
         app.file_entry = Mock()
@@ -36,6 +45,7 @@ def create_test_app(monkeypatch=None):
         # Mock methods that interact with GUI
         app.pack = Mock()
         app.update_idletasks = Mock()
+        app.update = Mock()
         app.update_self2gui = Mock()
         app.update_gui2self = Mock()
         app.log_message = Mock()
@@ -461,3 +471,132 @@ def test_open_output_dir(tmp_path, monkeypatch):
         # Verify _open_with_system_app was called with working directory
         mock_open.assert_called_once()
         assert str(tmp_path) in str(mock_open.call_args)
+
+
+# ============================================================================
+# Net Search Tests
+# ============================================================================
+
+@pytest.mark.unit
+def test_search_nets_logs_matches(sample_netlist, tmp_path, monkeypatch):
+    """Test net search parses the selected file once and logs matching nets."""
+    monkeypatch.chdir(tmp_path)
+
+    app = create_test_app()
+    app.cnl_fname = str(sample_netlist)
+    app.gui_search = Mock()
+    app.gui_search.get.return_value = 'test'
+    app.search_nets()
+
+    log_calls = [str(call) for call in app.log_message.call_args_list]
+    assert any('1 nets found' in call for call in log_calls)
+    assert any('TEST_NET R1 1 R2 2' in call for call in log_calls)
+
+    netlist = app.netlist
+    app.gui_search.get.return_value = 'NO_*'
+    app.search_nets()
+    assert app.netlist is netlist  # Not parsed again
+    assert '0 nets found' in str(app.log_message.call_args_list[-1])
+
+    # Changed file is parsed again
+    sample_netlist.write_text(sample_netlist.read_text().replace('TEST_NET', 'NEW_NET'))
+    st = sample_netlist.stat()
+    os.utime(sample_netlist, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    app.gui_search.get.return_value = 'new'
+    app.search_nets()
+    assert app.netlist is not netlist
+    assert any('NEW_NET R1 1 R2 2' in str(c) for c in app.log_message.call_args_list)
+
+
+@pytest.mark.unit
+def test_refdes_report_written(sample_netlist, tmp_path, monkeypatch):
+    """Test refdes report button writes all components of the parsed Netlist."""
+    monkeypatch.chdir(tmp_path)
+
+    app = create_test_app()
+    app.cnl_fname = str(sample_netlist)
+    app.refdes_report()
+
+    assert (tmp_path / 'NetList_refdes.rpt').read_text() == 'R1 1 pin1 TEST_NET\nR2 2 pin2 TEST_NET\n'
+    assert 'SUCCESS' in str(app.log_message.call_args_list[-1])
+    assert '2 components' in str(app.log_message.call_args_list[-1])
+
+
+@pytest.mark.unit
+def test_sort_order_applied_without_reparsing(sample_netlist, tmp_path, monkeypatch):
+    """Test changed net/node order re-sorts the parsed Netlist and format reuses it."""
+    monkeypatch.chdir(tmp_path)
+
+    app = create_test_app()
+    app.cnl_fname = str(sample_netlist)
+    app.update_and_save_config = Mock()
+    app.format_netlist()
+    netlist = app.netlist
+
+    app.gui_net_order = Mock()
+    app.gui_net_order.get.return_value = 'fanout'
+    app.gui_node_order = Mock()
+    app.gui_node_order.get.return_value = 'natural'
+    with patch('cadence_netlist_format.cadence_netlist_format.AllegroNetList') as mock_netlist:
+        app.apply_sort_order()
+        app.format_netlist()
+        mock_netlist.assert_not_called()
+
+    assert app.netlist is netlist
+    assert (netlist.net_order, netlist.node_order) == ('fanout', 'natural')
+    assert (tmp_path / 'NetList.rpt').exists()
+
+
+@pytest.mark.unit
+def test_format_netlist_cancel(sample_netlist, tmp_path, monkeypatch):
+    """Test Cancel button pressed during parsing stops format without error dialog."""
+    monkeypatch.chdir(tmp_path)
+    import cadence_netlist_format.netlistengines as netlistengines
+    monkeypatch.setattr(netlistengines, 'PROGRESS_INTERVAL', 1)
+
+    app = create_test_app()
+    app.cnl_fname = str(sample_netlist)
+    app.update_and_save_config = Mock()
+    app.update = Mock(side_effect=app.cancel_parse)  # Cancel pressed while GUI events are processed
+    with patch('cadence_netlist_format.cadence_netlist_format.messagebox') as mock_msgbox:
+        app.format_netlist()
+
+    mock_msgbox.showerror.assert_not_called()
+    log_calls = [str(call) for call in app.log_message.call_args_list]
+    assert any('Parsing cancelled' in call for call in log_calls)
+    assert app.netlist is None and app.cancel_token is None
+    assert not (tmp_path / 'NetList.rpt').exists()
+
+
+@pytest.mark.unit
+def test_actions_ignored_while_parsing(sample_netlist, tmp_path, monkeypatch):
+    """Test buttons pressed during parsing do not start another parse; buttons restored after."""
+    monkeypatch.chdir(tmp_path)
+    from cadence_netlist_format.allegronetlist import AllegroNetList
+    import cadence_netlist_format.netlistengines as netlistengines
+    monkeypatch.setattr(netlistengines, 'PROGRESS_INTERVAL', 1)
+
+    app = create_test_app()
+    app.cnl_fname = str(sample_netlist)
+    app.update_and_save_config = Mock()
+    button = Mock()
+    app.action_buttons = [button]
+    tokens = []
+
+    def press_buttons():
+        token = app.cancel_token
+        app.format_netlist()
+        app.refdes_report()
+        tokens.append(app.cancel_token is token is not None)
+
+    app.update = Mock(side_effect=press_buttons)
+    with patch('cadence_netlist_format.cadence_netlist_format.AllegroNetList',
+               wraps=AllegroNetList) as mock_netlist:
+        app.format_netlist()
+
+    mock_netlist.assert_called_once()
+    assert tokens and all(tokens)  # Cancel still works for the running parse
+    assert button.config.call_args_list == [call(state='disabled'), call(state='normal')]
+    log_calls = [str(c) for c in app.log_message.call_args_list]
+    assert any('Parsing in progress' in c for c in log_calls)
+    assert (tmp_path / 'NetList.rpt').exists() and not (tmp_path / 'NetList_refdes.rpt').exists()
@@ -226,3 +226,28 @@ class TestGetArgsIntegration:
         # Version output should contain both program name and version
         assert 'cln_format' in output.lower() or __prog__ in output
         assert __version__ in output
+
+
+class TestCommands:
+    """Test suite for commands (run without GUI)."""
+
+    def test_no_command_starts_gui(self, monkeypatch):
+        """Test that no command selects GUI mode."""
+        monkeypatch.setattr(sys, 'argv', ['cnl_format'])
+        assert get_args().command is None
+
+    def test_peek_command(self, monkeypatch, capsys, sample_netlist_v3_path, tmp_path):
+        """Test peek command output and exit status."""
+        from cadence_netlist_format.commands import run_command
+
+        monkeypatch.setattr(sys, 'argv', ['cnl_format', 'peek', sample_netlist_v3_path, '-j', '2'])
+        args = get_args()
+        assert args.command == 'peek'
+        assert run_command(args) == 0
+        assert 'version: 16.3.0' in capsys.readouterr().out
+
+        bad_file = tmp_path / 'bad.dat'
+        bad_file.write_text('random text\n')
+        monkeypatch.setattr(sys, 'argv', ['cnl_format', 'peek', str(bad_file)])
+        assert run_command(get_args()) == 1
+        assert 'INVALID' in capsys.readouterr().out
@@ -0,0 +1,60 @@
+"""
+Unit tests for disk-backed pin indexes.
+"""
+
+import gc
+import os
+
+import pytest
+from cadence_netlist_format.allegronetlist import AllegroNetList
+from cadence_netlist_format.diskindex import DiskIndex
+
+
+@pytest.mark.unit
+def test_indexes_spill_to_disk_over_budget(sample_netlist_v2_path):
+    """Test indexes over memory budget answer the same lookups from disk."""
+    in_memory = AllegroNetList(sample_netlist_v2_path)
+    on_disk = AllegroNetList(sample_netlist_v2_path, memory_budget=0)
+    large_budget = AllegroNetList(sample_netlist_v2_path, memory_budget=1 << 30)
+
+    assert isinstance(on_disk.net_name_index, DiskIndex)
+    assert isinstance(large_budget.net_name_index, dict)
+    assert dict(on_disk.net_name_index.items()) == in_memory.net_name_index
+    assert dict(on_disk.pin_name_index.items()) == in_memory.pin_name_index
+    assert len(on_disk.pin_name_index) == len(in_memory.pin_name_index)
+    for refdes, pin in in_memory.net_name_index:
+        assert on_disk.get_net_name4refdes_pin(refdes, pin) == in_memory.get_net_name4refdes_pin(refdes, pin)
+        assert on_disk.get_refdes_pin_name(refdes, pin) == in_memory.get_refdes_pin_name(refdes, pin)
+    assert on_disk.get_net_name4refdes_pin('NO_SUCH', '1') is None
+    on_disk.net_name_index.store.close()
+
+
+@pytest.mark.unit
+def test_disk_index_mapping_and_cache(small_netlist_path):
+    """Test DiskIndex mapping updates invalidate cached lookups."""
+    netlist = AllegroNetList(small_netlist_path, memory_budget=0)
+    index = netlist.net_name_index
+    assert index[('DD1', '1')] == 'CLK' and ('R1', '1') in index
+    assert netlist.get_net_name4refdes_pin('DD1', '1') == 'CLK'
+    assert (index.hits, index.misses) == (1, 2)
+
+    index[('DD1', '1')] = 'CLK_A'
+    assert netlist.get_net_name4refdes_pin('DD1', '1') == 'CLK_A'
+    del netlist.pin_name_index[('R1', '1')]
+    assert netlist.get_refdes_pin_name('R1', '1') is None and ('R1', '1') in index
+    with pytest.raises(KeyError):
+        index[('DD2', '1')]
+    path = index.store.path
+    index.store.close()
+    assert not os.path.exists(path)
+
+    # No reference cycles: file removed when the Netlist is released, without cyclic GC
+    netlist = AllegroNetList(small_netlist_path, memory_budget=0)
+    path = netlist.net_name_index.store.path
+    assert netlist.get_net_name4refdes_pin('DD1', '1') == 'CLK'
+    gc.disable()
+    try:
+        del netlist
+        assert not os.path.exists(path)
+    finally:
+        gc.enable()
@@ -0,0 +1,49 @@
+"""
+Unit tests for extended nets (union-find through series parts).
+"""
+
+import pytest
+from cadence_netlist_format.allegronetlist import AllegroNetList
+from cadence_netlist_format.extendednets import UnionFind
+
+
+@pytest.mark.unit
+def test_union_find():
+    """Test union-find joins and groups."""
+    union_find = UnionFind(6)
+    assert union_find.union(0, 3)
+    assert union_find.union(3, 5)
+    assert not union_find.union(5, 0)
+    assert union_find.find(5) == union_find.find(0)
+    assert union_find.groups() == [[0, 3, 5]]
+
+
+@pytest.mark.unit
+def test_extended_nets_by_prefix_and_refdes(joined_nets_netlist_path):
+    """Test that only 2-pin parts matching prefix or refdes list join nets."""
+    netlist = AllegroNetList(joined_nets_netlist_path)
+    names = [[netlist.net_name(i) for i in group]
+             for group in netlist.extended_nets(prefixes=('R',))]
+    # RN1 has 4 pins and 'RN' prefix: not a series part
+    assert names == [['A', 'A_R', 'A_R0']]
+
+    names = [[netlist.net_name(i) for i in group]
+             for group in netlist.extended_nets(prefixes=(), refdes=('X1',))]
+    assert names == [['D', 'D_X']]
+
+    component_index = netlist.component_index()
+    assert component_index['RN1'] == [('1', 3), ('2', 3), ('3', 4), ('4', 4)]
+
+
+@pytest.mark.unit
+def test_extended_nets_report_section(joined_nets_netlist_path):
+    """Test that the extended nets report section is optional."""
+    netlist = AllegroNetList(joined_nets_netlist_path)
+    assert 'Extended nets' not in netlist.all_data2string()
+
+    report = netlist.all_data2string(extended_nets=('R',))
+    assert '| Extended nets (joined through: R)' in report
+    assert '\nA A_R A_R0\n' in report
+    assert report.endswith('\n')
+    title_lines = [line for line in report.split('\n') if line.startswith('| Extended')]
+    assert len(title_lines[0]) == 75
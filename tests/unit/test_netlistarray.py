@@ -0,0 +1,74 @@
+"""
+Unit tests for columnar (NumPy) Netlist pin table.
+
+Tests are skipped when the optional NumPy dependency is not installed.
+"""
+
+import pytest
+from cadence_netlist_format.allegronetlist import AllegroNetList
+
+
+@pytest.fixture
+def np():
+    """NumPy module (skip test if not installed)."""
+    return pytest.importorskip('numpy')
+
+
+@pytest.mark.unit
+def test_arrays_dictionary_encoding(np, sample_netlist_v2_path):
+    """Test that columns decode back to the same pins as net_list."""
+    netlist = AllegroNetList(sample_netlist_v2_path)
+    arrays = netlist.net_list2arrays()
+
+    pin_count = sum(len(net[1]) for net in netlist.net_list)
+    assert len(arrays) == pin_count
+    assert arrays.net_id.dtype == np.int32
+    assert len(arrays.refdes) == len({node[0] for net in netlist.net_list for node in net[1]})
+
+    row = 0
+    for net_id, net in enumerate(netlist.net_list):
+        for node in net[1]:
+            assert arrays.net_id[row] == net_id
+            assert arrays.nets[arrays.net_id[row]] == net[0]
+            assert arrays.refdes[arrays.refdes_id[row]] == node[0]
+            assert arrays.pins[arrays.pin_id[row]] == node[1]
+            row += 1
+    assert arrays.to_net_list() == netlist.net_list
+
+
+@pytest.mark.unit
+def test_arrays_vectorized_statistics(np, sample_netlist_v2_path):
+    """Test fanout and refdes pin count helpers."""
+    netlist = AllegroNetList(sample_netlist_v2_path)
+    arrays = netlist.net_list2arrays()
+
+    assert arrays.net_fanout().tolist() == [len(net[1]) for net in netlist.net_list]
+    counts = arrays.refdes_pin_count()
+    assert counts.sum() == len(arrays)
+    table = arrays.as_structured()
+    assert table.dtype.names == ('net_id', 'refdes_id', 'pin_id', 'pin_name_id')
+    assert (table['refdes_id'] == arrays.refdes_id).all()
+
+
+@pytest.mark.unit
+def test_npz_round_trip(np, sample_netlist_v3_path, tmp_path):
+    """Test that a Netlist loaded from .npz matches the parsed Netlist."""
+    netlist = AllegroNetList(sample_netlist_v3_path)
+    npz_file = tmp_path / 'netlist.npz'
+    netlist.net_list2npz(npz_file)
+
+    loaded = AllegroNetList.from_npz(npz_file)
+
+    assert loaded.net_list == netlist.net_list
+    assert loaded.version == netlist.version
+    assert loaded.fname == netlist.fname
+    assert loaded.net_name_index == netlist.net_name_index
+
+
+@pytest.mark.unit
+def test_npz_load_invalid_file(np, tmp_path):
+    """Test that loading an unrelated .npz file raises ValueError."""
+    npz_file = tmp_path / 'other.npz'
+    np.savez(npz_file, data=np.arange(3))
+    with pytest.raises(ValueError):
+        AllegroNetList.from_npz(npz_file)
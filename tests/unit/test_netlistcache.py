@@ -0,0 +1,98 @@
+"""
+Unit tests for the in-process Netlist cache and asyncio loading.
+"""
+
+import asyncio
+import os
+import shutil
+import threading
+
+import pytest
+from cadence_netlist_format.allegronetlist import AllegroNetList
+from cadence_netlist_format.netlistcache import NetListCache, netlist_cache
+
+
+@pytest.mark.unit
+def test_cache_coalesces_concurrent_loads(sample_netlist_v2_path, tmp_path):
+    """Test simultaneous requests for one file share one parse; changed file is parsed again."""
+    fname = tmp_path / 'pstxnet.dat'
+    shutil.copy(sample_netlist_v2_path, fname)
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def loader(path):
+        calls.append(path)
+        started.set()
+        release.wait(5)
+        return AllegroNetList(path)
+
+    cache = NetListCache(max_entries=1, loader=loader)
+
+    async def load_all():
+        first = asyncio.ensure_future(cache.aget(fname))
+        await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+        others = [asyncio.ensure_future(cache.aget(fname)) for _ in range(3)]
+        release.set()
+        return await asyncio.gather(first, *others)
+
+    results = asyncio.run(load_all())
+    assert calls == [fname] and (cache.misses, cache.hits) == (1, 3)
+    assert all(netlist is results[0] for netlist in results)
+    assert cache.get(fname) is results[0] and len(cache) == 1
+
+    st = os.stat(fname)
+    os.utime(fname, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    assert cache.get(fname) is not results[0] and len(calls) == 2 and len(cache) == 1
+
+    with pytest.raises(OSError):
+        cache.get(tmp_path / 'missing.dat')
+
+
+@pytest.mark.unit
+def test_cancelled_waiter_does_not_cancel_parse(sample_netlist_v2_path, tmp_path, monkeypatch):
+    """Test cancelling one task waiting for a parse does not cancel it for others; caller's file name kept."""
+    shutil.copy(sample_netlist_v2_path, tmp_path / 'pstxnet.dat')
+    monkeypatch.chdir(tmp_path)
+    started = threading.Event()
+    release = threading.Event()
+
+    def loader(path):
+        started.set()
+        release.wait(5)
+        return AllegroNetList(path)
+
+    cache = NetListCache(loader=loader)
+
+    async def cancel_first():
+        first = asyncio.ensure_future(cache.aget('pstxnet.dat'))
+        await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+        second = asyncio.ensure_future(cache.aget('pstxnet.dat'))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    netlist = asyncio.run(cancel_first())
+    assert netlist.fname == 'pstxnet.dat' and netlist.net_list_length() > 0
+    assert cache.get('pstxnet.dat') is netlist and cache.misses == 1
+
+
+@pytest.mark.unit
+def test_aload_many(sample_netlist_v1_path, sample_netlist_v2_path):
+    """Test aload_many() returns Netlists in order; filtered loads bypass the cache."""
+    netlist_cache.clear()
+    paths = [sample_netlist_v1_path, sample_netlist_v2_path, sample_netlist_v1_path]
+    netlists = asyncio.run(AllegroNetList.aload_many(paths, limit=2))
+    assert [n.fname for n in netlists] == [str(p) for p in paths]
+    assert netlists[0] is netlists[2]
+    assert netlists[1].net_list == AllegroNetList(sample_netlist_v2_path).net_list
+
+    filtered = asyncio.run(AllegroNetList.aload(sample_netlist_v1_path, net_filter=lambda name: False))
+    assert filtered is not netlists[0] and filtered.net_list_length() == 0
+    with pytest.raises(ValueError):
+        asyncio.run(AllegroNetList.aload_many(paths, limit=0))
+    netlist_cache.clear()
@@ -0,0 +1,108 @@
+"""
+Unit tests for SQLite export/import of Netlist data.
+"""
+
+import functools
+import sqlite3
+import pytest
+from cadence_netlist_format import netlistdb
+from cadence_netlist_format.allegronetlist import AllegroNetList
+
+
+@pytest.mark.unit
+def test_sqlite_round_trip(sample_netlist_v3_path, tmp_path):
+    """Test that a Netlist loaded from SQLite matches the parsed Netlist."""
+    netlist = AllegroNetList(sample_netlist_v3_path)
+    db_file = tmp_path / 'netlist.db'
+    netlist.net_list2sqlite(db_file)
+
+    loaded = AllegroNetList.from_sqlite(db_file)
+
+    assert loaded.net_list == netlist.net_list
+    assert loaded.version == netlist.version
+    assert loaded.date == netlist.date
+    assert loaded.time == netlist.time
+    assert loaded.fname == netlist.fname
+    assert loaded.pin_name_index == netlist.pin_name_index
+    assert loaded.net_name_index == netlist.net_name_index
+    assert loaded.all_data2string().split('\n')[5:] == netlist.all_data2string().split('\n')[5:]
+
+    # URI syntax characters in path
+    db_dir = tmp_path / 'rev #2 100%'
+    db_dir.mkdir()
+    netlist.net_list2sqlite(db_dir / 'netlist#1.db')
+    assert AllegroNetList.from_sqlite(db_dir / 'netlist#1.db').net_list == netlist.net_list
+    assert sorted(p.name for p in tmp_path.rglob('*')) == ['netlist#1.db', 'netlist.db', 'rev #2 100%']
+
+
+@pytest.mark.unit
+def test_sqlite_indexes_and_pin_net_view(sample_netlist_v3_path, tmp_path):
+    """Test that the database has indexes and the pin_net view answers lookups."""
+    netlist = AllegroNetList(sample_netlist_v3_path)
+    db_file = tmp_path / 'netlist.db'
+    netlist.net_list2sqlite(db_file)
+
+    con = sqlite3.connect(db_file)
+    try:
+        indexes = {row[0] for row in con.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        assert {'idx_pins_refdes', 'idx_pins_net', 'idx_pins_pin_name', 'idx_nets_name'} <= indexes
+
+        pin_count = con.execute('SELECT COUNT(*) FROM pins').fetchone()[0]
+        assert pin_count == sum(len(net[1]) for net in netlist.net_list)
+
+        refdes, pin = netlist.net_list[0][1][0][:2]
+        net = con.execute('SELECT net FROM pin_net WHERE refdes = ? AND pin = ?', (refdes, pin)).fetchone()[0]
+        assert net == netlist.get_net_name4refdes_pin(refdes, pin)
+    finally:
+        con.close()
+
+
+@pytest.mark.unit
+def test_sqlite_export_replaces_existing_file(sample_netlist_v3_path, tmp_path, monkeypatch):
+    """Test that exporting twice to the same file does not duplicate rows."""
+    netlist = AllegroNetList(sample_netlist_v3_path)
+    db_file = tmp_path / 'netlist.db'
+    netlist.net_list2sqlite(db_file)
+    netlist.net_list2sqlite(db_file)
+
+    loaded = AllegroNetList.from_sqlite(db_file)
+    assert loaded.net_list_length() == netlist.net_list_length()
+
+    # Failed write leaves the existing database unchanged
+    monkeypatch.setattr(netlistdb, '_INDEXES', 'CREATE INDEX broken ON no_such_table (x);')
+    with pytest.raises(IOError, match='Failed to write database file'):
+        netlist.net_list2sqlite(db_file)
+    assert AllegroNetList.from_sqlite(db_file).net_list_length() == netlist.net_list_length()
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['netlist.db']
+
+
+@pytest.mark.unit
+def test_from_sqlite_invalid_file(tmp_path, monkeypatch):
+    """Test that loading a non-database file raises ValueError."""
+    bad_file = tmp_path / 'bad.db'
+    bad_file.write_text('not a database')
+    with pytest.raises(ValueError):
+        AllegroNetList.from_sqlite(bad_file)
+
+    with pytest.raises(IOError):
+        AllegroNetList.from_sqlite(tmp_path / 'missing.db')
+
+    # Valid SQLite database without Netlist tables
+    other_db = tmp_path / 'other.db'
+    sqlite3.connect(other_db).close()
+    with pytest.raises(ValueError, match='not a Netlist database'):
+        AllegroNetList.from_sqlite(other_db)
+
+    # Locked database is an access error, not an invalid file
+    con = sqlite3.connect(other_db)
+    con.execute('CREATE TABLE info (key TEXT, value TEXT)')
+    con.commit()
+    con.execute('BEGIN EXCLUSIVE')
+    con.execute("INSERT INTO info VALUES ('schema_version', '1')")
+    try:
+        monkeypatch.setattr(netlistdb.sqlite3, 'connect',
+                            functools.partial(netlistdb.sqlite3.connect, timeout=0))
+        with pytest.raises(IOError, match='Cannot read database file'):
+            AllegroNetList.from_sqlite(other_db)
+    finally:
+        con.close()
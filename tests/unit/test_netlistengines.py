@@ -0,0 +1,124 @@
+"""
+Unit tests for parser engines: all engines must give the same Netlist.
+"""
+
+import glob
+import os
+import sys
+
+import pytest
+from cadence_netlist_format import netlistengines
+from cadence_netlist_format.allegronetlist import AllegroNetList
+from cadence_netlist_format.netlistengines import ENGINES, chunk_bounds, select_engine
+
+INPUTS = sorted(glob.glob(os.path.join(os.path.dirname(__file__), '..', 'data', 'inputs', '*.dat')))
+
+MALFORMED = """FILE_TYPE = EXPANDEDNETLIST;
+{ Using PSTWRITER 16.3.0 p002Apr-26-2016 at 14:52:09 }
+NET_NAME
+'A B'
+NODE_NAME\tR1 1
+NODE_NAME\tR2 1
+ c
+ '5':;
+NODE_NAME\tR3
+ c
+ '1':;
+NODE_NAMEX R9 3 extra
+ c
+ '\\x':;  \t
+NET_NAME
+NET_NAME
+'EMPTY_PIN'
+NODE_NAME R4 1
+ c
+
+NET_NAME
+NODE_NAME\tR5 2
+ c
+ 'X':;
+END.
+trailing
+NODE_NAME\tR6
+"""
+
+
+def parse_all_engines(fname, **kwargs):
+    """Returns {engine: (nets as lists, header, diagnostics)} for all registered engines"""
+    results = {}
+    for engine in ENGINES:
+        netlist = AllegroNetList(fname, engine=engine, **kwargs)
+        assert netlist.engine == engine
+        results[engine] = ([net.to_list() for net in netlist.net_list],
+                           (netlist.version, netlist.date, netlist.time), list(netlist.diagnostics))
+    return results
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('fname', INPUTS, ids=os.path.basename)
+def test_engines_conform(fname, monkeypatch):
+    """Test all engines give identical nets and header, with and without filters."""
+    # Small chunks: parallel engine splits even small files at many NET_NAME lines
+    monkeypatch.setattr(netlistengines, 'PARALLEL_CHUNK_SIZE', 300)
+    assert len(chunk_bounds(fname, os.path.getsize(fname), 300)) > 1
+    for kwargs in ({}, {'net_filter': ['A*', 'N*']}, {'refdes_filter': 'R*'}):
+        results = parse_all_engines(fname, **kwargs)
+        expected = results.pop('line')
+        assert expected[0]
+        for engine, result in results.items():
+            assert result == expected, f'{engine} engine differs (filters: {kwargs})'
+
+
+@pytest.mark.unit
+def test_engines_conform_on_malformed_input(tmp_path, monkeypatch):
+    """Test engines agree on malformed lines, close nodes, empty nets, CRLF, bad header and empty files."""
+    monkeypatch.setattr(netlistengines, 'PARALLEL_CHUNK_SIZE', 40)
+    bad_header = MALFORMED.replace('{ Using PSTWRITER 16.3.0 p002Apr-26-2016 at 14:52:09 }', '{ garbage }')
+    for name, text, newline in (('lf.dat', MALFORMED, '\n'), ('crlf.dat', MALFORMED, '\r\n'),
+                                ('header.dat', bad_header, '\n')):
+        fname = tmp_path / name
+        fname.write_text(text, newline=newline)
+        # Filters select errors: in 'A B' net, after END. (in 'trailing' net)
+        for kwargs in ({}, {'net_filter': ['E*', 'N*']}, {'net_filter': ['t*']}):
+            results = parse_all_engines(fname, **kwargs)
+            expected = results.pop('line')
+            assert all(result == expected for result in results.values()), (name, kwargs)
+        expected = parse_all_engines(fname)['line']
+        assert expected[0] == [['A B', [['R1', '1'], ['R2', '1', '5']]],
+                               ['EMPTY_PIN', [['R4', '1', '']]],
+                               ['NET_NAME', []],
+                               ['NODE_NAME\tR5 2', [['R5', '2', 'X']]]]
+    assert [(d.line, d.state) for d in expected[2]] == [(2, 'header'), (9, 'node'), (27, 'node')]
+
+    # Empty and header only files: no chunks to parse in worker processes
+    for name, text in (('empty.dat', ''), ('header_only.dat', ''.join(MALFORMED.splitlines(True)[:2]))):
+        fname = tmp_path / name
+        fname.write_text(text)
+        results = parse_all_engines(fname)
+        expected = results.pop('line')
+        assert expected[0] == []
+        assert all(result == expected for result in results.values()), name
+
+
+@pytest.mark.unit
+def test_engine_selection(sample_netlist_v3_path, tmp_path, monkeypatch):
+    """Test engine selection by file size/CPUs and --engine command line override."""
+    from cadence_netlist_format.commandlinearg import get_args
+    from cadence_netlist_format.commands import run_command
+
+    assert select_engine(1024, cpus=8) == 'line'
+    assert select_engine(netlistengines.BULK_MIN_SIZE, cpus=1) == 'bulk'
+    assert select_engine(netlistengines.PARALLEL_MIN_SIZE, cpus=1) == 'bulk'
+    assert select_engine(netlistengines.PARALLEL_MIN_SIZE, cpus=4) == 'parallel'
+    assert select_engine(netlistengines.PARALLEL_MIN_SIZE, cpus=4, memory_budget=1 << 30) == 'line'
+    assert AllegroNetList(sample_netlist_v3_path).engine == 'line'
+    with pytest.raises(ValueError, match='Unknown parser engine'):
+        AllegroNetList(sample_netlist_v3_path, engine='fast')
+
+    output = tmp_path / 'out.rpt'
+    reference = tmp_path / 'reference.rpt'
+    AllegroNetList(sample_netlist_v3_path).net_list2file(reference)
+    monkeypatch.setattr(sys, 'argv', ['cnl_format', 'format', sample_netlist_v3_path,
+                                      '-o', str(output), '--engine', 'bulk'])
+    assert run_command(get_args()) == 0
+    assert output.read_text().splitlines()[3:] == reference.read_text().splitlines()[3:]
@@ -0,0 +1,106 @@
+"""
+Unit tests for connectivity fingerprint and its sidecar files.
+"""
+
+import os
+import shutil
+import sys
+
+import pytest
+from cadence_netlist_format import netlistengines
+from cadence_netlist_format.allegronetlist import AllegroNetList
+from cadence_netlist_format.netlistengines import ENGINES
+from cadence_netlist_format.netlistwriters import write_outputs
+from cadence_netlist_format.netlistfingerprint import (FingerprintPlugin, load_fingerprint, read_fingerprint,
+                                                       sidecar_fname, write_fingerprint)
+
+NETS = [('GND', [('R1', '2', 'B'), ('C1', '1', 'A'), ('C1', '1', 'A')]),
+        ('CLK', [('U1', '3', 'CLK'), ('R1', '1', 'A')]),
+        ('NC', [])]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('engine', list(ENGINES))
+def test_fingerprint(engine, write_netlist, sample_netlist_v1_path, monkeypatch):
+    """Test that fingerprint ignores names, order and pin names, and changes with connections."""
+    monkeypatch.setattr(netlistengines, 'PARALLEL_CHUNK_SIZE', 300)
+    reference = AllegroNetList(write_netlist(NETS, 'ref.dat'), engine=engine).fingerprint()
+    assert (reference.nets, reference.pins) == (2, 4)
+
+    renamed = [('N2', [('R1', '1', 'X'), ('U1', '3', 'Y')]),
+               ('N1', [('C1', '1', 'Z'), ('R1', '2', 'Z')])]
+    assert AllegroNetList(write_netlist(renamed, 'renamed.dat'), engine=engine).fingerprint() == reference
+    moved = [('GND', [('R1', '2', 'B'), ('C1', '1', 'A')]),
+             ('CLK', [('U1', '4', 'CLK'), ('R1', '1', 'A')])]
+    assert AllegroNetList(write_netlist(moved, 'moved.dat'), engine=engine).fingerprint() != reference
+    swapped = [('GND', [('R1', '1', 'B'), ('C1', '1', 'A')]),
+               ('CLK', [('U1', '3', 'CLK'), ('R1', '2', 'A')])]
+    assert AllegroNetList(write_netlist(swapped, 'swapped.dat'), engine=engine).fingerprint() != reference
+
+    # Computed while parsing: same as computed from parsed nets
+    plugin = FingerprintPlugin()
+    netlist = AllegroNetList(sample_netlist_v1_path, engine=engine, plugins=[plugin])
+    assert netlist.fingerprint() == plugin.fingerprint
+    assert netlist.fingerprint() == AllegroNetList(sample_netlist_v1_path).fingerprint()
+    assert plugin.report() == f'Fingerprint: {plugin.fingerprint}'
+
+
+@pytest.mark.unit
+def test_fingerprint_sidecar(write_netlist, tmp_path, monkeypatch, capsys):
+    """Test sidecar files, and fingerprint, compare and format commands."""
+    from cadence_netlist_format.commandlinearg import get_args
+    from cadence_netlist_format.commands import run_command
+
+    first = write_netlist(NETS, 'first.dat')
+    second = write_netlist(NETS[::-1], 'second.dat')
+    fingerprint, source = load_fingerprint(first, save=True)
+    assert source == 'parsed'
+    sidecar = sidecar_fname(first)
+    assert sidecar == tmp_path / 'first.fingerprint.json'
+    assert read_fingerprint(sidecar, first) == fingerprint
+    assert load_fingerprint(first) == (fingerprint, 'sidecar')
+    assert load_fingerprint(sidecar) == (fingerprint, 'sidecar')
+
+    # Changed Netlist file: sidecar is out of date
+    st = os.stat(first)
+    os.utime(first, ns=(st.st_atime_ns, st.st_mtime_ns + 1))
+    assert read_fingerprint(sidecar, first) is None
+    assert read_fingerprint(tmp_path / 'missing.fingerprint.json') is None
+    (tmp_path / 'bad.fingerprint.json').write_text('{"algorithm": "sha256-sum-v1"}')
+    with pytest.raises(ValueError, match='Invalid fingerprint file'):
+        load_fingerprint(tmp_path / 'bad.fingerprint.json')
+    with pytest.raises(IOError, match='Failed to write fingerprint file'):
+        write_fingerprint(tmp_path / 'missing_dir' / 'x.json', fingerprint, first)
+
+    monkeypatch.setattr(sys, 'argv', ['cnl_format', 'compare', first, second, '--save'])
+    assert run_command(get_args()) == 0
+    assert (tmp_path / 'second.fingerprint.json').exists()
+    # Sidecar of other file with the same size and mtime
+    shutil.copy2(second, tmp_path / 'copy.dat')
+    shutil.copy(tmp_path / 'second.fingerprint.json', tmp_path / 'copy.fingerprint.json')
+    assert read_fingerprint(tmp_path / 'copy.fingerprint.json', tmp_path / 'copy.dat') is None
+    assert capsys.readouterr().out.endswith('Connectivity: equivalent\n')
+    other = write_netlist(NETS[:1], 'other.dat')
+    monkeypatch.setattr(sys, 'argv', ['cnl_format', 'compare', str(tmp_path / 'second.fingerprint.json'), other])
+    assert run_command(get_args()) == 2
+    assert capsys.readouterr().out.endswith('Connectivity: different\n')
+    monkeypatch.setattr(sys, 'argv', ['cnl_format', 'compare', str(tmp_path / 'missing.dat'), other])
+    assert run_command(get_args()) == 1
+    assert 'Connectivity' not in capsys.readouterr().out
+
+    monkeypatch.setattr(sys, 'argv', ['cnl_format', 'fingerprint', first, other])
+    assert run_command(get_args()) == 0
+    assert capsys.readouterr().out.splitlines()[0] == f'{fingerprint.hex} 2 4 {first}'
+
+    output = tmp_path / 'out.rpt'
+    monkeypatch.setattr(sys, 'argv', ['cnl_format', 'format', second, '-o', str(output),
+                                      '--format', 'rpt,fingerprint'])
+    assert run_command(get_args()) == 0
+    assert read_fingerprint(tmp_path / 'out.fingerprint.json', second) == fingerprint
+    # Fingerprint of partial Netlist is not saved as fingerprint of the file
+    monkeypatch.setattr(sys, 'argv', ['cnl_format', 'format', second, '-o', str(tmp_path / 'part.rpt'),
+                                      '--format', 'rpt,fingerprint', '--refdes', 'R*'])
+    assert run_command(get_args()) == 1
+    assert not (tmp_path / 'part.fingerprint.json').exists()
+    with pytest.raises(ValueError, match='partial Netlist'):
+        write_outputs(AllegroNetList(second, net_filter=['GND']), {'fingerprint': tmp_path / 'part.json'})
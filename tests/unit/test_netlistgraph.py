@@ -0,0 +1,63 @@
+"""
+Unit tests for connectivity graph (CSR adjacency, signal tracing).
+"""
+
+import pytest
+from cadence_netlist_format.allegronetlist import AllegroNetList
+from cadence_netlist_format.netlistgraph import ConnectivityGraph, refdes_prefix
+
+
+@pytest.mark.unit
+def test_refdes_prefix():
+    """Test refdes prefix extraction."""
+    assert refdes_prefix('R12') == 'R'
+    assert refdes_prefix('FB3') == 'FB'
+    assert refdes_prefix('DD68') == 'DD'
+
+
+@pytest.mark.unit
+def test_graph_csr_adjacency(series_netlist_path):
+    """Test CSR arrays of net -> components and component -> nets."""
+    series_netlist = AllegroNetList(series_netlist_path)
+    graph = series_netlist.connectivity_graph()
+
+    assert isinstance(graph, ConnectivityGraph)
+    assert len(graph.net_indptr) == series_netlist.net_list_length() + 1
+    assert len(graph.net_adj) == len(graph.comp_adj)
+    for net_id, net in enumerate(series_netlist.net_list):
+        assert sorted(graph.net_components(net_id)) == sorted({node[0] for node in net[1]})
+    gnd, = graph.net_ids['GND']
+    assert gnd in graph.component_nets('DD1')
+    assert graph.component_nets('X99') == []
+
+
+@pytest.mark.unit
+def test_graph_trace_through_pass_through_components(series_netlist_path):
+    """Test tracing from connector pin through R and FB to endpoints."""
+    series_netlist = AllegroNetList(series_netlist_path)
+    graph = series_netlist.connectivity_graph()
+
+    traced = [series_netlist.net_name(i) for i in graph.trace('J1', '3')]
+    assert traced == ['CLK_J', 'CLK_R', 'CLK_FB']
+    assert sorted(graph.endpoints('J1', '3')) == [('DD1', 'A4', 'CLK_R'), ('DD2', 'B7', 'CLK_FB')]
+    assert graph.shortest_path('J1', '3', 'DD2') == ['CLK_J', 'R1', 'CLK_R', 'FB1', 'CLK_FB', 'DD2']
+
+    # FB is not pass-through: trace stops at FB1
+    graph = series_netlist.connectivity_graph(pass_through=('R',))
+    assert graph.shortest_path('J1', '3', 'DD2') is None
+    assert graph.trace('J1', '99') == []
+
+
+@pytest.mark.unit
+def test_graph_trace_duplicated_net_names(write_netlist):
+    """Test nets with the same name are traced as one signal."""
+    netlist = AllegroNetList(write_netlist([
+        ('CLK', [('J1', '3', 'CLK'), ('DD1', 'A4', 'CLK')]),
+        ('CLK_R', [('R1', '2', '2'), ('DD2', 'B7', 'CLK')]),
+        ('CLK', [('R1', '1', '1'), ('DD3', 'C1', 'CLK')]),
+    ]))
+    graph = netlist.connectivity_graph()
+    assert graph.net_ids['CLK'] == [i for i, net in enumerate(netlist.net_list) if net.name == 'CLK']
+    assert sorted(netlist.net_name(i) for i in graph.trace('J1', '3')) == ['CLK', 'CLK', 'CLK_R']
+    assert sorted(endpoint[0] for endpoint in graph.endpoints('DD1', 'A4')) == ['DD2', 'DD3', 'J1']
+    assert graph.shortest_path('J1', '3', 'DD2') == ['CLK', 'R1', 'CLK_R', 'DD2']
@@ -0,0 +1,60 @@
+"""
+Unit tests for Netlist header probe.
+"""
+
+import pytest
+from cadence_netlist_format.allegronetlist import AllegroNetList
+from cadence_netlist_format.netlistheader import peek_header, scan_headers
+
+
+@pytest.mark.unit
+def test_peek_header_valid_file(sample_netlist_v3_path):
+    """Test header info and exact net count of a small file."""
+    header = peek_header(sample_netlist_v3_path)
+    netlist = AllegroNetList(sample_netlist_v3_path)
+
+    assert header.valid
+    assert header.file_type == 'EXPANDEDNETLIST'
+    assert (header.version, header.date, header.time) == (netlist.version, netlist.date, netlist.time)
+    assert header.net_count_exact
+    assert header.net_count == netlist.net_list_length()
+
+
+@pytest.mark.unit
+def test_peek_header_estimates_net_count(sample_netlist_v1_path):
+    """Test that the net count of a big file is estimated from a sample."""
+    header = peek_header(sample_netlist_v1_path, sample_size=16 * 1024)
+    actual = AllegroNetList(sample_netlist_v1_path).net_list_length()
+
+    assert not header.net_count_exact
+    assert abs(header.net_count - actual) < actual * 0.5
+
+    header = peek_header(sample_netlist_v1_path, sample_size=0)
+    assert header.valid and header.net_count == 0
+
+
+@pytest.mark.unit
+def test_peek_header_invalid_file(tmp_path):
+    """Test header problems of a file that is not a Netlist."""
+    bad_file = tmp_path / 'bad.dat'
+    bad_file.write_text('This is not a valid Cadence netlist file.\nJust some random text.\n')
+
+    header = peek_header(bad_file)
+    assert not header.valid
+    assert header.problems == ['missing FILE_TYPE header', 'missing PSTWRITER header line']
+    assert 'INVALID' in str(header)
+
+
+@pytest.mark.unit
+def test_scan_headers_directory_tree(sample_netlist_v3_path, tmp_path):
+    """Test recursive directory scan in parallel workers."""
+    sub_dir = tmp_path / 'board' / 'allegro'
+    sub_dir.mkdir(parents=True)
+    (sub_dir / 'pstxnet.dat').write_bytes(open(sample_netlist_v3_path, 'rb').read())
+    (tmp_path / 'empty.dat').write_text('')
+
+    headers = scan_headers([tmp_path, tmp_path / 'missing.dat'], max_workers=2)
+
+    assert [h.valid for h in headers] == [True, False, False]
+    assert headers[0].fname.endswith('pstxnet.dat')
+    assert 'cannot read file' in headers[2].problems[0]
@@ -0,0 +1,90 @@
+"""
+Unit tests for plugin hooks called while parsing.
+"""
+
+import sys
+from importlib.metadata import EntryPoint
+
+import pytest
+from cadence_netlist_format import netlistengines, netlistplugins
+from cadence_netlist_format.allegronetlist import AllegroNetList
+from cadence_netlist_format.netlistengines import ENGINES
+from cadence_netlist_format.netlistplugins import ENTRY_POINT_GROUP, NetListPlugin, load_plugin
+
+
+class RecordingPlugin(NetListPlugin):
+    """Records hook calls."""
+
+    def __init__(self):
+        self.events = []
+        self.nodes = 0
+
+    def on_header(self, netlist):
+        self.events.append(('header', netlist.version, len(netlist.net_list)))
+
+    def on_net(self, net):
+        self.events.append(('net', net.name, [node.pin_name for node in net.nodes]))
+
+    def on_node(self, net, node):
+        self.nodes += 1
+
+    def on_end(self, netlist):
+        self.events.append(('end', len(netlist.net_name_index)))
+
+
+class NetNames:
+    """Plugin without base class, only on_net."""
+
+    def __init__(self):
+        self.names = []
+
+    def on_net(self, net):
+        self.names.append(net.name)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('engine', list(ENGINES))
+def test_hooks_while_parsing(engine, sample_netlist_v1_path, monkeypatch):
+    """Test that every engine calls hooks in order with complete nets in file order."""
+    monkeypatch.setattr(netlistengines, 'PARALLEL_CHUNK_SIZE', 300)
+    reference = AllegroNetList(sample_netlist_v1_path)
+    recorder, names = RecordingPlugin(), NetNames()
+    netlist = AllegroNetList(sample_netlist_v1_path, engine=engine, plugins=[recorder, names])
+
+    assert recorder.events[0] == ('header', reference.version, 0)
+    assert recorder.events[-1] == ('end', len(reference.net_name_index))
+    nets = recorder.events[1:-1]
+    # File order: same nets as sorted net_list, names not sorted by parser
+    assert sorted(nets) == sorted(('net', net.name, [node.pin_name for node in net.nodes])
+                                  for net in reference.net_list)
+    assert names.names == [name for _, name, _ in nets]
+    assert recorder.nodes == sum(len(net.nodes) for net in reference.net_list)
+    assert netlist.plugins == [recorder, names]
+
+
+@pytest.mark.unit
+def test_plugin_entry_points(sample_netlist_v1_path, tmp_path, monkeypatch, capsys):
+    """Test plugins loaded from entry points and run from the command line."""
+    from cadence_netlist_format.commandlinearg import get_args
+    from cadence_netlist_format.commands import run_command
+
+    installed = [EntryPoint('check', 'cadence_netlist_format.netlistrules:RuleCheckPlugin', ENTRY_POINT_GROUP),
+                 EntryPoint('broken', 'no_such_module:Plugin', ENTRY_POINT_GROUP)]
+
+    def entry_points(group, name=None):
+        return [ep for ep in installed if ep.group == group and name in (None, ep.name)]
+
+    monkeypatch.setattr(netlistplugins, 'entry_points', entry_points)
+    assert netlistplugins.plugin_names() == ['rules', 'fingerprint', 'broken', 'check']
+    assert type(load_plugin('check')).__name__ == 'RuleCheckPlugin'
+    with pytest.raises(ValueError, match="Cannot load plugin 'broken'"):
+        load_plugin('broken')
+    with pytest.raises(ValueError, match="Unknown plugin 'missing'"):
+        load_plugin('missing')
+
+    base = ['cnl_format', 'format', str(sample_netlist_v1_path), '-o', str(tmp_path / 'out.rpt')]
+    monkeypatch.setattr(sys, 'argv', base + ['--plugin', 'check'])
+    assert run_command(get_args()) == 0
+    assert 'Rule check: ' in capsys.readouterr().out
+    monkeypatch.setattr(sys, 'argv', base + ['--plugin', 'missing'])
+    assert run_command(get_args()) == 1
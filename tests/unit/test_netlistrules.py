@@ -0,0 +1,67 @@
+"""
+Unit tests for connectivity rule checks.
+"""
+
+import json
+import sys
+
+import pytest
+from cadence_netlist_format.allegronetlist import AllegroNetList
+from cadence_netlist_format.netlistrules import default_rules
+
+
+@pytest.fixture
+def rules_netlist_path(write_netlist):
+    """Netlist with one violation of each rule."""
+    return write_netlist([
+        ('CLK', [('DD1', '1', 'CLK')] + [('DD2', str(i), 'CLK') for i in range(1, 5)]),
+        ('GND', [('DD1', '2', 'GND')] + [('C1', str(i), '1') for i in range(1, 5)]),
+        ('Reset', [('DD1', '3', 'RST'), ('J1', '1', '1')]),
+        ('RESET', [('DD2', '5', 'RST'), ('J1', '1', '1')]),
+        ('SPARE', [('J1', '2', '2')]),
+        ('SPARE', [('DD1', '4', 'IO')]),
+    ])
+
+
+@pytest.mark.unit
+def test_rule_violations(rules_netlist_path, tmp_path):
+    """Test that each rule reports its violation and the report gets the rule section."""
+    netlist = AllegroNetList(rules_netlist_path)
+    report = netlist.check_rules(default_rules(fanout_limit=4))
+    assert [tuple(v) for v in report.violations] == [
+        ('multi_net_pin', 'J1 1', 'on nets: RESET, Reset'),
+        ('duplicate_net', 'SPARE', '2 nets with this name'),
+        ('net_case', 'RESET', 'differs only in case from: Reset'),
+        ('unconnected_connector_pin', 'J1 2', 'only node of net SPARE'),
+        ('fanout', 'CLK', '5 nodes (limit 4)'),
+    ]
+    assert report.counts()['fanout'] == 1
+
+    check_file = tmp_path / 'check.json'
+    report.write_json(check_file)
+    data = json.loads(check_file.read_text())
+    assert data['counts']['multi_net_pin'] == 1
+    assert data['violations'][0] == {'rule': 'multi_net_pin', 'subject': 'J1 1', 'message': 'on nets: RESET, Reset'}
+
+    text = netlist.all_data2string(rule_report=report)
+    assert '| Rule check: 5 violations' in text
+    assert 'fanout: CLK: 5 nodes (limit 4)\n' in text
+    assert 'Rule check: 0 violations' in netlist.all_data2string(rule_report=netlist.check_rules([]))
+
+
+@pytest.mark.unit
+def test_check_command(rules_netlist_path, tmp_path, monkeypatch):
+    """Test that format --check writes JSON file and sets exit status on violations."""
+    from cadence_netlist_format.commandlinearg import get_args
+    from cadence_netlist_format.commands import run_command
+
+    output = tmp_path / 'out.rpt'
+    check_file = tmp_path / 'check.json'
+    base = ['cnl_format', 'format', str(rules_netlist_path), '-o', str(output)]
+    for options, status in (([], 0), (['--check-json', str(check_file)], 2),
+                            (['--check', '--fanout-limit', '5', '--net', 'SPARE', '--connector-prefixes', 'X'], 2),
+                            (['--check', '--net', 'CLK', '--fanout-limit', '5'], 0)):
+        monkeypatch.setattr(sys, 'argv', base + options)
+        assert run_command(get_args()) == status
+    assert json.loads(check_file.read_text())['counts']['duplicate_net'] == 1
+    assert 'Rule check: 0 violations' in output.read_text()
@@ -0,0 +1,75 @@
+"""
+Unit tests for output writers fed from one pass over nets.
+"""
+
+import csv
+import json
+import sys
+
+import pytest
+from cadence_netlist_format.allegronetlist import AllegroNetList
+from cadence_netlist_format.netlistwriters import output_fnames, write_outputs
+
+
+# Reports written at different times are compared
+pytestmark = pytest.mark.usefixtures('fixed_clock')
+
+
+@pytest.mark.unit
+def test_write_outputs(sample_netlist_v1_path, tmp_path):
+    """Test that all formats are written in one pass, report equal to net_list2file()."""
+    netlist = AllegroNetList(sample_netlist_v1_path)
+    rule_report = netlist.check_rules()
+    outputs = output_fnames(tmp_path / 'NetList.rpt', ['rpt', 'csv', 'json', 'refdes'])
+    assert outputs['csv'] == tmp_path / 'NetList.csv'
+    assert outputs['refdes'] == tmp_path / 'NetList_refdes.rpt'
+    # Small batches and queues: writers wait for each other
+    write_outputs(netlist, outputs, batch_size=2, queue_size=1, extended_nets=['R'], rule_report=rule_report)
+
+    assert outputs['rpt'].read_text() == netlist.all_data2string(['R'], rule_report)
+    with open(outputs['csv'], newline='') as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == ['net', 'refdes', 'pin', 'pin_name']
+    assert rows[1:] == [[net.name, node.refdes, node.pin, node.pin_name or '']
+                        for net in netlist.net_list for node in net.nodes]
+    data = json.loads(outputs['json'].read_text())
+    assert (data['version'], data['date'], data['time']) == (netlist.version, netlist.date, netlist.time)
+    assert [[net['name'], net['nodes']] for net in data['nets']] == [net.to_list() for net in netlist.net_list]
+    assert outputs['refdes'].read_text() == netlist.refdes_report2string()
+
+    # Empty Netlist: same report as all_data2string()
+    empty = AllegroNetList(sample_netlist_v1_path, net_filter='NO_SUCH_NET')
+    write_outputs(empty, {'rpt': tmp_path / 'empty.rpt'})
+    assert (tmp_path / 'empty.rpt').read_text() == empty.all_data2string()
+
+
+@pytest.mark.unit
+def test_write_outputs_errors(sample_netlist_v1_path, tmp_path, monkeypatch):
+    """Test that a failing writer does not block others and CLI writes selected formats."""
+    from cadence_netlist_format.commandlinearg import get_args
+    from cadence_netlist_format.commands import run_command
+
+    netlist = AllegroNetList(sample_netlist_v1_path)
+    outputs = {'rpt': tmp_path / 'missing_dir' / 'NetList.rpt', 'csv': tmp_path / 'NetList.csv'}
+    with pytest.raises(IOError, match='missing_dir'):
+        write_outputs(netlist, outputs, batch_size=1, queue_size=1)
+    assert (tmp_path / 'NetList.csv').read_text().count('\n') == sum(len(net.nodes) for net in netlist.net_list) + 1
+    with pytest.raises(ValueError, match="Unknown output format 'xml'"):
+        output_fnames('NetList.rpt', ['rpt', 'xml'])
+    with pytest.raises(ValueError, match="Formats 'rpt' and 'csv' have the same output file"):
+        output_fnames(tmp_path / 'out.csv', ['rpt', 'csv'])
+
+    output = tmp_path / 'out.rpt'
+    base = ['cnl_format', 'format', str(sample_netlist_v1_path), '-o', str(output)]
+    monkeypatch.setattr(sys, 'argv', base + ['--format', 'rpt,json'])
+    assert run_command(get_args()) == 0
+    assert output.read_text() == netlist.all_data2string()
+    assert json.loads((tmp_path / 'out.json').read_text())['netlist'] == str(sample_netlist_v1_path)
+    assert not (tmp_path / 'out.csv').exists()
+    monkeypatch.setattr(sys, 'argv', base + ['--format', 'xml'])
+    assert run_command(get_args()) == 1
+    # Same output file: refused before parsing, nothing written
+    json_output = tmp_path / 'same.json'
+    monkeypatch.setattr(sys, 'argv', base[:-1] + [str(json_output), '--format', 'rpt,json'])
+    assert run_command(get_args()) == 1
+    assert not json_output.exists()
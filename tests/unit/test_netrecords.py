@@ -0,0 +1,45 @@
+"""
+Unit tests for Net and Node records.
+"""
+
+import pytest
+from cadence_netlist_format.netrecords import Net, Node
+
+
+@pytest.mark.unit
+def test_records_list_view():
+    """Test Net/Node behave like the nested lists they replace."""
+    node = Node('DD1', 'A1', 'CLK')
+    assert (node[0], node[1], node[2], node[-1]) == ('DD1', 'A1', 'CLK', 'CLK')
+    assert node[:2] == ['DD1', 'A1'] and list(node) == ['DD1', 'A1', 'CLK']
+    assert len(node) == 3 and len(Node('R1', '1')) == 2
+    assert node == ['DD1', 'A1', 'CLK'] and ['DD1', 'A1', 'CLK'] == node
+    assert Node('R1', '1') == ('R1', '1') and Node('R1', '1') != ['R1', '1', '1']
+    assert sorted([Node('R2', '1'), Node('R1', '2')]) == [['R1', '2'], ['R2', '1']]
+    assert not hasattr(node, '__dict__')
+
+    net = Net('CLK', [node, Node('R1', '1', '1')])
+    name, nodes = net
+    assert name == 'CLK' and nodes is net.nodes and net[1] is net.nodes
+    assert net == ['CLK', [['DD1', 'A1', 'CLK'], ['R1', '1', '1']]]
+    assert net.to_list() == ['CLK', [['DD1', 'A1', 'CLK'], ['R1', '1', '1']]]
+    net[1] = []
+    assert net.nodes == [] and net != ['CLK', [node]]
+    net[-2], net[-1] = 'CLK2', [node]
+    assert net == ['CLK2', [node]] and net[-1] is net.nodes
+    with pytest.raises(IndexError):
+        net[2] = 'x'
+    with pytest.raises(IndexError):
+        net[-3] = 'x'
+
+    # Nodes are mutable as lists were
+    node = Node('R1', '1')
+    node.append('A')
+    node[0], node[-2] = 'R2', '2'
+    assert node == ['R2', '2', 'A']
+    node[2] = 'B'
+    assert node.pin_name == 'B'
+    with pytest.raises(ValueError):
+        node.append('C')
+    with pytest.raises(IndexError):
+        Node('R1', '1')[2] = 'A'
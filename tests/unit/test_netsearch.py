@@ -0,0 +1,61 @@
+"""
+Unit tests for trigram net name search index.
+"""
+
+import re
+import fnmatch
+import pytest
+from cadence_netlist_format.allegronetlist import AllegroNetList
+from cadence_netlist_format.netsearch import NetNameIndex, _regex_literals
+
+
+@pytest.fixture
+def netlist_v1(sample_netlist_v1_path):
+    return AllegroNetList(sample_netlist_v1_path)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('query', ['XXX', 'DCLK', '_0_', 'ab', 'NO_SUCH_NET', ''])
+def test_substring_search_matches_scan(netlist_v1, query):
+    """Test trigram substring search against a full scan."""
+    names = [net[0] for net in netlist_v1.net_list]
+    expected = [i for i, name in enumerate(names) if query in name]
+    assert netlist_v1.search_nets(query) == expected
+
+    expected = [i for i, name in enumerate(names) if query.casefold() in name.casefold()]
+    assert netlist_v1.search_nets(query, ignore_case=True) == expected
+
+
+@pytest.mark.unit
+def test_glob_and_regex_search_match_scan(netlist_v1):
+    """Test glob and regex search against a full scan."""
+    names = [net[0] for net in netlist_v1.net_list]
+    for pattern in ['*XXX1?', 'A*_0_*', '[AB]*CLK*', '*']:
+        expected = [i for i, name in enumerate(names) if fnmatch.fnmatchcase(name, pattern)]
+        assert netlist_v1.search_nets(pattern, 'glob') == expected
+    for pattern in [r'^B_D.*XXX\d+$', r'CLKO?L', r'(DA|DD)\d', r'X{3}']:
+        regex = re.compile(pattern)
+        expected = [i for i, name in enumerate(names) if regex.search(name)]
+        assert netlist_v1.search_nets(pattern, 'regex') == expected
+    with pytest.raises(ValueError):
+        netlist_v1.search_nets('X', 'fuzzy')
+
+
+@pytest.mark.unit
+def test_regex_literal_extraction():
+    """Test literals required by regular expressions (prefilter)."""
+    assert _regex_literals(r'^DDR_DQ\d+$') == ['DDR_DQ']
+    assert _regex_literals(r'CLKO?L') == ['CLK', 'L']
+    assert _regex_literals(r'A\.B[0-9]CD') == ['A.B', 'CD']
+    assert _regex_literals(r'(A|B)CDE') == []
+    # Quantifier bounds, escape sequences and ']' first in a set are not literals
+    assert _regex_literals(r'DQ{2,3}XYZ') == ['D', 'XYZ']
+    assert _regex_literals(r'A\x31BCD') == []
+    assert _regex_literals(r'A[^]BCD]EFG') == ['A', 'EFG']
+    index = NetNameIndex(['DQQX', 'A1B', 'A1BCD', 'AxEFG'])
+    for pattern in [r'DQ{2,3}X', r'A\x31B', r'A\x31BCD', r'A[^]BCD]EFG']:
+        assert index.regex(pattern) == [i for i, name in enumerate(index.names) if re.search(pattern, name)]
+    assert index.regex(r'DQ{2,3}X') == [0]
+    assert index.glob('A[!]BCD]EFG') == [3]
+    index = NetNameIndex(['DDR_DQ0', 'DDR_DQS', 'GND'])
+    assert index.substring('DQ') == [0, 1]
@@ -0,0 +1,82 @@
+"""
+Unit tests for parse diagnostics and error budget.
+"""
+
+import sys
+
+import pytest
+from cadence_netlist_format.allegronetlist import AllegroNetList
+from cadence_netlist_format.netlistengines import ENGINES
+from cadence_netlist_format.parsediagnostics import ParseErrorLimit
+
+CORRUPTED = """FILE_TYPE = EXPANDEDNETLIST;
+{ Using PSTWRITER 16.3.0 p002Apr-26-2016 at 14:52:09 }
+NET_NAME
+'CLK'
+NODE_NAME\tDD1 1
+ c
+ 'CLK':;
+NODE_NAME\tBROKEN
+ c
+ '2':;
+NODE_NAME\tR1 1
+ c
+ '1':;
+NET_NAME
+'DATA'
+NODE_NAME\tDD1 2
+ c
+ 'D0':;
+NET_NAME
+'RESET'
+NODE_NAME
+END.
+"""
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('engine', list(ENGINES))
+def test_diagnostics_and_resync(engine, tmp_path, caplog):
+    """Test malformed lines are reported with line/offset/state and parsing resumes at next net."""
+    fname = tmp_path / 'corrupted.dat'
+    fname.write_bytes(CORRUPTED.encode())
+    netlist = AllegroNetList(fname, engine=engine, max_errors=None)
+
+    assert [net.to_list() for net in netlist.net_list] == [
+        ['CLK', [['DD1', '1', 'CLK']]],      # R1 after the malformed line is skipped
+        ['DATA', [['DD1', '2', 'D0']]],
+        ['RESET', []]]
+    data = fname.read_bytes()
+    assert [(d.line, d.state, d.snippet) for d in netlist.diagnostics] == [
+        (8, 'node', 'NODE_NAME\tBROKEN'), (21, 'node', 'NODE_NAME')]
+    for d in netlist.diagnostics:
+        assert data[d.offset:].startswith(d.snippet.encode())
+    assert len(netlist.diagnostics) == 2
+    summary = netlist.diagnostics.summary()
+    assert summary.startswith('2 parsing errors') and 'line 8, byte 127 [node]' in summary
+    warnings = [r for r in caplog.records if r.levelname == 'WARNING' and 'parsing error' in r.getMessage()]
+    assert len(warnings) == 1
+
+    # Errors in nets rejected by the net filter are not counted by any engine
+    filtered = AllegroNetList(fname, engine=engine, net_filter=['DATA', 'RESET'], max_errors=1)
+    assert [(d.line, d.state) for d in filtered.diagnostics] == [(21, 'node')]
+    assert AllegroNetList(fname, engine=engine, net_filter=['DATA'], max_errors=0).diagnostics.count == 0
+
+
+@pytest.mark.unit
+def test_error_budget(tmp_path, monkeypatch):
+    """Test parsing fails when malformed lines exceed --max-errors budget."""
+    from cadence_netlist_format.commandlinearg import get_args
+    from cadence_netlist_format.commands import run_command
+
+    fname = tmp_path / 'corrupted.dat'
+    fname.write_text(CORRUPTED)
+    with pytest.raises(ParseErrorLimit, match='2 errors, first at line 8'):
+        AllegroNetList(fname, max_errors=1)
+    assert AllegroNetList(fname).diagnostics.count == 2
+
+    output = tmp_path / 'out.rpt'
+    for max_errors, status in (('1', 1), ('-1', 0), ('2', 0)):
+        monkeypatch.setattr(sys, 'argv', ['cnl_format', 'format', str(fname), '-o', str(output),
+                                          '--max-errors', max_errors])
+        assert run_command(get_args()) == status
@@ -0,0 +1,72 @@
+"""
+Unit tests for shared memory Netlist.
+"""
+
+import os
+import pickle
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+from cadence_netlist_format.allegronetlist import AllegroNetList
+from cadence_netlist_format.sharednetlist import SharedNetList
+
+
+def _worker_lookup(shared, refdes, pin):
+    """Pool worker: look up net of pin in attached shared Netlist."""
+    try:
+        return shared.get_net_name4refdes_pin(refdes, pin), shared.net_list_length()
+    finally:
+        shared.close()
+
+
+@pytest.mark.unit
+def test_shared_netlist_lookups(sample_netlist_v2_path):
+    """Test shared Netlist answers the same lookups as AllegroNetList."""
+    netlist = AllegroNetList(sample_netlist_v2_path)
+    with netlist.to_shared_memory() as shared:
+        attached = SharedNetList.attach(shared.name)
+        assert not attached.owner
+        assert attached.net_list_length() == netlist.net_list_length()
+        assert (attached.date, attached.time, attached.version) == (netlist.date, netlist.time, netlist.version)
+        for i in range(netlist.net_list_length()):
+            assert attached.net_name(i) == netlist.net_name(i)
+            assert attached.node_list(i) == netlist.node_list(i)
+        for (refdes, pin), net_name in netlist.net_name_index.items():
+            assert attached.get_net_name4refdes_pin(refdes, pin) == net_name
+            assert attached.get_refdes_pin_name(refdes, pin) == netlist.get_refdes_pin_name(refdes, pin)
+        assert attached.get_net_name4refdes_pin('NO_SUCH', '1') is None
+        assert attached.net_name(netlist.net_list_length()) is None
+        attached.close()
+
+
+@pytest.mark.unit
+def test_shared_netlist_in_worker_process(small_netlist_path):
+    """Test worker process attaches to shared Netlist passed by reference."""
+    netlist = AllegroNetList(small_netlist_path)
+    with netlist.to_shared_memory() as shared:
+        assert len(pickle.dumps(shared)) < 200  # Block name, not Netlist data
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            result = executor.submit(_worker_lookup, shared, 'DD1', '2').result()
+        assert result == ('DATA', 2)
+
+
+@pytest.mark.unit
+def test_shared_netlist_outlives_attached_process(small_netlist_path):
+    """Test block is not unlinked when an independent process that attached to it exits."""
+    code = ('import sys\n'
+            'from cadence_netlist_format.sharednetlist import SharedNetList\n'
+            'shared = SharedNetList.attach(sys.argv[1])\n'
+            'print(shared.net_list_length())\n'
+            'shared.close()\n')
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    with AllegroNetList(small_netlist_path).to_shared_memory() as shared:
+        for _ in range(2):
+            result = subprocess.run([sys.executable, '-c', code, shared.name], env=env,
+                                    capture_output=True, text=True, check=True)
+            assert result.stdout == '2\n'
+            assert 'leaked' not in result.stderr
+        attached = SharedNetList.attach(shared.name)
+        assert attached.net_list_length() == 2
+        attached.close()
@@ -0,0 +1,63 @@
+"""
+Unit tests for multi-board system Netlist merge.
+"""
+
+import pytest
+from cadence_netlist_format.systemnetlist import SystemNetList
+
+
+@pytest.mark.unit
+def test_system_merge_with_pin_map(board_files):
+    """Test cross-board net tracing through a connector pin mapping."""
+    system = SystemNetList.load(board_files, max_workers=1)
+    system.connect('main', 'J1', 'module', 'P1', {'1': 'A', '2': 'B', '3': 'C'})
+
+    assert system.trace('main', 'I2C_SCL') == [('main', 'I2C_SCL'), ('module', 'SCL')]
+    assert system.trace('module', 'LOCAL') == [('module', 'LOCAL')]
+    assert sorted(map(sorted, system.system_nets())) == [
+        [('main', 'GND'), ('module', 'GND_M')],
+        [('main', 'I2C_SCL'), ('module', 'SCL')],
+        [('main', 'I2C_SDA'), ('module', 'SDA')],
+    ]
+    assert 'main:GND module:GND_M' in system.system_nets2string()
+
+
+@pytest.mark.unit
+def test_system_load_in_worker_processes(board_files):
+    """Test parallel loading gives the same boards as serial loading."""
+    serial = SystemNetList.load(board_files, max_workers=1)
+    parallel = SystemNetList.load(board_files, max_workers=2)
+    for board in board_files:
+        assert parallel.boards[board].net_list == serial.boards[board].net_list
+
+
+@pytest.mark.unit
+def test_system_connect_errors(board_files):
+    """Test errors for unknown boards, connectors and nets."""
+    system = SystemNetList.load(board_files, max_workers=1)
+    with pytest.raises(KeyError):
+        system.connect('main', 'J1', 'backplane', 'P1')
+    with pytest.raises(KeyError):
+        system.connect('main', 'J9', 'module', 'P1')
+    system.connect('main', 'J1', 'module', 'P1')  # identity pin map: no pins match
+    assert system.system_nets() == []
+    with pytest.raises(KeyError):
+        system.trace('main', 'NO_SUCH_NET')
+
+
+@pytest.mark.unit
+def test_system_duplicate_net_names(board_files, write_netlist):
+    """Test all nets sharing a duplicated net name are joined and traced as one board net."""
+    board_files['module'] = write_netlist([
+        ('GND', [('P1', 'A', 'A'), ('DD9', '8', 'GND')]),
+        ('LOCAL', [('DD9', '3', 'IO')]),
+        ('GND', [('P1', 'C', 'C'), ('DD9', '9', 'GND')]),
+        ('LOCAL', [('DD9', '4', 'IO')]),
+    ], name='module_dup.dat')
+    system = SystemNetList.load(board_files, max_workers=1)
+    system.connect('main', 'J1', 'module', 'P1', {'1': 'A', '2': 'B', '3': 'C'})
+
+    assert system.trace('main', 'I2C_SCL') == [('main', 'I2C_SCL'), ('main', 'GND'), ('module', 'GND')]
+    assert system.trace('module', 'GND') == [('module', 'GND'), ('main', 'GND'), ('main', 'I2C_SCL')]
+    assert system.trace('module', 'LOCAL') == [('module', 'LOCAL')]
+    assert system.system_nets2string() == 'main:GND main:I2C_SCL module:GND\n'